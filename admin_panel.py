@@ -5,7 +5,30 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Import logging and metrics retrieval functions
-from utils.logger import get_user_activity_logs, get_system_events_logs, get_metrics_summary
+from utils.metrics_rollups import window_total
+from utils.logger import (
+    get_metrics_rollups, query_user_activity_logs, query_system_events_logs,
+    get_user_activity_filter_options, get_system_event_levels
+)
+
+# Rows shown per page in the log tables; filtering and paging happen in the log store
+LOG_PAGE_SIZE = 200
+
+def _paged_log_query(query_fn, key, **filters):
+    """
+    Fetches one page of a log table and renders its page selector, with a single query: the page
+    selected on the previous run is fetched, and the total returned with it sizes the selector.
+    Returns (entries, total).
+    """
+    page = int(st.session_state.get(key, 1))
+    entries, total = query_fn(limit=LOG_PAGE_SIZE, offset=(page - 1) * LOG_PAGE_SIZE, **filters)
+    num_pages = max(1, -(-total // LOG_PAGE_SIZE))
+    if page > num_pages: # The filters changed and the selected page no longer exists
+        page = num_pages
+        entries, total = query_fn(limit=LOG_PAGE_SIZE, offset=(page - 1) * LOG_PAGE_SIZE, **filters)
+    st.session_state[key] = page
+    st.number_input(f"Page (of {num_pages}):", min_value=1, max_value=num_pages, step=1, key=key)
+    return entries, total
 
 def admin_panel_page():
     st.markdown('<div class="dashboard-header">🔒 Admin Panel</div>', unsafe_allow_html=True)
@@ -23,14 +46,17 @@ def admin_panel_page():
     dark_mode = st.session_state.get('dark_mode_main', False) # Get dark mode status from session state
 
     st.subheader("Overview")
-    metrics = get_metrics_summary()
+    # Pre-aggregated daily / per-user totals; the page never walks the raw metrics history
+    rollups = get_metrics_rollups()
+    daily_totals = rollups["daily"]
+    per_user_totals = rollups["per_user"]
     today_str = datetime.now().strftime("%Y-%m-%d")
     
     # Safely get metrics, providing default 0 if key/date is missing
-    total_screened_today = metrics.get('total_resumes_screened', {}).get(today_str, 0)
-    total_emails_sent_today = metrics.get('total_emails_sent', {}).get(today_str, 0)
+    total_screened_today = daily_totals.get('total_resumes_screened', {}).get(today_str, 0)
+    total_emails_sent_today = daily_totals.get('total_emails_sent', {}).get(today_str, 0)
     # You'd need to log 'total_jds_managed' in manage_jds.py to get this
-    total_jds_managed_today = metrics.get('total_jds_managed', {}).get(today_str, 0) 
+    total_jds_managed_today = daily_totals.get('total_jds_managed', {}).get(today_str, 0) 
 
 
     col1, col2, col3 = st.columns(3)
@@ -38,23 +64,25 @@ def admin_panel_page():
     col2.metric("Emails Sent Today", total_emails_sent_today)
     col3.metric("JDs Managed Today", total_jds_managed_today) # Display the count
 
+    col4, col5, col6, col7 = st.columns(4)
+    col4.metric("Resumes Screened (7 days)", window_total(rollups, 'total_resumes_screened', 7))
+    col5.metric("Resumes Screened (30 days)", window_total(rollups, 'total_resumes_screened', 30))
+    col6.metric("Emails Sent (7 days)", window_total(rollups, 'total_emails_sent', 7))
+    col7.metric("Emails Sent (30 days)", window_total(rollups, 'total_emails_sent', 30))
+
     st.markdown("---")
 
     # --- User Activity Log Section ---
     st.subheader("👤 User Activity Log")
-    user_logs = get_user_activity_logs()
-    df_user_logs = pd.DataFrame(user_logs)
-
-    if not df_user_logs.empty:
-        df_user_logs['timestamp'] = pd.to_datetime(df_user_logs['timestamp'])
-        df_user_logs = df_user_logs.sort_values(by='timestamp', ascending=False)
+    users, actions = get_user_activity_filter_options()
 
+    if users or actions:
         # Filters for User Activity Log
         col_ua1, col_ua2, col_ua3 = st.columns([1, 1, 2])
         with col_ua1:
-            selected_user = st.selectbox("Filter by User:", ["All"] + sorted(df_user_logs['user_email'].unique().tolist()), key="user_log_filter")
+            selected_user = st.selectbox("Filter by User:", ["All"] + users, key="user_log_filter")
         with col_ua2:
-            selected_action = st.selectbox("Filter by Action:", ["All"] + sorted(df_user_logs['action'].unique().tolist()), key="action_log_filter")
+            selected_action = st.selectbox("Filter by Action:", ["All"] + actions, key="action_log_filter")
         with col_ua3:
             # Default date range for the last 7 days
             default_start_date = datetime.now().date() - timedelta(days=7)
@@ -67,17 +95,18 @@ def admin_panel_page():
             else: # If only one date is selected, treat it as both start and end
                 start_date = end_date = date_range[0]
 
-
-        filtered_df_user = df_user_logs[
-            (df_user_logs['timestamp'].dt.date >= start_date) &
-            (df_user_logs['timestamp'].dt.date <= end_date)
-        ]
-
-        if selected_user != "All":
-            filtered_df_user = filtered_df_user[filtered_df_user['user_email'] == selected_user]
-        if selected_action != "All":
-            filtered_df_user = filtered_df_user[filtered_df_user['action'] == selected_action]
-        
+        query_filters = dict(
+            start_date=start_date,
+            end_date=end_date,
+            user_email=selected_user if selected_user != "All" else None,
+            action=selected_action if selected_action != "All" else None
+        )
+        user_logs, total_user_logs = _paged_log_query(query_user_activity_logs, "user_log_page", **query_filters)
+
+        filtered_df_user = pd.DataFrame(user_logs)
+        if not filtered_df_user.empty:
+            filtered_df_user['timestamp'] = pd.to_datetime(filtered_df_user['timestamp'])
+        st.caption(f"{total_user_logs} matching entries")
         # Display DataFrame, optionally adjust text color for dark mode
         st.dataframe(filtered_df_user, use_container_width=True, height=300)
     else:
@@ -87,17 +116,13 @@ def admin_panel_page():
 
     # --- System Events Log Section ---
     st.subheader("💻 System Events Log")
-    system_logs = get_system_events_logs()
-    df_system_logs = pd.DataFrame(system_logs)
-
-    if not df_system_logs.empty:
-        df_system_logs['timestamp'] = pd.to_datetime(df_system_logs['timestamp'])
-        df_system_logs = df_system_logs.sort_values(by='timestamp', ascending=False)
+    levels = get_system_event_levels()
 
+    if levels:
         # Filters for System Events Log
         col_se1, col_se2 = st.columns([1, 3])
         with col_se1:
-            selected_level = st.selectbox("Filter by Level:", ["All"] + sorted(df_system_logs['level'].unique().tolist()), key="level_log_filter")
+            selected_level = st.selectbox("Filter by Level:", ["All"] + levels, key="level_log_filter")
         with col_se2:
             default_start_date_sys = datetime.now().date() - timedelta(days=7)
             default_end_date_sys = datetime.now().date()
@@ -108,15 +133,17 @@ def admin_panel_page():
             else:
                 start_date_sys = end_date_sys = date_range_sys[0]
 
-
-        filtered_df_system = df_system_logs[
-            (df_system_logs['timestamp'].dt.date >= start_date_sys) &
-            (df_system_logs['timestamp'].dt.date <= end_date_sys)
-        ]
-
-        if selected_level != "All":
-            filtered_df_system = filtered_df_system[filtered_df_system['level'] == selected_level]
-
+        query_filters_sys = dict(
+            start_date=start_date_sys,
+            end_date=end_date_sys,
+            level=selected_level if selected_level != "All" else None
+        )
+        system_logs, total_system_logs = _paged_log_query(query_system_events_logs, "sys_log_page", **query_filters_sys)
+
+        filtered_df_system = pd.DataFrame(system_logs)
+        if not filtered_df_system.empty:
+            filtered_df_system['timestamp'] = pd.to_datetime(filtered_df_system['timestamp'])
+        st.caption(f"{total_system_logs} matching entries")
         st.dataframe(filtered_df_system, use_container_width=True, height=300)
     else:
         st.info("No system event logs yet.")
@@ -128,7 +155,7 @@ def admin_panel_page():
 
     # Screening Throughput
     st.markdown("##### Resumes Screened Over Time")
-    screening_data = metrics.get('total_resumes_screened', {})
+    screening_data = daily_totals.get('total_resumes_screened', {})
     if screening_data:
         # Convert dictionary to DataFrame
         df_screening = pd.DataFrame(list(screening_data.items()), columns=['Date', 'Count'])
@@ -153,11 +180,8 @@ def admin_panel_page():
 
     # User Productivity - Resumes Screened
     st.markdown("##### User Productivity: Resumes Screened")
-    user_screening_data = metrics.get('user_resumes_screened', {})
-    user_resumes_screened_summary = {}
-    # Aggregate counts across all dates for each user
-    for user_email, dates_data in user_screening_data.items():
-        user_resumes_screened_summary[user_email] = sum(dates_data.values())
+    # Already aggregated across all dates for each user
+    user_resumes_screened_summary = per_user_totals.get('user_resumes_screened', {})
 
     if user_resumes_screened_summary:
         df_productivity_screened = pd.DataFrame(list(user_resumes_screened_summary.items()), columns=['User', 'Resumes Screened'])
@@ -168,10 +192,7 @@ def admin_panel_page():
 
     # User Productivity - Emails Sent
     st.markdown("##### User Productivity: Emails Sent")
-    user_emails_sent_data = metrics.get('user_emails_sent', {})
-    user_emails_sent_summary = {}
-    for user_email, dates_data in user_emails_sent_data.items():
-        user_emails_sent_summary[user_email] = sum(dates_data.values())
+    user_emails_sent_summary = per_user_totals.get('user_emails_sent', {})
     
     if user_emails_sent_summary:
         df_emails_sent = pd.DataFrame(list(user_emails_sent_summary.items()), columns=['User', 'Emails Sent'])
@@ -183,10 +204,7 @@ def admin_panel_page():
     # Add more charts/tables for other metrics as you implement them
     # Example: JDs Managed by User
     st.markdown("##### User Productivity: JDs Managed")
-    user_jds_managed_data = metrics.get('user_jds_managed', {}) # Make sure you log this in manage_jds.py
-    user_jds_managed_summary = {}
-    for user_email, dates_data in user_jds_managed_data.items():
-        user_jds_managed_summary[user_email] = sum(dates_data.values())
+    user_jds_managed_summary = per_user_totals.get('user_jds_managed', {}) # Make sure you log this in manage_jds.py
     
     if user_jds_managed_summary:
         df_jds_managed = pd.DataFrame(list(user_jds_managed_summary.items()), columns=['User', 'JDs Managed'])
@@ -1,5 +1,15 @@
 import os
 
+from utils.jd_artifacts import build_jd_artifact
+from utils.encoders import load_encoder
+
+# Encoder for precomputing JD embeddings; artifacts are still built (without embeddings) if it can't load
+try:
+    encoder = load_encoder()
+except Exception as e:
+    print(f"Could not load encoder, JD artifacts will be built without embeddings: {e}")
+    encoder = None
+
 # Define a much more diverse list of job roles
 job_roles = [
     "Software Engineer",
@@ -445,6 +455,7 @@ Benefits:
 
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(jd_content.strip())
+    build_jd_artifact(file_path, encoder)
     print(f"Generated: {file_path}")
 
 print("\nAll job descriptions generated successfully in the 'data' folder.")
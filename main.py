@@ -37,6 +37,14 @@ try:
 except ImportError:
     notes_page = None # Set to None if import fails, handle later
 
+# Start loading the screening models in a background thread so neither app start-up
+# nor the first screening has to wait for the torch import and model load.
+try:
+    from utils.scoring import start_model_warmup
+    start_model_warmup()
+except ImportError:
+    start_model_warmup = None
+
 
 # --- Page Config ---
 st.set_page_config(page_title="ScreenerPro – AI Hiring Dashboard", layout="wide", page_icon="🧠")
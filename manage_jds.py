@@ -4,6 +4,8 @@ import traceback # For detailed error logging
 
 # Import logging functions
 from utils.logger import log_user_action, update_metrics_summary, log_system_event
+from utils.jd_artifacts import get_jd_artifact, delete_jd_artifact
+from utils.scoring import get_encoder
 
 # --- JD Folder ---
 jd_folder = "data"
@@ -66,6 +68,9 @@ def manage_jds_page(): # Encapsulate logic in a function for better modularity
                 jd_path = os.path.join(jd_folder, uploaded_jd.name)
                 with open(jd_path, "wb") as f:
                     f.write(uploaded_jd.read())
+                # Precompute the JD's embedding and skill profile so screening doesn't redo it per run
+                with st.spinner("Indexing job description..."):
+                    get_jd_artifact(jd_path, get_encoder())
                 st.success(f"✅ Uploaded: `{uploaded_jd.name}`")
                 log_user_action(user_email, "JD_UPLOAD_SUCCESS", {"file_name": uploaded_jd.name, "file_size": uploaded_jd.size})
                 update_metrics_summary("total_jds_uploaded", 1)
@@ -98,6 +103,7 @@ def manage_jds_page(): # Encapsulate logic in a function for better modularity
                     if st.button(f"🗑️ Delete `{selected_jd}`", key="delete_jd_button"):
                         try:
                             os.remove(os.path.join(jd_folder, selected_jd))
+                            delete_jd_artifact(os.path.join(jd_folder, selected_jd))
                             st.success(f"🗑️ Deleted: `{selected_jd}`")
                             log_user_action(user_email, "JD_DELETE_SUCCESS", {"file_name": selected_jd})
                             update_metrics_summary("total_jds_deleted", 1)
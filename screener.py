@@ -1,28 +1,32 @@
+import sys
+
+# Headless batch mode: `python -m screener batch ...` runs the CLI without ever importing streamlit.
+# run_module swaps __main__ over to utils.batch_screening, so PDF extraction worker processes
+# started with the "spawn" method re-import that module instead of this Streamlit page.
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "batch":
+    import runpy
+    sys.argv = [sys.argv[0]] + sys.argv[2:]
+    runpy.run_module("utils.batch_screening", run_name="__main__", alter_sys=True)
+    sys.exit(0)
+
 print("DEBUG: screener.py is being loaded.") # Diagnostic print to confirm file is being run/imported
 
 import streamlit as st
-import pdfplumber
 import pandas as pd
-import re
 import os
-import sklearn
-import joblib
-import numpy as np
-from datetime import datetime
 import matplotlib.pyplot as plt
-from wordcloud import WordCloud
-from sentence_transformers import SentenceTransformer
-import nltk
-import collections
-from sklearn.metrics.pairwise import cosine_similarity
 import urllib.parse # For encoding mailto links
 import traceback # Added for detailed error logging
-from io import BytesIO # Added: Required for reading PDF in-memory
-from sklearn.feature_extraction.text import TfidfVectorizer # Added: Required for TF-IDF calculation
-
 
 # Import logging functions
 from utils.logger import log_user_action, update_metrics_summary, log_system_event
+# Scoring logic lives in streamlit-free modules so headless batch screening can reuse it
+from utils.scoring import (
+    ML_MODEL_PATH, TFIDF_MODE_BATCH, TFIDF_MODE_PAIRWISE,
+    get_models, start_model_warmup, clean_text_for_wordcloud
+)
+from utils.screening_pipeline import screen_resumes
+from utils.jd_artifacts import get_jd_artifact
 # Assuming utils.config exists, if not, remove this line or create the file
 # from utils.config import load_config
 
@@ -39,292 +43,6 @@ from utils.logger import log_user_action, update_metrics_summary, log_system_eve
 #     st.error("🚨 Google API Key not found in Streamlit Secrets. Please add it to your .streamlit/secrets.toml file.")
 #     st.stop() # Stop the app if API key is missing
 
-# Download NLTK stopwords data if not already downloaded
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-    log_system_event("INFO", "NLTK_DOWNLOAD", {"resource": "stopwords"}) # Log NLTK download
-
-# --- Load Embedding + ML Model ---
-@st.cache_resource
-def load_ml_model():
-    try:
-        model = SentenceTransformer("all-MiniLM-L6-v2")
-        # Ensure ml_screening_model.pkl exists before loading
-        if not os.path.exists("ml_screening_model.pkl"):
-            # Provide a more user-friendly message if the model file is missing
-            st.error("Model file 'ml_screening_model.pkl' not found. Please ensure it's in the same directory as this script.")
-            raise FileNotFoundError("ml_screening_model.pkl not found.")
-        ml_model = joblib.load("ml_screening_model.pkl")
-        log_system_event("INFO", "ML_MODEL_LOADED", {"model_name": "all-MiniLM-L6-v2", "ml_model_file": "ml_screening_model.pkl"})
-        return model, ml_model
-    except Exception as e:
-        st.error(f"❌ Error loading models: {e}. Please ensure 'ml_screening_model.pkl' is in the same directory.")
-        log_system_event("ERROR", "ML_MODEL_LOAD_FAILED", {"error": str(e), "traceback": traceback.format_exc()})
-        return None, None
-
-model, ml_model = load_ml_model()
-
-# --- Stop Words List (Using NLTK) ---
-NLTK_STOP_WORDS = set(nltk.corpus.stopwords.words('english'))
-CUSTOM_STOP_WORDS = set([
-    "work", "experience", "years", "year", "months", "month", "day", "days", "project", "projects",
-    "team", "teams", "developed", "managed", "led", "created", "implemented", "designed",
-    "responsible", "proficient", "knowledge", "ability", "strong", "proven", "demonstrated",
-    "solution", "solutions", "system", "systems", "platform", "platforms", "framework", "frameworks",
-    "database", "databases", "server", "servers", "cloud", "computing", "machine", "learning",
-    "artificial", "intelligence", "api", "apis", "rest", "graphql", "agile", "scrum", "kanban",
-    "devops", "ci", "cd", "testing", "qa",
-    "security", "network", "networking", "virtualization",
-    "containerization", "docker", "kubernetes", "git", "github", "gitlab", "bitbucket", "jira",
-    "confluence", "slack", "microsoft", "google", "amazon", "azure", "oracle", "sap", "crm", "erp",
-    "salesforce", "servicenow", "tableau", "powerbi", "qlikview", "excel", "word", "powerpoint",
-    "outlook", "visio", "html", "css", "js", "web", "data", "science", "analytics", "engineer",
-    "software", "developer", "analyst", "business", "management", "reporting", "analysis", "tools",
-    "python", "java", "javascript", "c++", "c#", "php", "ruby", "go", "swift", "kotlin", "r",
-    "sql", "nosql", "linux", "unix", "windows", "macos", "ios", "android", "mobile", "desktop",
-    "application", "applications", "frontend", "backend", "fullstack", "ui", "ux", "design",
-    "architecture", "architect", "engineering", "scientist", "specialist", "consultant",
-    "associate", "senior", "junior", "lead", "principal", "director", "manager", "head", "chief",
-    "officer", "president", "vice", "executive", "ceo", "cto", "cfo", "coo", "hr", "human",
-    "resources", "recruitment", "talent", "acquisition", "onboarding", "training", "development",
-    "performance", "compensation", "benefits", "payroll", "compliance", "legal", "finance",
-    "accounting", "auditing", "tax", "budgeting", "forecasting", "investments", "marketing",
-    "sales", "customer", "service", "support", "operations", "supply", "chain", "logistics",
-    "procurement", "manufacturing", "production", "quality", "assurance", "control", "research",
-    "innovation", "product", "program", "portfolio", "governance", "risk", "communication",
-    "presentation", "negotiation", "problem", "solving", "critical", "thinking", "analytical",
-    "creativity", "adaptability", "flexibility", "teamwork", "collaboration", "interpersonal",
-    "organizational", "time", "multitasking", "detail", "oriented", "independent", "proactive",
-    "self", "starter", "results", "driven", "client", "facing", "stakeholder", "engagement",
-    "vendor", "budget", "cost", "reduction", "process", "improvement", "standardization",
-    "optimization", "automation", "digital", "transformation", "change", "methodologies",
-    "industry", "regulations", "regulatory", "documentation", "technical", "writing",
-    "dashboards", "visualizations", "workshops", "feedback", "reviews", "appraisals",
-    "offboarding", "employee", "relations", "diversity", "inclusion", "equity", "belonging",
-    "corporate", "social", "responsibility", "csr", "sustainability", "environmental", "esg",
-    "ethics", "integrity", "professionalism", "confidentiality", "discretion", "accuracy",
-    "precision", "efficiency", "effectiveness", "scalability", "robustness", "reliability",
-    "vulnerability", "assessment", "penetration", "incident", "response", "disaster",
-    "recovery", "continuity", "bcp", "drp", "gdpr", "hipaa", "soc2", "iso", "nist", "pci",
-    "dss", "ccpa", "privacy", "protection", "grc", "cybersecurity", "information", "infosec",
-    "threat", "intelligence", "soc", "event", "siem", "identity", "access", "iam", "privileged",
-    "pam", "multi", "factor", "authentication", "mfa", "single", "sign", "on", "sso",
-    "encryption", "decryption", "firewall", "ids", "ips", "vpn", "endpoint", "antivirus",
-    "malware", "detection", "forensics", "handling", "assessments", "policies", "procedures",
-    "guidelines", "mitre", "att&ck", "modeling", "secure", "lifecycle", "sdlc", "awareness",
-    "phishing", "vishing", "smishing", "ransomware", "spyware", "adware", "rootkits",
-    "botnets", "trojans", "viruses", "worms", "zero", "day", "exploits", "patches", "patching",
-    "updates", "upgrades", "configuration", "ticketing", "crm", "erp", "scm", "hcm", "financial",
-    "accounting", "bi", "warehousing", "etl", "extract", "transform", "load", "lineage",
-    "master", "mdm", "lakes", "marts", "big", "hadoop", "spark", "kafka", "flink", "mongodb",
-    "cassandra", "redis", "elasticsearch", "relational", "mysql", "postgresql", "db2",
-    "teradata", "snowflake", "redshift", "synapse", "bigquery", "aurora", "dynamodb",
-    "documentdb", "cosmosdb", "graph", "neo4j", "graphdb", "timeseries", "influxdb",
-    "timescaledb", "columnar", "vertica", "clickhouse", "vector", "pinecone", "weaviate",
-    "milvus", "qdrant", "chroma", "faiss", "annoy", "hnswlib", "scikit", "learn", "tensorflow",
-    "pytorch", "keras", "xgboost", "lightgbm", "catboost", "statsmodels", "numpy", "pandas",
-    "matplotlib", "seaborn", "plotly", "bokeh", "dash", "flask", "django", "fastapi", "spring",
-    "boot", ".net", "core", "node.js", "express.js", "react", "angular", "vue.js", "svelte",
-    "jquery", "bootstrap", "tailwind", "sass", "less", "webpack", "babel", "npm", "yarn",
-    "ansible", "terraform", "jenkins", "gitlab", "github", "actions", "codebuild", "codepipeline",
-    "codedeploy", "build", "deploy", "run", "lambda", "functions", "serverless", "microservices",
-    "gateway", "mesh", "istio", "linkerd", "grpc", "restful", "soap", "message", "queues",
-    "rabbitmq", "activemq", "bus", "sqs", "sns", "pubsub", "version", "control", "svn",
-    "mercurial", "trello", "asana", "monday.com", "smartsheet", "project", "primavera",
-    "zendesk", "freshdesk", "itil", "cobit", "prince2", "pmp", "master", "owner", "lean",
-    "six", "sigma", "black", "belt", "green", "yellow", "qms", "9001", "27001", "14001",
-    "ohsas", "18001", "sa", "8000", "cmii", "cmi", "cism", "cissp", "ceh", "comptia",
-    "security+", "network+", "a+", "linux+", "ccna", "ccnp", "ccie", "certified", "solutions",
-    "architect", "developer", "sysops", "administrator", "specialty", "professional", "azure",
-    "az-900", "az-104", "az-204", "az-303", "az-304", "az-400", "az-500", "az-700", "az-800",
-    "az-801", "dp-900", "dp-100", "dp-203", "ai-900", "ai-102", "da-100", "pl-900", "pl-100",
-    "pl-200", "pl-300", "pl-400", "pl-500", "ms-900", "ms-100", "ms-101", "ms-203", "ms-500",
-    "ms-700", "ms-720", "ms-740", "ms-600", "sc-900", "sc-200", "sc-300", "sc-400", "md-100",
-    "md-101", "mb-200", "mb-210", "mb-220", "mb-230", "mb-240", "mb-260", "mb-300", "mb-310",
-    "mb-320", "mb-330", "mb-340", "mb-400", "mb-500", "mb-600", "mb-700", "mb-800", "mb-910",
-    "mb-920", "gcp-ace", "gcp-pca", "gcp-pde", "gcp-pse", "gcp-pml", "gcp-psa", "gcp-pcd",
-    "gcp-pcn", "gcp-psd", "gcp-pda", "gcp-pci", "gcp-pws", "gcp-pwa", "gcp-pme", "gcp-pms",
-    "gcp-pmd", "gcp-pma", "gcp-pmc", "gcp-pmg", "cisco", "juniper", "red", "hat", "rhcsa",
-    "rhce", "vmware", "vcpa", "vcpd", "vcpi", "vcpe", "vcpx", "citrix", "cc-v", "cc-p",
-    "cc-e", "cc-m", "cc-s", "cc-x", "palo", "alto", "pcnsa", "pcnse", "fortinet", "fcsa",
-    "fcsp", "fcc", "fcnsp", "fct", "fcp", "fcs", "fce", "fcn", "fcnp", "fcnse"
-])
-STOP_WORDS = NLTK_STOP_WORDS.union(CUSTOM_STOP_WORDS)
-
-# --- MASTER SKILLS LIST ---
-# Paste your comprehensive list of skills here.
-# These skills will be used to filter words for the word cloud and
-# to identify 'Matched Keywords' and 'Missing Skills'.
-# Keep this set empty if you want the system to use its default stop word filtering.
-MASTER_SKILLS = set([
-        # Product & Project Management
-    "Product Strategy", "Roadmap Development", "Agile Methodologies", "Scrum", "Kanban", "Jira", "Trello",
-    "Feature Prioritization", "OKRs", "KPIs", "Stakeholder Management", "A/B Testing", "User Stories", "Epics",
-    "Product Lifecycle", "Sprint Planning", "Project Charter", "Gantt Charts", "MVP", "Backlog Grooming",
-    "Risk Management", "Change Management", "Program Management", "Portfolio Management", "PMP", "CSM",
-
-    # Software Development & Engineering
-    "Python", "Java", "JavaScript", "C++", "C#", "Go", "Ruby", "PHP", "Swift", "Kotlin", "TypeScript",
-    "HTML5", "CSS3", "React", "Angular", "Vue.js", "Node.js", "Django", "Flask", "Spring Boot", "Express.js",
-    "Git", "GitHub", "GitLab", "Bitbucket", "REST APIs", "GraphQL", "Microservices", "System Design",
-    "Unit Testing", "Integration Testing", "End-to-End Testing", "Test Automation", "CI/CD", "Docker", "Kubernetes",
-    "Serverless", "AWS Lambda", "Azure Functions", "Google Cloud Functions", "WebSockets", "Kafka", "RabbitMQ",
-    "Redis", "SQL", "NoSQL", "PostgreSQL", "MySQL", "MongoDB", "Cassandra", "Elasticsearch", "Neo4j",
-    "Data Structures", "Algorithms", "Object-Oriented Programming", "Functional Programming", "Bash Scripting",
-    "Shell Scripting", "DevOps", "DevSecOps", "SRE", "CloudFormation", "Terraform", "Ansible", "Puppet", "Chef",
-    "Jenkins", "CircleCI", "GitHub Actions", "Azure DevOps", "Jira", "Confluence", "Swagger", "OpenAPI",
-
-    # Data Science & AI/ML
-    "Machine Learning", "Deep Learning", "Natural Language Processing", "Computer Vision", "Reinforcement Learning",
-    "Scikit-learn", "TensorFlow", "PyTorch", "Keras", "XGBoost", "LightGBM", "Data Cleaning", "Feature Engineering",
-    "Model Evaluation", "Statistical Modeling", "Time Series Analysis", "Predictive Modeling", "Clustering",
-    "Classification", "Regression", "Neural Networks", "Convolutional Networks", "Recurrent Networks",
-    "Transformers", "LLMs", "Prompt Engineering", "Generative AI", "MLOps", "Data Munging", "A/B Testing",
-    "Experiment Design", "Hypothesis Testing", "Bayesian Statistics", "Causal Inference", "Graph Neural Networks",
-
-    # Data Analytics & BI
-    "SQL", "Python (Pandas, NumPy)", "R", "Excel (Advanced)", "Tableau", "Power BI", "Looker", "Qlik Sense",
-    "Google Data Studio", "Dax", "M Query", "ETL", "ELT", "Data Warehousing", "Data Lake", "Data Modeling",
-    "Business Intelligence", "Data Visualization", "Dashboarding", "Report Generation", "Google Analytics",
-    "BigQuery", "Snowflake", "Redshift", "Data Governance", "Data Quality", "Statistical Analysis",
-    "Requirements Gathering", "Data Storytelling",
-
-    # Cloud & Infrastructure
-    "AWS", "Azure", "Google Cloud Platform", "GCP", "Cloud Architecture", "Hybrid Cloud", "Multi-Cloud",
-    "Virtualization", "VMware", "Hyper-V", "Linux Administration", "Windows Server", "Networking", "TCP/IP",
-    "DNS", "VPN", "Firewalls", "Load Balancing", "CDN", "Monitoring", "Logging", "Alerting", "Prometheus",
-    "Grafana", "Splunk", "ELK Stack", "Cloud Security", "IAM", "VPC", "Storage (S3, Blob, GCS)", "Databases (RDS, Azure SQL)",
-    "Container Orchestration", "Infrastructure as Code", "IaC",
-
-    # UI/UX & Design
-    "Figma", "Adobe XD", "Sketch", "Photoshop", "Illustrator", "InDesign", "User Research", "Usability Testing",
-    "Wireframing", "Prototyping", "UI Design", "UX Design", "Interaction Design", "Information Architecture",
-    "Design Systems", "Accessibility", "Responsive Design", "User Flows", "Journey Mapping", "Design Thinking",
-    "Visual Design", "Motion Graphics",
-
-    # Marketing & Sales
-    "Digital Marketing", "SEO", "SEM", "Content Marketing", "Email Marketing", "Social Media Marketing",
-    "Google Ads", "Facebook Ads", "LinkedIn Ads", "Marketing Automation", "HubSpot", "Salesforce Marketing Cloud",
-    "CRM", "Lead Generation", "Sales Strategy", "Negotiation", "Account Management", "Market Research",
-    "Campaign Management", "Conversion Rate Optimization", "CRO", "Brand Management", "Public Relations",
-    "Copywriting", "Content Creation", "Analytics (Google Analytics, SEMrush, Ahrefs)",
-
-    # Finance & Accounting
-    "Financial Modeling", "Valuation", "Financial Reporting", "GAAP", "IFRS", "Budgeting", "Forecasting",
-    "Variance Analysis", "Auditing", "Taxation", "Accounts Payable", "Accounts Receivable", "Payroll",
-    "QuickBooks", "SAP FICO", "Oracle Financials", "Cost Accounting", "Management Accounting", "Treasury Management",
-    "Investment Analysis", "Risk Analysis", "Compliance (SOX, AML)",
-
-    # Human Resources (HR)
-    "Talent Acquisition", "Recruitment", "Onboarding", "Employee Relations", "HRIS (Workday, SuccessFactors)",
-    "Compensation & Benefits", "Performance Management", "Workforce Planning", "HR Policies", "Labor Law",
-    "Training & Development", "Diversity & Inclusion", "Conflict Resolution", "Employee Engagement",
-
-    # Customer Service & Support
-    "Customer Relationship Management", "CRM", "Zendesk", "ServiceNow", "Intercom", "Live Chat", "Ticketing Systems",
-    "Issue Resolution", "Technical Support", "Customer Success", "Client Retention", "Communication Skills",
-
-    # General Business & Soft Skills (often paired with technical skills)
-    "Strategic Planning", "Business Development", "Vendor Management", "Process Improvement", "Operations Management",
-    "Project Coordination", "Public Speaking", "Presentation Skills", "Cross-functional Collaboration",
-    "Problem Solving", "Critical Thinking", "Analytical Skills", "Adaptability", "Time Management",
-    "Organizational Skills", "Attention to Detail", "Leadership", "Mentorship", "Team Leadership",
-    "Decision Making", "Negotiation", "Client Management", "Stakeholder Communication", "Active Listening",
-    "Creativity", "Innovation", "Research", "Data Analysis", "Report Writing", "Documentation",
-    "Microsoft Office Suite", "Google Workspace", "Slack", "Zoom", "Confluence", "SharePoint",
-    "Cybersecurity", "Information Security", "Risk Assessment", "Compliance", "GDPR", "HIPAA", "ISO 27001",
-    "Penetration Testing", "Vulnerability Management", "Incident Response", "Security Audits", "Forensics",
-    "Threat Intelligence", "SIEM", "Firewall Management", "Endpoint Security", "Identity and Access Management",
-    "IAM", "Cryptography", "Network Security", "Application Security", "Cloud Security",
-
-    # Specific Certifications/Tools often treated as skills
-    "PMP", "CSM", "AWS Certified", "Azure Certified", "GCP Certified", "CCNA", "CISSP", "CISM", "CompTIA Security+",
-    "ITIL", "Lean Six Sigma", "CFA", "CPA", "SHRM-CP", "PHR", "CEH", "OSCP", "Splunk", "ServiceNow", "Salesforce",
-    "Workday", "SAP", "Oracle", "Microsoft Dynamics", "NetSuite", "Adobe Creative Suite", "Canva", "Mailchimp",
-    "Hootsuite", "Buffer", "SEMrush", "Ahrefs", "Moz", "Screaming Frog", "JMeter", "Postman", "SoapUI",
-    "Git", "SVN", "Perforce", "Confluence", "Jira", "Asana", "Trello", "Monday.com", "Miro", "Lucidchart",
-    "Visio", "MS Project", "Primavera", "AutoCAD", "SolidWorks", "MATLAB", "LabVIEW", "Simulink", "ANSYS",
-    "CATIA", "NX", "Revit", "ArcGIS", "QGIS", "OpenCV", "NLTK", "SpaCy", "Gensim", "Hugging Face Transformers",
-    "Docker Compose", "Helm", "Ansible Tower", "SaltStack", "Chef InSpec", "Terraform Cloud", "Vault",
-    "Consul", "Nomad", "Prometheus", "Grafana", "Alertmanager", "Loki", "Tempo", "Jaeger", "Zipkin",
-    "Fluentd", "Logstash", "Kibana", "Grafana Loki", "Datadog", "New Relic", "AppDynamics", "Dynatrace",
-    "Nagios", "Zabbix", "Icinga", "PRTG", "SolarWinds", "Wireshark", "Nmap", "Metasploit", "Burp Suite",
-    "OWASP ZAP", "Nessus", "Qualys", "Rapid7", "Tenable", "CrowdStrike", "SentinelOne", "Palo Alto Networks",
-    "Fortinet", "Cisco Umbrella", "Okta", "Auth0", "Keycloak", "Ping Identity", "Active Directory",
-    "LDAP", "OAuth", "JWT", "OpenID Connect", "SAML", "MFA", "SSO", "PKI", "TLS/SSL", "VPN", "IDS/IPS",
-    "DLP", "CASB", "SOAR", "XDR", "EDR", "MDR", "GRC", "GDPR Compliance", "HIPAA Compliance", "PCI DSS Compliance",
-    "ISO 27001 Compliance", "NIST Framework", "COBIT", "ITIL Framework", "Scrum Master", "Product Owner",
-    "Agile Coach", "Release Management", "Change Control", "Configuration Management", "Asset Management",
-    "Service Desk", "Incident Management", "Problem Management", "Change Management", "Release Management",
-    "Service Level Agreements", "SLAs", "Operational Level Agreements", "OLAs", "Underpinning Contracts", "UCs",
-    "Knowledge Management", "Continual Service Improvement", "CSI", "Service Catalog", "Service Portfolio",
-    "Relationship Management", "Supplier Management", "Financial Management for IT Services",
-    "Demand Management", "Capacity Management", "Availability Management", "Information Security Management",
-    "Supplier Relationship Management", "Contract Management", "Procurement Management", "Quality Management",
-    "Test Management", "Defect Management", "Requirements Management", "Scope Management", "Time Management",
-    "Cost Management", "Quality Management", "Resource Management", "Communications Management",
-    "Risk Management", "Procurement Management", "Stakeholder Management", "Integration Management",
-    "Project Charter", "Project Plan", "Work Breakdown Structure", "WBS", "Gantt Chart", "Critical Path Method",
-    "CPM", "Earned Value Management", "EVM", "PERT", "CPM", "Crashing", "Fast Tracking", "Resource Leveling",
-    "Resource Smoothing", "Agile Planning", "Scrum Planning", "Kanban Planning", "Sprint Backlog",
-    "Product Backlog", "User Story Mapping", "Relative Sizing", "Planning Poker", "Velocity", "Burndown Chart",
-    "Burnup Chart", "Cumulative Flow Diagram", "CFD", "Value Stream Mapping", "VSM", "Lean Principles",
-    "Six Sigma", "Kaizen", "Kanban", "Total Quality Management", "TQM", "Statistical Process Control", "SPC",
-    "Control Charts", "Pareto Analysis", "Fishbone Diagram", "5 Whys", "FMEA", "Root Cause Analysis", "RCA",
-    "Corrective Actions", "Preventive Actions", "CAPA", "Non-conformance Management", "Audit Management",
-    "Document Control", "Record Keeping", "Training Management", "Calibration Management", "Supplier Quality Management",
-    "Customer Satisfaction Measurement", "Net Promoter Score", "NPS", "Customer Effort Score", "CES",
-    "Customer Satisfaction Score", "CSAT", "Voice of Customer", "VOC", "Complaint Handling", "Warranty Management",
-    "Returns Management", "Service Contracts", "Service Agreements", "Maintenance Management", "Field Service Management",
-    "Asset Management", "Enterprise Asset Management", "EAM", "Computerized Maintenance Management System", "CMMS",
-    "Geographic Information Systems", "GIS", "GPS", "Remote Sensing", "Image Processing", "CAD", "CAM", "CAE",
-    "FEA", "CFD", "PLM", "PDM", "ERP", "CRM", "SCM", "HRIS", "BI", "Analytics", "Data Science", "Machine Learning",
-    "Deep Learning", "NLP", "Computer Vision", "AI", "Robotics", "Automation", "IoT", "Blockchain", "Cybersecurity",
-    "Cloud Computing", "Big Data", "Data Warehousing", "ETL", "Data Modeling", "Data Governance", "Data Quality",
-    "Data Migration", "Data Integration", "Data Virtualization", "Data Lakehouse", "Data Mesh", "Data Fabric",
-    "Data Catalog", "Data Lineage", "Metadata Management", "Master Data Management", "MDM",
-    "Customer Data Platform", "CDP", "Digital Twin", "Augmented Reality", "AR", "Virtual Reality", "VR",
-    "Mixed Reality", "MR", "Extended Reality", "XR", "Game Development", "Unity", "Unreal Engine", "C# (Unity)",
-    "C++ (Unreal Engine)", "Game Design", "Level Design", "Character Design", "Environment Design",
-    "Animation (Game)", "Rigging", "Texturing", "Shading", "Lighting", "Rendering", "Game Physics",
-    "Game AI", "Multiplayer Networking", "Game Monetization", "Game Analytics", "Playtesting",
-    "Game Publishing", "Streaming (Gaming)", "Community Management (Gaming)",
-    "Game Art", "Game Audio", "Sound Design (Game)", "Music Composition (Game)", "Voice Acting (Game)",
-    "Narrative Design", "Storytelling (Game)", "Dialogue Writing", "World Building", "Lore Creation",
-    "Game Scripting", "Modding", "Game Engine Development", "Graphics Programming", "Physics Programming",
-    "AI Programming (Game)", "Network Programming (Game)", "Tools Programming (Game)", "UI Programming (Game)",
-    "Shader Development", "VFX (Game)", "Technical Art", "Technical Animation", "Technical Design",
-    "Build Engineering (Game)", "Release Engineering (Game)", "Live Operations (Game)", "Game Balancing",
-    "Economy Design (Game)", "Progression Systems (Game)", "Retention Strategies (Game)", "Monetization Strategies (Game)",
-    "User Acquisition (Game)", "Marketing (Game)", "PR (Game)", "Community Management (Game)",
-    "Customer Support (Game)", "Localization (Game)", "Quality Assurance (Game)", "Game Testing",
-    "Compliance (Game)", "Legal (Game)", "Finance (Game)", "HR (Game)", "Business Development (Game)",
-    "Partnerships (Game)", "Licensing (Game)", "Brand Management (Game)", "IP Management (Game)",
-    "Esports Event Management", "Esports Team Management", "Esports Coaching", "Esports Broadcasting",
-    "Esports Sponsorship", "Esports Marketing", "Esports Analytics", "Esports Operations",
-    "Esports Content Creation", "Esports Journalism", "Esports Law", "Esports Finance", "Esports HR",
-    "Esports Business Development", "Esports Partnerships", "Esports Licensing", "Esports Brand Management",
-    "Esports IP Management", "Esports Event Planning", "Esports Production", "Esports Broadcasting",
-    "Esports Commentating", "Esports Analysis", "Esports Coaching", "Esports Training", "Esports Recruitment",
-    "Esports Scouting", "Esports Player Management", "Esports Team Management", "Esports Organization Management",
-    "Esports League Management", "Esports Tournament Management", "Esports Venue Management Software",
-    "Esports Sponsorship Management Software", "Esports Marketing Automation Software",
-    "Esports Content Management Systems", "Esports Social Media Management Tools",
-    "Esports PR Tools", "Esports Brand Monitoring Tools", "Esports Community Management Software",
-    "Esports Fan Engagement Platforms", "Esports Merchandise Management Software",
-    "Esports Ticketing Platforms", "Esports Hospitality Management Software",
-    "Esports Logistics Management Software", "Esports Security Management Software",
-    "Esports Legal Management Software", "Esports Finance Management Software",
-    "Esports HR Management Software", "Esports Business Operations Software",
-    "Esports Data Analytics Software", "Esports Performance Analysis Software",
-    "Esports Coaching Software", "Esports Training Platforms", "Esports Scouting Tools",
-    "Esports Player Databases", "Esports Team Databases", "Esports Organization Databases",
-    "Esports League Databases"
-])
-STOP_WORDS = NLTK_STOP_WORDS.union(CUSTOM_STOP_WORDS)
-
 # --- Page Styling ---
 st.markdown("""
 <style>
@@ -360,73 +78,6 @@ h2 {
 """, unsafe_allow_html=True)
 
 # --- Helper Functions ---
-@st.cache_data(show_spinner=False)
-def extract_text_from_pdf(pdf_file):
-    """Extracts text from a PDF file using pdfplumber."""
-    try:
-        with pdfplumber.open(pdf_file) as pdf:
-            text = ''.join(page.extract_text() or '' for page in pdf.pages)
-        return text
-    except Exception as e:
-        log_system_event("ERROR", "PDF_EXTRACTION_FAILED", {"file": pdf_file.name, "error": str(e), "traceback": traceback.format_exc()})
-        return None
-
-def extract_years_of_experience(text):
-    """
-    Extracts years of experience from text.
-    Looks for patterns like 'X years experience', 'X+ years', 'experience of X years'.
-    Returns the maximum number of years found.
-    """
-    text = text.lower()
-    total_months = 0
-    job_date_ranges = re.findall(
-        r'(\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4})\s*(?:to|–|-)\s*(present|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4})',
-        text
-    )
-
-    for start, end in job_date_ranges:
-        try:
-            start_date = datetime.strptime(start.strip(), '%b %Y')
-        except ValueError:
-            try:
-                start_date = datetime.strptime(start.strip(), '%B %Y')
-                # If month is full name, try with full name
-            except ValueError:
-                continue
-
-        if end.strip() == 'present':
-            end_date = datetime.now()
-        else:
-            try:
-                end_date = datetime.strptime(end.strip(), '%b %Y')
-            except ValueError:
-                try:
-                    end_date = datetime.strptime(end.strip(), '%B %Y')
-                except ValueError:
-                    continue
-
-        delta_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-        total_months += max(delta_months, 0)
-
-    if total_months == 0:
-        # Fallback to simple regex if date range extraction fails
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(\+)?\s*(year|yrs|years)\b', text)
-        if not match:
-            match = re.search(r'experience[^\d]{0,10}(\d+(?:\.\d+)?)', text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                log_system_event("WARNING", "EXPERIENCE_PARSE_ERROR", {"text_snippet": text[:50], "error": "Could not convert to float"})
-                return 0.0
-    return round(total_months / 12, 1)
-
-def extract_contact_info(text):
-    """Extracts email and phone number using regex."""
-    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-    phone_match = re.search(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-    return email_match.group(0) if email_match else "N/A", phone_match.group(0) if phone_match else "N/A"
-
 def generate_ai_suggestion(score, years_exp, missing_skills, required_skills):
     """Generates an AI-like suggestion based on screening criteria."""
     # Retrieve cutoff values from session state, with defaults
@@ -444,102 +95,6 @@ def generate_ai_suggestion(score, years_exp, missing_skills, required_skills):
     else:
         return "Not a Direct Match: Consider for other roles or re-skill."
 
-def clean_text_for_wordcloud(text):
-    """Basic cleaning for word cloud to remove non-alphanumeric and extra spaces."""
-    # Remove special characters, numbers, and convert to lowercase
-    text = re.sub(r'[^a-zA-Z\s]', '', text)
-    # Remove common resume sections or generic words that won't add value
-    stop_words = ["experience", "years", "skills", "education", "project", "work", "roles", "description", "responsibilities", "knowledge", "ability", "developed", "used", "proficient", "strong"]
-    words = text.lower().split()
-    cleaned_words = [word for word in words if word not in stop_words and len(word) > 2]
-    return " ".join(cleaned_words)
-
-def clean_text(text):
-    """Cleans text by removing newlines, extra spaces, and non-ASCII characters."""
-    text = re.sub(r'\n', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[^\x00-\x7F]+', ' ', text)
-    return text.strip().lower()
-
-def extract_relevant_keywords(text, filter_set):
-    """
-    Extracts relevant keywords from text, prioritizing multi-word skills from filter_set.
-    If filter_set is empty, it falls back to filtering out general STOP_WORDS.
-    """
-    cleaned_text = clean_text(text)
-    extracted_keywords = set()
-
-    if filter_set: # If a specific filter_set (like MASTER_SKILLS) is provided
-        # Sort skills by length descending to match longer phrases first
-        sorted_filter_skills = sorted(list(filter_set), key=len, reverse=True)
-        
-        temp_text = cleaned_text # Use a temporary text to remove matched phrases
-
-        for skill_phrase in sorted_filter_skills:
-            # Create a regex pattern to match the whole skill phrase
-            # \b ensures whole word match, re.escape handles special characters in skill names
-            pattern = r'\b' + re.escape(skill_phrase.lower()) + r'\b'
-            
-            # Find all occurrences of the skill phrase
-            matches = re.findall(pattern, temp_text)
-            if matches:
-                extracted_keywords.add(skill_phrase.lower()) # Add the original skill (lowercase)
-                # Replace the found skill with placeholders to avoid re-matching parts of it
-                temp_text = re.sub(pattern, " ", temp_text)
-        
-        # After extracting phrases, now extract individual words that are in the filter_set
-        # and haven't been part of a multi-word skill already extracted.
-        # This ensures single-word skills from MASTER_SKILLS are also captured.
-        individual_words_remaining = set(re.findall(r'\b\w+\b', temp_text))
-        for word in individual_words_remaining:
-            if word in filter_set:
-                extracted_keywords.add(word)
-
-    else: # Fallback: if no specific filter_set (MASTER_SKILLS is empty), use the default STOP_WORDS logic
-        all_words = set(re.findall(r'\b\w+\b', cleaned_text))
-        extracted_keywords = {word for word in all_words if word not in STOP_WORDS}
-
-    return extracted_keywords
-
-def extract_text_from_pdf(uploaded_file):
-    """Extracts text from an uploaded PDF file."""
-    try:
-        with pdfplumber.open(uploaded_file) as pdf:
-            text = ''.join(page.extract_text() or '' for page in pdf.pages)
-        log_system_event("INFO", "PDF_TEXT_EXTRACTED", {"filename": uploaded_file.name, "text_length": len(text)})
-        return text
-    except Exception as e:
-        log_system_event("ERROR", "PDF_EXTRACTION_FAILED", {"filename": uploaded_file.name, "error": str(e), "traceback": traceback.format_exc()})
-        return f"[ERROR] {str(e)}"
-
-def extract_email(text):
-    """Extracts an email address from the given text."""
-    match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-    return match.group(0) if match else None
-
-def extract_name(text):
-    """
-    Attempts to extract a name from the first few lines of the resume text.
-    This is a heuristic and might not be perfect for all resume formats.
-    """
-    lines = text.strip().split('\n')
-    if not lines:
-        return None
-
-    potential_name_lines = []
-    for line in lines[:3]:
-        line = line.strip()
-        # Refined regex to be more robust for names, avoiding lines with too many non-alpha chars
-        if not re.search(r'[@\d\.\-]', line) and len(line.split()) <= 4 and (line.isupper() or (line and line[0].isupper() and all(word[0].isupper() or not word.isalpha() for word in line.split()))):
-            potential_name_lines.append(line)
-
-    if potential_name_lines:
-        name = max(potential_name_lines, key=len)
-        name = re.sub(r'summary|education|experience|skills|projects|certifications', '', name, flags=re.IGNORECASE).strip()
-        if name:
-            return name.title()
-    return None
-
 # --- Concise AI Suggestion Function (for table display) ---
 @st.cache_data(show_spinner="Generating concise AI Suggestion...")
 def generate_concise_ai_suggestion(candidate_name, score, years_exp, semantic_similarity):
@@ -619,95 +174,6 @@ def generate_detailed_hr_assessment(candidate_name, score, years_exp, semantic_s
     return final_assessment
 
 
-def semantic_score(resume_text, jd_text, years_exp):
-    """
-    Calculates a semantic score using an ML model and provides additional details.
-    Falls back to smart_score if the ML model is not loaded or prediction fails.
-    Applies STOP_WORDS filtering for keyword analysis (internally, not for display).
-    """
-    jd_clean = clean_text(jd_text)
-    resume_clean = clean_text(resume_text)
-
-    score = 0.0
-    feedback = "Initial assessment." # This will be overwritten by the generate_concise_ai_suggestion function
-    semantic_similarity = 0.0
-
-    if ml_model is None or model is None:
-        log_system_event("WARNING", "ML_MODELS_NOT_LOADED_FOR_SEMANTIC_SCORE", {"reason": "Falling back to basic score"})
-        # Removed st.warning here as it's handled by load_ml_model
-        # Simplified fallback for score and feedback
-        resume_words = extract_relevant_keywords(resume_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
-        jd_words = extract_relevant_keywords(jd_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
-        
-        overlap_count = len(resume_words.intersection(jd_words))
-        total_jd_words = len(jd_words)
-        
-        basic_score = (overlap_count / total_jd_words) * 70 if total_jd_words > 0 else 0
-        basic_score += min(years_exp * 5, 30) # Add up to 30 for experience
-        score = round(min(basic_score, 100), 2)
-        
-        feedback = "Due to missing ML models, a detailed AI suggestion cannot be provided. Basic score derived from keyword overlap. Manual review is highly recommended."
-        
-        return score, feedback, 0.0 # Return 0 for semantic similarity if ML not available
-
-
-    try:
-        jd_embed = model.encode(jd_clean)
-        resume_embed = model.encode(resume_clean)
-
-        semantic_similarity = cosine_similarity(jd_embed.reshape(1, -1), resume_embed.reshape(1, -1))[0][0]
-        semantic_similarity = float(np.clip(semantic_similarity, 0, 1))
-
-        # Internal calculation for model, not for display
-        # Use the new extraction logic for model features
-        resume_words_filtered = extract_relevant_keywords(resume_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
-        jd_words_filtered = extract_relevant_keywords(jd_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
-        keyword_overlap_count = len(resume_words_filtered.intersection(jd_words_filtered))
-        
-        years_exp_for_model = float(years_exp) if years_exp is not None else 0.0
-
-        features = np.concatenate([jd_embed, resume_embed, [years_exp_for_model], [keyword_overlap_count]])
-
-        predicted_score = ml_model.predict([features])[0]
-
-        if len(jd_words_filtered) > 0:
-            jd_coverage_percentage = (keyword_overlap_count / len(jd_words_filtered)) * 100
-        else:
-            jd_coverage_percentage = 0.0
-
-        blended_score = (predicted_score * 0.6) + \
-                        (jd_coverage_percentage * 0.1) + \
-                        (semantic_similarity * 100 * 0.3)
-
-        if semantic_similarity > 0.7 and years_exp >= 3:
-            blended_score += 5
-
-        score = float(np.clip(blended_score, 0, 100))
-        
-        # The AI suggestion text will be generated separately for display by generate_concise_ai_suggestion.
-        return round(score, 2), "AI suggestion will be generated...", round(semantic_similarity, 2) # Placeholder feedback
-
-
-    except Exception as e:
-        log_system_event("ERROR", "SEMANTIC_SCORE_CALC_FAILED", {"error": str(e), "traceback": traceback.format_exc()})
-        st.warning(f"Error during semantic scoring, falling back to basic: {e}")
-        # Simplified fallback for score and feedback if ML prediction fails
-        # Use the new extraction logic for fallback
-        resume_words = extract_relevant_keywords(resume_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
-        jd_words = extract_relevant_keywords(jd_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
-        
-        overlap_count = len(resume_words.intersection(jd_words))
-        total_jd_words = len(jd_words)
-        
-        basic_score = (overlap_count / total_jd_words) * 70 if total_jd_words > 0 else 0
-        basic_score += min(years_exp * 5, 30) # Add up to 30 for experience
-        score = round(min(basic_score, 100), 2)
-
-        feedback = "Due to an error in core AI model, a detailed AI suggestion cannot be provided. Basic score derived. Manual review is highly recommended."
-
-        return score, feedback, 0.0 # Return 0 for semantic similarity on fallback
-
-
 # --- Email Generation Function ---
 def create_mailto_link(recipient_email, candidate_name, job_title="Job Opportunity", sender_name="Recruiting Team"):
     """
@@ -794,6 +260,15 @@ def resume_screener_page():
         )
         st.session_state['screening_cutoff_score'] = cutoff_score # Store for email page
 
+    with st.expander("⚙️ Advanced Scoring Options"):
+        tfidf_mode = st.radio(
+            "TF-IDF Similarity Mode",
+            [TFIDF_MODE_BATCH, TFIDF_MODE_PAIRWISE],
+            format_func=lambda mode: "Batch (one model fitted over the JD and all resumes)" if mode == TFIDF_MODE_BATCH else "Legacy per-pair (JD + one resume per fit)",
+            key="tfidf_mode_radio",
+            help="Batch mode computes meaningful IDF weights across the uploaded resumes and is much faster. Use per-pair mode to compare against older screening scores."
+        )
+
 
     required_skills = [skill.strip().lower() for skill in required_skills_input.split(',') if skill.strip()]
     if not required_skills:
@@ -826,75 +301,57 @@ def resume_screener_page():
             "jd_source": jd_source,
             "min_experience_req": min_experience,
             "required_skills_count": len(required_skills),
-            "shortlighting_cutoff_score": cutoff_score
+            "shortlighting_cutoff_score": cutoff_score,
+            "tfidf_mode": tfidf_mode
         })
         update_metrics_summary("total_screenings_run", 1)
         update_metrics_summary("user_screenings_run", 1, user_email=user_email)
 
-        for i, resume_file in enumerate(uploaded_resumes):
-            status_text.text(f"Processing {resume_file.name} ({i+1}/{len(uploaded_resumes)})...")
-            my_bar.progress((i + 1) / len(uploaded_resumes))
+        def update_progress(stage, done, total):
+            if stage == "extracting":
+                status_text.text(f"Extracting text from {total} resume(s)...")
+            elif stage == "parsing":
+                status_text.text(f"Processing {uploaded_resumes[done - 1].name} ({done}/{total})...")
+                my_bar.progress(done / total)
+            elif stage == "scoring" and done == 0:
+                status_text.text(f"Scoring {total} resume(s)...")
+
+        # Models load lazily on first use (usually already warmed up in the background at app start)
+        with st.spinner("Loading AI models..."):
+            model, ml_model = get_models()
+        if model is None or ml_model is None:
+            st.error(f"❌ Error loading models. Please ensure '{ML_MODEL_PATH}' is in the same directory.")
+
+        # Saved JDs carry precomputed embedding / skills / TF-IDF terms; pasted JDs are processed inline
+        jd_artifact = get_jd_artifact(jd_file_path, model) if jd_source != "Paste Manually" else None
+
+        screened_resumes, failed_resumes = screen_resumes(
+            [(resume_file.name, resume_file.read()) for resume_file in uploaded_resumes],
+            job_description_text,
+            required_skills,
+            min_experience,
+            cutoff_score,
+            model,
+            ml_model,
+            tfidf_mode=tfidf_mode,
+            progress_callback=update_progress,
+            jd_artifact=jd_artifact
+        )
 
-            # Read PDF in-memory as BytesIO
-            pdf_bytes = BytesIO(resume_file.read())
-            resume_text = extract_text_from_pdf(pdf_bytes)
-
-            if resume_text.startswith("[ERROR]"): # Check for error string from extract_text_from_pdf
-                st.error(f"Failed to process {resume_file.name}: {resume_text.replace('[ERROR] ', '')}. Skipping...")
-                log_system_event("WARNING", "RESUME_SKIPPED_DUE_TO_PARSE_ERROR", {"user_email": user_email, "resume_name": resume_file.name, "error_detail": resume_text})
-                continue
-
-            # Basic Information Extraction
-            # Improved candidate name extraction: look for common patterns at the beginning
-            candidate_name_match = re.match(r'^(?:Mr\.|Ms\.|Dr\.)?\s*([A-Za-z\s.-]{2,})', resume_text.strip())
-            candidate_name = candidate_name_match.group(1).strip() if candidate_name_match else resume_file.name.replace(".pdf", "").replace("_", " ").title()
-            
-            email = extract_email(resume_text)
-            phone = extract_contact_info(resume_text)[1] # Get phone from tuple
-            years_experience = extract_years_of_experience(resume_text)
-            
-            # Skill Matching
-            resume_text_lower = resume_text.lower()
-            matched_skills = [skill for skill in required_skills if skill in resume_text_lower]
-            missing_skills = [skill for skill in required_skills if skill not in resume_text_lower]
-
-            # Similarity Score (Cosine Similarity with TF-IDF)
-            documents = [jd_text_lower, resume_text_lower]
-            try:
-                # Add 'stop_words' to TfidfVectorizer for better relevance
-                vectorizer = TfidfVectorizer(stop_words='english')
-                tfidf_matrix = vectorizer.fit_transform(documents)
-                cosine_sim = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0] 
-                similarity_score_percent = round(cosine_sim * 100, 2)
-            except Exception as e:
-                similarity_score_percent = 0.0 # Default to 0 if vectorization fails
-                log_system_event("ERROR", "TFIDF_COSINE_SIM_FAILED", {"user_email": user_email, "resume_name": resume_file.name, "error": str(e), "traceback": traceback.format_exc()})
-
-
-            # Determine Predicted Status based on criteria
-            predicted_status = "Rejected"
-            if similarity_score_percent >= cutoff_score and years_experience >= min_experience:
-                predicted_status = "Shortlisted"
-            elif years_experience < min_experience:
-                predicted_status = "Rejected (Experience)"
-            elif similarity_score_percent < cutoff_score:
-                predicted_status = "Rejected (Score)"
-            
-            # Refine prediction based on major skill gaps
-            if predicted_status == "Shortlisted" and len(required_skills) > 0 and len(missing_skills) > len(required_skills) / 2: # If too many skills are missing
-                 predicted_status = "Rejected (Major Skill Gap)"
+        for failure in failed_resumes:
+            st.error(f"Failed to process {failure['file_name']}: {failure['error']}. Skipping...")
+            log_system_event("WARNING", "RESUME_SKIPPED_DUE_TO_PARSE_ERROR", {"user_email": user_email, "resume_name": failure["file_name"], "error_detail": failure["error"]})
 
+        for parsed in screened_resumes:
+            candidate_name = parsed["candidate_name"]
+            years_experience = parsed["years_experience"]
+            similarity_score_percent = parsed["similarity_score_percent"]
+            predicted_status = parsed["predicted_status"]
+            resume_text = parsed["resume_text"]
+            actual_score = parsed["semantic_score"]
+            semantic_similarity_val = parsed["semantic_similarity"]
 
             # Generate AI Suggestion based on the *final* predicted status and other factors
-            ai_suggestion = generate_concise_ai_suggestion(
-                candidate_name=candidate_name,
-                score=similarity_score_percent,
-                years_exp=years_experience,
-                semantic_similarity=0.0 # Placeholder, as semantic_score is called later
-            )
-            # Re-call semantic_score to get the actual semantic_similarity for the result
-            actual_score, _, semantic_similarity_val = semantic_score(resume_text, jd_text, years_experience)
-            # Update AI suggestion with actual semantic similarity if needed
             ai_suggestion = generate_concise_ai_suggestion(
                 candidate_name=candidate_name,
                 score=actual_score,
@@ -903,34 +360,25 @@ def resume_screener_page():
             )
 
 
-            # Match Level based on score
-            match_level = ""
-            if similarity_score_percent >= 80:
-                match_level = "High"
-            elif similarity_score_percent >= 60:
-                match_level = "Medium"
-            else:
-                match_level = "Low"
-
             results.append({
-                "Resume Name": resume_file.name,
+                "Resume Name": parsed["resume_name"],
                 "Candidate Name": candidate_name,
-                "Email": email or "N/A",
-                "Phone": phone or "N/A",
+                "Email": parsed["email"] or "N/A",
+                "Phone": parsed["phone"] or "N/A",
                 "Years Experience": years_experience,
                 "Score (%)": similarity_score_percent, # Renamed for clarity in email_page.py
-                "Matched Skills": ", ".join(matched_skills) if matched_skills else "None",
-                "Missing Skills": ", ".join(missing_skills) if missing_skills else "None",
+                "Matched Skills": ", ".join(parsed["matched_skills"]) if parsed["matched_skills"] else "None",
+                "Missing Skills": ", ".join(parsed["missing_skills"]) if parsed["missing_skills"] else "None",
                 "Predicted Status": predicted_status,
-                "Match Level": match_level,
+                "Match Level": parsed["match_level"],
                 "AI Suggestion": ai_suggestion, # This is the concise one for the table
-                "Detailed HR Assessment": generate_detailed_hr_assessment(candidate_name, similarity_score_percent, years_experience, semantic_similarity_val, jd_text, resume_text), # Store the detailed one for top candidate
+                "Detailed HR Assessment": generate_detailed_hr_assessment(candidate_name, similarity_score_percent, years_experience, semantic_similarity_val, job_description_text, resume_text), # Store the detailed one for top candidate
                 "Semantic Similarity": semantic_similarity_val,
                 "Resume Raw Text": resume_text, # Store full text for potential future use (e.g., detailed view)
                 "WordCloudText": clean_text_for_wordcloud(resume_text) # For analytics word cloud
             })
             log_user_action(user_email, "RESUME_PROCESSED", {
-                "resume_name": resume_file.name,
+                "resume_name": parsed["resume_name"],
                 "score": similarity_score_percent,
                 "predicted_status": predicted_status,
                 "years_exp": years_experience
@@ -1167,4 +615,5 @@ if __name__ == "__main__":
     if 'screening_cutoff_score' not in st.session_state:
         st.session_state['screening_cutoff_score'] = 75
 
+    start_model_warmup() # Load models in the background while the page renders
     resume_screener_page() # Call the main function for the page
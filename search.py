@@ -1,12 +1,19 @@
 import streamlit as st
-import pdfplumber
-import re
 import pandas as pd
 import io
-import traceback # For detailed error logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Import logging functions
 from utils.logger import log_user_action, update_metrics_summary, log_system_event
+from utils.pdf_extraction import extract_texts_parallel
+from utils.resume_cache import pdf_hash, get_cached_resume, cache_resume, enforce_cache_limit
+from utils.resume_index import (
+    QUERY_MODE_AND, QUERY_MODE_OR, DEFAULT_TOP_K, get_resume_index, add_resumes, search_index, rank_results,
+    reciprocal_rank_fusion, tokenize
+)
+from utils.scoring import EMBEDDING_CACHE_KEY, EMBEDDING_BATCH_SIZE, get_models, clean_text
+from utils.vector_index import get_vector_index, add_vectors, search_vectors
 
 # --- Styling ---
 st.markdown("""
@@ -45,6 +52,129 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+SEARCH_MODE_KEYWORD = "Keyword"
+SEARCH_MODE_SEMANTIC = "Semantic"
+SEARCH_MODE_HYBRID = "Hybrid"
+# Snippet window around each keyword hit, and how many merged snippets a result shows
+SNIPPET_CHARS_BEFORE = 40
+SNIPPET_CHARS_AFTER = 160
+MAX_SNIPPETS_PER_RESULT = 8
+# Each retriever contributes at least this many candidates to the hybrid fusion
+HYBRID_CANDIDATE_DEPTH = 100
+# Semantic hits have no keyword positions, so their result shows the start of the resume
+SEMANTIC_SNIPPET_CHARS = 300
+
+
+def _keyword_snippets(content, keyword_matches):
+    """
+    Builds highlighted snippets from the stored match offsets of all keywords at once: each hit
+    opens a window around it, overlapping windows are merged, and every hit inside a merged
+    window is highlighted in the same pass. At most MAX_SNIPPETS_PER_RESULT snippets are returned.
+    """
+    spans = sorted(span for spans in keyword_matches.values() for span in spans)
+
+    # Merge overlapping hits (e.g. "learning" inside "machine learning") into one highlight
+    merged_spans = []
+    for match_start, match_end in spans:
+        if merged_spans and match_start <= merged_spans[-1][1]:
+            merged_spans[-1][1] = max(merged_spans[-1][1], match_end)
+        else:
+            merged_spans.append([match_start, match_end])
+
+    # Group hits into windows; a hit starting inside the current window extends it
+    windows = []
+    for match_start, match_end in merged_spans:
+        window_start = max(0, match_start - SNIPPET_CHARS_BEFORE)
+        window_end = min(len(content), max(match_end, match_start + SNIPPET_CHARS_AFTER))
+        if windows and window_start <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], window_end)
+            windows[-1][2].append((match_start, match_end))
+        else:
+            windows.append([window_start, window_end, [(match_start, match_end)]])
+
+    snippets = []
+    for window_start, window_end, window_spans in windows[:MAX_SNIPPETS_PER_RESULT]:
+        parts = []
+        cursor = window_start
+        for match_start, match_end in window_spans:
+            parts.append(content[cursor:match_start])
+            parts.append(f"<span class='highlight'>{content[match_start:match_end]}</span>")
+            cursor = match_end
+        parts.append(content[cursor:window_end])
+        snippets.append("".join(parts))
+    if len(windows) > MAX_SNIPPETS_PER_RESULT:
+        snippets.append(f"(+{len(windows) - MAX_SNIPPETS_PER_RESULT} more matching passages)")
+    return snippets
+
+
+def _render_result(name, score_label, snippet_html):
+    st.markdown(f"""<div class="result-box">
+    <b>📄 {name}</b> &nbsp;<small>{score_label}</small><br>{snippet_html}
+    </div>""", unsafe_allow_html=True)
+
+
+def _sync_resume_vectors(index, model):
+    """
+    Makes sure every resume in the search index has a vector in the ANN index. Embeddings come from
+    the resume cache when a screening already computed them; the rest are encoded in one batch and cached.
+    """
+    vector_index = get_vector_index(EMBEDDING_CACHE_KEY)
+    known_ids = set(vector_index["doc_ids"].tolist())
+    missing_ids = [doc_id for doc_id in index["docs"] if doc_id not in known_ids]
+    if not missing_ids:
+        return vector_index
+
+    vectors = [(get_cached_resume(doc_id) or {}).get("embeddings", {}).get(EMBEDDING_CACHE_KEY) for doc_id in missing_ids]
+    to_encode = [i for i, vector in enumerate(vectors) if vector is None]
+    if to_encode:
+        with st.spinner(f"Embedding {len(to_encode)} resume(s) for semantic search..."):
+            encoded = model.encode([clean_text(index["docs"][missing_ids[i]]["text"]) for i in to_encode], batch_size=EMBEDDING_BATCH_SIZE)
+        for i, vector in zip(to_encode, encoded):
+            vectors[i] = vector
+            cache_resume(missing_ids[i], {"embeddings": {EMBEDDING_CACHE_KEY: [float(x) for x in vector]}})
+        enforce_cache_limit()
+    add_vectors(missing_ids, vectors, EMBEDDING_CACHE_KEY)
+    return get_vector_index(EMBEDDING_CACHE_KEY)
+
+
+def _hybrid_search(index, vector_index, model, query, top_k, doc_ids=None):
+    """
+    Runs BM25 keyword retrieval and embedding retrieval concurrently and fuses them with reciprocal
+    rank fusion. The keyword leg ORs the comma-separated keywords, or the query's words if there are
+    no commas. Returns (fused [(doc_id, rrf_score)], keyword matches, {doc_id: bm25}, {doc_id: similarity}, timings).
+    """
+    if ',' in query:
+        keywords = [keyword.strip().lower() for keyword in query.split(',') if keyword.strip()]
+    else:
+        keywords = list(dict.fromkeys(term for term, _ in tokenize(query)))
+    depth = max(HYBRID_CANDIDATE_DEPTH, top_k)
+    timings = {}
+
+    def keyword_leg():
+        start_time = time.perf_counter()
+        results = search_index(index, keywords, mode=QUERY_MODE_OR, doc_ids=doc_ids)
+        ranking = rank_results(index, results, top_k=depth)
+        timings["keyword_ms"] = round((time.perf_counter() - start_time) * 1000, 1)
+        return results, ranking
+
+    def semantic_leg():
+        start_time = time.perf_counter()
+        ranking = search_vectors(vector_index, model.encode(clean_text(query)), top_k=depth, doc_ids=doc_ids)
+        timings["semantic_ms"] = round((time.perf_counter() - start_time) * 1000, 1)
+        return ranking
+
+    # The encoder (torch / onnxruntime) and the postings walk overlap, so latency is ~ the slower leg
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="hybrid-search") as executor:
+        keyword_future = executor.submit(keyword_leg)
+        semantic_future = executor.submit(semantic_leg)
+        keyword_results, bm25_ranking = keyword_future.result()
+        semantic_ranking = semantic_future.result()
+    fused = reciprocal_rank_fusion([bm25_ranking, semantic_ranking], top_k=top_k)
+    timings["total_ms"] = round((time.perf_counter() - start_time) * 1000, 1)
+    return fused, keyword_results, dict(bm25_ranking), dict(semantic_ranking), timings
+
+
 def search_page(): # Encapsulate logic in a function for better modularity
     if 'user_email' not in st.session_state:
         st.warning("Please log in to use the Resume Search Engine.")
@@ -57,90 +187,186 @@ def search_page(): # Encapsulate logic in a function for better modularity
     # --- UI Header ---
     st.markdown('<div class="search-box">', unsafe_allow_html=True)
     st.subheader("🔍 Resume Search Engine")
-    st.caption("Upload resumes and search for single or multiple keywords (e.g., `python, sql`).")
+    st.caption("Upload resumes and search for single or multiple keywords (e.g., `python, sql`). Uploaded resumes stay indexed for later searches.")
 
     # --- File Upload ---
     resumes = st.file_uploader("📤 Upload Resumes (PDF)", type="pdf", accept_multiple_files=True, key="resume_search_upload")
-    resume_texts = {}
+    uploaded_doc_ids = set()
 
     if resumes:
         st.success(f"✅ {len(resumes)} resume(s) uploaded.")
         log_user_action(user_email, "RESUMES_UPLOADED_FOR_SEARCH", {"count": len(resumes)})
         
-        for resume in resumes:
-            try:
-                with pdfplumber.open(resume) as pdf:
-                    text = ''.join(page.extract_text() or '' for page in pdf.pages)
-                    resume_texts[resume.name] = text
-                log_system_event("INFO", "RESUME_PARSED_SUCCESS", {"user_email": user_email, "resume_name": resume.name})
-            except Exception as e:
-                st.warning(f"⚠️ Error reading {resume.name}. This resume will be skipped.")
-                log_system_event("ERROR", "RESUME_PARSE_FAILED", {"user_email": user_email, "resume_name": resume.name, "error": str(e), "traceback": traceback.format_exc()})
+        # Reuse text already extracted for identical PDFs (by content hash); only parse misses
+        pdf_payloads = [(resume.name, resume.getvalue()) for resume in resumes]
+        pdf_digests = [pdf_hash(pdf_bytes) for _, pdf_bytes in pdf_payloads]
+        indexed_docs = get_resume_index()["docs"]
+        extraction_results = []
+        uncached_indices = []
+        for i, ((name, _), digest) in enumerate(zip(pdf_payloads, pdf_digests)):
+            # Resumes already in the search index need neither parsing nor a cache lookup
+            cached_entry = {"text": indexed_docs[digest]["text"]} if digest in indexed_docs else (get_cached_resume(digest) or {})
+            extraction_results.append({"file_name": name, "text": cached_entry.get("text"), "error": None})
+            if cached_entry.get("text") is None:
+                uncached_indices.append(i)
+        if uncached_indices:
+            for i, extraction in zip(uncached_indices, extract_texts_parallel([pdf_payloads[i] for i in uncached_indices])):
+                extraction_results[i] = extraction
+                if extraction["error"] is None:
+                    cache_resume(pdf_digests[i], {"text": extraction["text"]})
+            enforce_cache_limit()
+
+        resumes_to_index = []
+        for extraction, digest in zip(extraction_results, pdf_digests):
+            if extraction["error"] is None:
+                uploaded_doc_ids.add(digest)
+                resumes_to_index.append((digest, extraction["file_name"], extraction["text"]))
+                log_system_event("INFO", "RESUME_PARSED_SUCCESS", {"user_email": user_email, "resume_name": extraction["file_name"]})
+            else:
+                st.warning(f"⚠️ Error reading {extraction['file_name']}. This resume will be skipped.")
+                log_system_event("ERROR", "RESUME_PARSE_FAILED", {"user_email": user_email, "resume_name": extraction["file_name"], "error": extraction["error"]})
+        # Ingest into the persistent inverted index (no-op for resumes indexed before)
+        num_indexed = add_resumes(resumes_to_index)
+        if num_indexed:
+            log_system_event("INFO", "RESUMES_INDEXED_FOR_SEARCH", {"user_email": user_email, "num_indexed": num_indexed})
 
+    index = get_resume_index()
+    if not uploaded_doc_ids and not index["docs"]:
+        st.info("📁 Please upload resume PDFs to begin searching.")
+        st.markdown("</div>", unsafe_allow_html=True)
+        return
+
+    col_scope, col_search_mode, col_top_k = st.columns([2, 2, 1])
+    with col_scope:
+        scope_options = (["Uploaded resumes"] if uploaded_doc_ids else []) + [f"All indexed resumes ({len(index['docs'])})"]
+        search_scope = st.radio("Search in:", scope_options, horizontal=True, key="search_scope")
+    with col_search_mode:
+        search_mode = st.radio("Search mode:", [SEARCH_MODE_KEYWORD, SEARCH_MODE_SEMANTIC, SEARCH_MODE_HYBRID], horizontal=True, key="search_mode")
+    with col_top_k:
+        top_k = st.number_input("Top results:", min_value=1, max_value=1000, value=DEFAULT_TOP_K, step=10, key="search_top_k")
+    scope_doc_ids = uploaded_doc_ids if search_scope == "Uploaded resumes" else None
+    num_resumes_to_search = len(scope_doc_ids) if scope_doc_ids is not None else len(index["docs"])
+
+    if search_mode == SEARCH_MODE_KEYWORD:
+        match_mode = st.radio("Match:", ["All keywords (AND)", "Any keyword (OR)"], horizontal=True, key="search_match_mode")
+        query_mode = QUERY_MODE_AND if match_mode.startswith("All") else QUERY_MODE_OR
         query = st.text_input("🔎 Enter keywords (comma-separated)").strip().lower()
-        download_rows = []
+    elif search_mode == SEARCH_MODE_SEMANTIC:
+        query = st.text_input("🔎 Describe the candidate you're looking for (e.g., `backend engineer with cloud experience`)").strip()
+    else:
+        query = st.text_input("🔎 Enter keywords and/or a description (e.g., `aws certified, kubernetes, backend engineer`)").strip()
+    download_rows = []
+
+    if query and search_mode == SEARCH_MODE_KEYWORD:
+        keywords = [q.strip() for q in query.split(',') if q.strip()]
+        log_user_action(user_email, "RESUME_SEARCH_INITIATED", {"keywords": keywords, "num_resumes_to_search": num_resumes_to_search, "mode": query_mode})
+        update_metrics_summary("total_searches_performed", 1)
+        update_metrics_summary("user_searches_performed", 1, user_email=user_email)
+
+        st.markdown("### 📄 Search Results")
+        results = search_index(index, keywords, mode=query_mode, doc_ids=scope_doc_ids)
+        ranked_results = rank_results(index, results, top_k=int(top_k))
+        if results:
+            st.caption(f"Showing the top {len(ranked_results)} of {len(results)} matching resume(s), ranked by relevance (BM25).")
+
+        for doc_id, score in ranked_results:
+            doc = index["docs"][doc_id]
+            matched_snippets = _keyword_snippets(doc["text"], results[doc_id])
+            _render_result(doc["name"], f"score {score:.2f}", " ... ".join(matched_snippets) + "...")
+
+            download_rows.append({
+                "File Name": doc["name"],
+                "Score": round(score, 4),
+                "Matched Keywords": ", ".join(results[doc_id]),
+                "Snippet": ' '.join(snippet.replace("<span class='highlight'>", "").replace("</span>", "") for snippet in matched_snippets) # Clean snippet for CSV
+            })
+        
+        if results:
+            log_user_action(user_email, "RESUME_SEARCH_RESULTS_FOUND", {"keywords": keywords, "num_results": len(download_rows)})
+        else:
+            st.error("❌ No matching resumes found.")
+            log_user_action(user_email, "RESUME_SEARCH_NO_RESULTS", {"keywords": keywords})
 
-        if query:
-            keywords = [q.strip() for q in query.split(',') if q.strip()]
-            log_user_action(user_email, "RESUME_SEARCH_INITIATED", {"keywords": keywords, "num_resumes_to_search": len(resume_texts)})
-            update_metrics_summary("total_searches_performed", 1)
-            update_metrics_summary("user_searches_performed", 1, user_email=user_email)
+    elif query and search_mode == SEARCH_MODE_SEMANTIC:
+        log_user_action(user_email, "RESUME_SEMANTIC_SEARCH_INITIATED", {"query": query, "num_resumes_to_search": num_resumes_to_search})
+        update_metrics_summary("total_searches_performed", 1)
+        update_metrics_summary("user_searches_performed", 1, user_email=user_email)
+
+        with st.spinner("Loading AI models..."):
+            model, _ = get_models()
+        if model is None:
+            st.error("❌ The embedding model could not be loaded, so semantic search is unavailable. Use keyword search instead.")
+        else:
+            vector_index = _sync_resume_vectors(index, model)
+            ranked_results = search_vectors(vector_index, model.encode(clean_text(query)), top_k=int(top_k), doc_ids=scope_doc_ids)
 
             st.markdown("### 📄 Search Results")
-            found = False
-
-            for name, content in resume_texts.items():
-                content_lower = content.lower()
-                matched_keywords_for_resume = []
-                matched_snippets = []
-                for keyword in keywords:
-                    if keyword in content_lower:
-                        found = True
-                        matched_keywords_for_resume.append(keyword)
-                        
-                        # Find all occurrences of the keyword to get multiple snippets
-                        for match in re.finditer(re.escape(keyword), content_lower):
-                            idx = match.start()
-                            snippet_start = max(0, idx - 40)
-                            snippet_end = min(len(content), idx + 160)
-                            snippet = content[snippet_start:snippet_end]
-                            
-                            highlighted = re.sub(
-                                f"({re.escape(keyword)})",
-                                r"<span class='highlight'>\1</span>",
-                                snippet,
-                                flags=re.IGNORECASE
-                            )
-                            matched_snippets.append(highlighted)
-
-                if matched_snippets:
-                    combined_snippet = " ... ".join(matched_snippets)
-                    st.markdown(f"""<div class="result-box">
-                    <b>📄 {name}</b><br>{combined_snippet}...
-                    </div>""", unsafe_allow_html=True)
-
-                    download_rows.append({
-                        "File Name": name,
-                        "Matched Keywords": ", ".join(matched_keywords_for_resume),
-                        "Snippet": ' '.join(snippet.replace("<span class='highlight'>", "").replace("</span>", "") for snippet in matched_snippets) # Clean snippet for CSV
-                    })
-            
-            if found:
-                log_user_action(user_email, "RESUME_SEARCH_RESULTS_FOUND", {"keywords": keywords, "num_results": len(download_rows)})
+            if ranked_results:
+                st.caption(f"Showing the {len(ranked_results)} resume(s) closest in meaning to the query (cosine similarity).")
+            for doc_id, similarity in ranked_results:
+                doc = index["docs"][doc_id]
+                snippet = doc["text"][:SEMANTIC_SNIPPET_CHARS]
+                _render_result(doc["name"], f"similarity {similarity:.3f}", snippet + "...")
+                download_rows.append({"File Name": doc["name"], "Score": round(similarity, 4), "Snippet": snippet})
+
+            if ranked_results:
+                log_user_action(user_email, "RESUME_SEARCH_RESULTS_FOUND", {"query": query, "num_results": len(download_rows), "mode": "semantic"})
             else:
                 st.error("❌ No matching resumes found.")
-                log_user_action(user_email, "RESUME_SEARCH_NO_RESULTS", {"keywords": keywords})
+                log_user_action(user_email, "RESUME_SEARCH_NO_RESULTS", {"query": query, "mode": "semantic"})
 
-            # --- Export Button ---
-            if download_rows:
-                df_download = pd.DataFrame(download_rows)
-                csv_buffer = io.StringIO()
-                df_download.to_csv(csv_buffer, index=False)
-                if st.download_button("📥 Download Matched Results (CSV)", data=csv_buffer.getvalue(), file_name="matched_resumes.csv", mime="text/csv"):
-                    log_user_action(user_email, "SEARCH_RESULTS_DOWNLOADED", {"keywords": keywords, "num_rows": len(download_rows)})
+    elif query:
+        log_user_action(user_email, "RESUME_HYBRID_SEARCH_INITIATED", {"query": query, "num_resumes_to_search": num_resumes_to_search})
+        update_metrics_summary("total_searches_performed", 1)
+        update_metrics_summary("user_searches_performed", 1, user_email=user_email)
 
-    else:
-        st.info("📁 Please upload resume PDFs to begin searching.")
+        with st.spinner("Loading AI models..."):
+            model, _ = get_models()
+        if model is None:
+            st.error("❌ The embedding model could not be loaded, so hybrid search is unavailable. Use keyword search instead.")
+        else:
+            vector_index = _sync_resume_vectors(index, model)
+            fused_results, keyword_results, bm25_scores, semantic_scores, timings = _hybrid_search(index, vector_index, model, query, int(top_k), doc_ids=scope_doc_ids)
+            log_system_event("INFO", "HYBRID_SEARCH_COMPLETED", {"user_email": user_email, "num_results": len(fused_results), **timings})
+
+            st.markdown("### 📄 Search Results")
+            if fused_results:
+                st.caption(f"Showing the top {len(fused_results)} resume(s), fusing keyword (BM25) and semantic rankings.")
+            for doc_id, fused_score in fused_results:
+                doc = index["docs"][doc_id]
+                bm25_score = bm25_scores.get(doc_id)
+                similarity = semantic_scores.get(doc_id)
+                if doc_id in keyword_results:
+                    matched_snippets = _keyword_snippets(doc["text"], keyword_results[doc_id])
+                else:
+                    matched_snippets = [doc["text"][:SEMANTIC_SNIPPET_CHARS]]
+                score_label = (
+                    f"RRF {fused_score:.4f} · BM25 {f'{bm25_score:.2f}' if bm25_score is not None else '–'}"
+                    f" · similarity {f'{similarity:.3f}' if similarity is not None else '–'}"
+                )
+                _render_result(doc["name"], score_label, " ... ".join(matched_snippets) + "...")
+                download_rows.append({
+                    "File Name": doc["name"],
+                    "Score": round(fused_score, 6),
+                    "BM25 Score": round(bm25_score, 4) if bm25_score is not None else None,
+                    "Semantic Similarity": round(similarity, 4) if similarity is not None else None,
+                    "Matched Keywords": ", ".join(keyword_results.get(doc_id, {})),
+                    "Snippet": ' '.join(snippet.replace("<span class='highlight'>", "").replace("</span>", "") for snippet in matched_snippets)
+                })
+
+            if fused_results:
+                log_user_action(user_email, "RESUME_SEARCH_RESULTS_FOUND", {"query": query, "num_results": len(download_rows), "mode": "hybrid"})
+            else:
+                st.error("❌ No matching resumes found.")
+                log_user_action(user_email, "RESUME_SEARCH_NO_RESULTS", {"query": query, "mode": "hybrid"})
+
+    # --- Export Button ---
+    if download_rows:
+        df_download = pd.DataFrame(download_rows)
+        csv_buffer = io.StringIO()
+        df_download.to_csv(csv_buffer, index=False)
+        if st.download_button("📥 Download Matched Results (CSV)", data=csv_buffer.getvalue(), file_name="matched_resumes.csv", mime="text/csv"):
+            log_user_action(user_email, "SEARCH_RESULTS_DOWNLOADED", {"query": query, "search_mode": search_mode, "num_rows": len(download_rows)})
 
     st.markdown("</div>", unsafe_allow_html=True)
 
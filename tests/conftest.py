@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# The app runs from the repository root (flat pages + the utils/ package), so tests import it the same way
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_sessionstart(session):
+    # Importing utils.logger initializes data/ files in the working directory; keep them out of the checkout
+    os.chdir(tempfile.mkdtemp(prefix="screener-tests-"))
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_dir(tmp_path):
+    """Data files live under relative paths (data/...), so each test gets its own working directory."""
+    previous_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    yield
+    # Events logged during the test are written by a background thread; let it finish here.
+    # (Runs after the test's own monkeypatch is undone, since this fixture doesn't depend on it.)
+    logger = sys.modules.get("utils.logger")
+    if logger is not None:
+        logger.flush_logs()
+    os.chdir(previous_cwd)
+
+
+class FakeEncoder:
+    """Stands in for the sentence-transformer: a deterministic bag-of-words hash embedding that records each encode call."""
+
+    def __init__(self, dim=16):
+        self.dim = dim
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        import numpy as np
+        if isinstance(texts, str): # A single sentence encodes to a 1-D vector, like SentenceTransformer.encode
+            return self.encode([texts], batch_size)[0]
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                vectors[row, sum(map(ord, word)) % self.dim] += 1.0
+        return vectors
+
+
+@pytest.fixture
+def fake_encoder():
+    return FakeEncoder()
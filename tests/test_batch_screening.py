@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pdfplumber")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+import pandas as pd
+
+from utils import batch_screening
+
+
+@pytest.fixture
+def jd_file(tmp_path):
+    path = tmp_path / "data_scientist.txt"
+    path.write_text("Data scientist with Python, SQL and machine learning", encoding="utf-8")
+    return path
+
+
+def test_collect_pdf_paths_filters_and_sorts(tmp_path):
+    for file_name in ("b.pdf", "a.PDF", "notes.txt"):
+        (tmp_path / file_name).write_bytes(b"")
+    assert batch_screening._collect_pdf_paths(str(tmp_path)) == [str(tmp_path / "a.PDF"), str(tmp_path / "b.pdf")]
+
+
+def test_empty_resume_directory_exits_with_error(tmp_path, jd_file):
+    (tmp_path / "resumes").mkdir()
+    assert batch_screening.main(["--jd", str(jd_file), "--resumes", str(tmp_path / "resumes"), "--out", str(tmp_path / "out.csv")]) == 1
+
+
+def test_unparseable_resumes_are_reported_as_failed_rows(tmp_path, jd_file, monkeypatch):
+    # Without models scoring falls back to keyword overlap; no model download needed
+    monkeypatch.setattr(batch_screening, "get_models", lambda: (None, None))
+    resume_dir = tmp_path / "resumes"
+    resume_dir.mkdir()
+    for i in range(3):
+        (resume_dir / f"resume_{i}.pdf").write_bytes(b"not a pdf")
+    out_path = tmp_path / "out" / "results.csv"
+
+    assert batch_screening.main([
+        "--jd", str(jd_file), "--resumes", str(resume_dir), "--out", str(out_path),
+        "--workers", "1", "--chunk-size", "2", "--no-cache"
+    ]) == 0
+
+    results = pd.read_csv(out_path)
+    assert sorted(results["Resume Name"]) == ["resume_0.pdf", "resume_1.pdf", "resume_2.pdf"]
+    assert set(results["Predicted Status"]) == {"Failed to Parse"}
+    assert results["Error"].notna().all()
@@ -0,0 +1,47 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from utils.encoders import (
+    ENCODER_BACKEND_ONNX, ENCODER_BACKEND_ONNX_INT8, ENCODER_BACKEND_TORCH,
+    OnnxMiniLMEncoder, encoder_cache_key, load_encoder
+)
+
+
+def test_cache_keys_keep_backends_apart():
+    keys = {encoder_cache_key("all-MiniLM-L6-v2", backend) for backend in (ENCODER_BACKEND_TORCH, ENCODER_BACKEND_ONNX, ENCODER_BACKEND_ONNX_INT8)}
+    assert len(keys) == 3
+    assert encoder_cache_key("all-MiniLM-L6-v2", ENCODER_BACKEND_TORCH) == "all-MiniLM-L6-v2"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        load_encoder(backend="tensorflow")
+
+
+def test_missing_onnx_model_points_to_export(tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("tokenizers")
+    with pytest.raises(FileNotFoundError, match="export"):
+        OnnxMiniLMEncoder(str(tmp_path))
+
+
+def test_encode_restores_input_order_across_length_sorted_batches():
+    # Skip the ONNX session: each "embedding" is just the sentence length in column 0
+    encoder = object.__new__(OnnxMiniLMEncoder)
+    batches = []
+
+    def encode_batch(sentences):
+        batches.append(sentences)
+        embeddings = np.zeros((len(sentences), 384), dtype=np.float32)
+        embeddings[:, 0] = [len(sentence) for sentence in sentences]
+        return embeddings
+
+    encoder._encode_batch = encode_batch
+    sentences = ["a", "abcd", "ab", "abcde", "abc"]
+    embeddings = encoder.encode(sentences, batch_size=2)
+    assert embeddings.shape == (5, 384) and embeddings.dtype == np.float32
+    assert embeddings[:, 0].tolist() == [1, 4, 2, 5, 3]
+    assert batches == [["abcde", "abcd"], ["abc", "ab"], ["a"]]
+    assert encoder.encode("abc").shape == (384,)
+    assert encoder.encode([]).shape == (0, 384)
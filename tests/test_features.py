@@ -0,0 +1,62 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+from utils.features import featurize_pairs
+
+JD_A = "Data scientist: Python, SQL and machine learning"
+JD_B = "Backend engineer: Java, Spring and AWS"
+RESUMES = [
+    "Python and SQL analyst, 3 years of machine learning",
+    "Java developer with Spring Boot on AWS",
+    "Python backend developer using Django",
+    "Nurse",
+]
+
+
+def test_feature_matrix_shape_dtype_and_views(fake_encoder):
+    result = featurize_pairs([JD_A, JD_B, JD_A, JD_B], RESUMES, fake_encoder, years_exps=[3, 5, None, 0])
+    features = result["features"]
+    dim = fake_encoder.dim
+    assert features.shape == (4, 2 * dim + 2)
+    assert features.dtype == np.float32 and features.flags["C_CONTIGUOUS"]
+    assert np.shares_memory(result["jd_embeddings"], features) and np.shares_memory(result["resume_embeddings"], features)
+    assert result["years"].tolist() == [3, 5, 0, 0]
+    assert (result["jd_embeddings"][0] == result["jd_embeddings"][2]).all()
+    assert result["keyword_overlaps"][3] == 0
+    assert len(result["jd_keyword_counts"]) == 4 and len(result["resume_skill_sets"]) == 4
+
+
+def test_each_distinct_jd_is_encoded_once(fake_encoder):
+    featurize_pairs([JD_A, JD_B, JD_A, JD_A], RESUMES, fake_encoder)
+    jd_call, resume_call = fake_encoder.calls
+    assert len(jd_call) == 2
+    assert len(resume_call) == len(RESUMES)
+
+
+def test_precomputed_values_are_used_and_the_callers_lists_are_left_alone(fake_encoder):
+    resume_embeddings = [np.ones(fake_encoder.dim, dtype=np.float32), None, None, None]
+    resume_skill_sets = [{"python", "sql"}, None, None, None]
+    jd_embeddings = {JD_A: np.full(fake_encoder.dim, 2.0, dtype=np.float32)}
+
+    result = featurize_pairs(
+        [JD_A] * 4, RESUMES, fake_encoder,
+        resume_embeddings=resume_embeddings, resume_skill_sets=resume_skill_sets, jd_embeddings=jd_embeddings
+    )
+
+    assert [len(texts) for texts in fake_encoder.calls] == [3] # Neither the JD nor resume 0 is re-encoded
+    assert (result["jd_embeddings"] == 2.0).all()
+    assert (result["resume_embeddings"][0] == 1.0).all()
+    assert result["resume_skill_sets"][0] == {"python", "sql"}
+    assert all(skill_set is not None for skill_set in result["resume_skill_sets"])
+    assert resume_embeddings[1:] == [None, None, None] and resume_skill_sets[1:] == [None, None, None]
+
+
+def test_invalid_inputs(fake_encoder):
+    with pytest.raises(ValueError):
+        featurize_pairs([JD_A], RESUMES, fake_encoder)
+    with pytest.raises(ValueError):
+        featurize_pairs([], [], fake_encoder)
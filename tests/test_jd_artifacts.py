@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+from utils import jd_artifacts
+from utils.jd_artifacts import build_jd_artifact, delete_jd_artifact, get_jd_artifact, load_jd_artifact
+from utils.scoring import EMBEDDING_CACHE_KEY
+
+
+@pytest.fixture
+def jd_path(tmp_path):
+    path = tmp_path / "data_scientist.txt"
+    path.write_text("Data scientist: Python, SQL and machine learning", encoding="utf-8")
+    return str(path)
+
+
+def test_artifact_is_reused_until_the_jd_changes(jd_path):
+    built = build_jd_artifact(jd_path)
+    assert load_jd_artifact(jd_path)["sha256"] == built["sha256"]
+
+    with open(jd_path, "a", encoding="utf-8") as f:
+        f.write(" and Spark")
+    assert load_jd_artifact(jd_path) is None
+
+
+def test_touched_file_with_same_content_stays_valid(jd_path):
+    build_jd_artifact(jd_path)
+    stat = os.stat(jd_path)
+    os.utime(jd_path, (stat.st_atime, stat.st_mtime + 60))
+    artifact = load_jd_artifact(jd_path)
+    assert artifact is not None
+    assert artifact["mtime"] == stat.st_mtime + 60
+
+
+def test_same_named_jds_in_different_folders_get_separate_artifacts(jd_path, tmp_path):
+    other_path = tmp_path / "archive" / "data_scientist.txt"
+    other_path.parent.mkdir()
+    other_path.write_text("Data scientist: R and statistics", encoding="utf-8")
+    build_jd_artifact(jd_path)
+    build_jd_artifact(str(other_path))
+    assert load_jd_artifact(jd_path)["sha256"] != load_jd_artifact(str(other_path))["sha256"]
+    assert load_jd_artifact(os.path.relpath(jd_path)) is not None
+
+
+def test_artifact_from_another_keyword_definition_is_stale(jd_path, monkeypatch):
+    build_jd_artifact(jd_path)
+    monkeypatch.setattr(jd_artifacts, "FEATURE_FINGERPRINT", "v0-0000000000000000")
+    assert load_jd_artifact(jd_path) is None
+
+
+def test_get_jd_artifact_adds_the_embedding_once(jd_path, fake_encoder):
+    assert EMBEDDING_CACHE_KEY not in get_jd_artifact(jd_path)["embeddings"]
+    artifact = get_jd_artifact(jd_path, fake_encoder)
+    assert len(artifact["embeddings"][EMBEDDING_CACHE_KEY]) == fake_encoder.dim
+    get_jd_artifact(jd_path, fake_encoder)
+    assert len(fake_encoder.calls) == 1
+
+    delete_jd_artifact(jd_path)
+    delete_jd_artifact(jd_path)
+    assert load_jd_artifact(jd_path) is None
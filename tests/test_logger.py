@@ -0,0 +1,269 @@
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from datetime import date, datetime, timedelta
+
+from utils import logger
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_events_are_appended_as_json_lines():
+    logger.log_user_action("a@example.com", "LOGIN", {"method": "password"})
+    logger.log_system_event("ERROR", "SOMETHING_FAILED", {"code": 3})
+    logger.flush_logs()
+
+    [action] = _read_lines(logger.USER_ACTIVITY_LOG_FILE)
+    assert action["user_email"] == "a@example.com" and action["details"] == {"method": "password"}
+    assert _read_lines(logger.SYSTEM_EVENTS_LOG_FILE)[-1]["event"] == "SOMETHING_FAILED"
+    assert logger.get_user_activity_logs() == [action]
+
+
+def test_partially_written_lines_are_skipped():
+    os.makedirs(logger.LOG_DIR)
+    with open(logger.USER_ACTIVITY_LOG_FILE, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"timestamp": "2026-01-01T00:00:00", "action": "LOGIN"}) + "\n\n{\"timestamp\": \"2026-01-0")
+    assert [entry["action"] for entry in logger._read_jsonl(logger.USER_ACTIVITY_LOG_FILE)] == ["LOGIN"]
+
+
+def test_legacy_json_array_log_is_migrated_once():
+    os.makedirs(logger.LOG_DIR)
+    with open(logger.LEGACY_USER_ACTIVITY_LOG_FILE, "w") as f:
+        json.dump([{"action": "OLD_1"}, {"action": "OLD_2"}], f)
+    with open(logger.USER_ACTIVITY_LOG_FILE, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"action": "NEW"}) + "\n")
+
+    logger._migrate_json_array_log(logger.LEGACY_USER_ACTIVITY_LOG_FILE, logger.USER_ACTIVITY_LOG_FILE)
+    logger._migrate_json_array_log(logger.LEGACY_USER_ACTIVITY_LOG_FILE, logger.USER_ACTIVITY_LOG_FILE)
+
+    assert [entry["action"] for entry in _read_lines(logger.USER_ACTIVITY_LOG_FILE)] == ["OLD_1", "OLD_2", "NEW"]
+    assert not os.path.exists(logger.LEGACY_USER_ACTIVITY_LOG_FILE)
+    assert os.path.exists(f"{logger.LEGACY_USER_ACTIVITY_LOG_FILE}.migrated")
+
+
+def _run_processes(code, count):
+    """Runs `code` in `count` concurrent Python processes sharing the current working directory."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    processes = [subprocess.Popen([sys.executable, "-c", code], env=env) for _ in range(count)]
+    assert [process.wait(timeout=60) for process in processes] == [0] * count
+
+
+def test_concurrent_imports_migrate_the_legacy_log_once():
+    os.makedirs(logger.LOG_DIR)
+    with open(logger.LEGACY_SYSTEM_EVENTS_LOG_FILE, "w") as f:
+        json.dump([{"event": f"OLD_{i}"} for i in range(50)], f)
+
+    _run_processes("import utils.logger", 6)
+
+    # The migrating process logs LOG_MIGRATED; that write rotates the (undated, so older) legacy entries into a segment
+    events = [entry["event"] for entry in logger.get_system_events_logs()]
+    assert events[:50] == [f"OLD_{i}" for i in range(50)]
+    assert events[50:] == ["LOG_MIGRATED"]
+
+
+def test_events_from_many_threads_are_all_written_in_order_per_thread():
+    def log_actions(thread_index):
+        for i in range(200):
+            logger.log_user_action(f"user{thread_index}@example.com", f"ACTION_{i}")
+
+    threads = [threading.Thread(target=log_actions, args=(thread_index,)) for thread_index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.flush_logs()
+
+    entries = _read_lines(logger.USER_ACTIVITY_LOG_FILE)
+    assert len(entries) == 800
+    for thread_index in range(4):
+        actions = [entry["action"] for entry in entries if entry["user_email"] == f"user{thread_index}@example.com"]
+        assert actions == [f"ACTION_{i}" for i in range(200)]
+
+
+def test_drop_policy_counts_dropped_events_and_reports_them(monkeypatch):
+    # A full one-slot queue with no writer draining it
+    monkeypatch.setattr(logger, "LOG_QUEUE_FULL_POLICY", logger.LOG_QUEUE_FULL_POLICY_DROP)
+    monkeypatch.setattr(logger, "_log_queue", queue.Queue(maxsize=1))
+    monkeypatch.setattr(logger, "_ensure_writer_thread", lambda: None)
+    monkeypatch.setattr(logger, "_dropped_events", 0)
+    for i in range(3):
+        logger.log_system_event("INFO", f"EVENT_{i}")
+    assert logger._dropped_events == 2
+
+    logger._write_batch([logger._log_queue.get()])
+    assert [(entry["event"], entry["details"].get("num_dropped")) for entry in _read_lines(logger.SYSTEM_EVENTS_LOG_FILE)] == [
+        ("EVENT_0", None), ("LOG_EVENTS_DROPPED", 2)
+    ]
+    assert logger._dropped_events == 0
+
+
+def test_metrics_are_counted_in_memory_until_a_snapshot():
+    logger.update_metrics_summary("total_resumes_screened", 3, date="2026-05-01")
+    logger.update_metrics_summary("user_resumes_screened", 2, user_email="a@example.com", date="2026-05-01")
+    expected = {"total_resumes_screened": {"2026-05-01": 3}, "user_resumes_screened": {"a@example.com": {"2026-05-01": 2}}}
+    assert not os.path.exists(logger.METRICS_SUMMARY_FILE)
+    assert logger.get_metrics_summary() == expected
+
+    logger.snapshot_metrics()
+    logger.update_metrics_summary("total_resumes_screened", 1, date="2026-05-01")
+    with open(logger.METRICS_SUMMARY_FILE) as f:
+        assert json.load(f) == expected
+    assert logger.get_metrics_summary()["total_resumes_screened"] == {"2026-05-01": 4}
+    logger.snapshot_metrics()
+
+
+def test_failed_snapshot_keeps_the_increments(monkeypatch):
+    def fail(pending):
+        raise OSError("disk full")
+
+    logger.update_metrics_summary("total_resumes_screened", 5, date="2026-05-01")
+    monkeypatch.setattr(logger, "_persist_metric_increments", fail)
+    logger.snapshot_metrics()
+    monkeypatch.undo()
+    logger.snapshot_metrics()
+    assert logger._read_metrics_snapshot() == {"total_resumes_screened": {"2026-05-01": 5}}
+
+
+def test_concurrent_processes_do_not_lose_metric_increments():
+    code = (
+        "from utils import logger\n"
+        "for _ in range(50):\n"
+        "    logger.update_metrics_summary('total_resumes_screened', 1, user_email=None, date='2026-05-01')\n"
+        "    logger.snapshot_metrics()\n"
+    )
+    _run_processes(code, 4)
+    assert logger._read_metrics_snapshot() == {"total_resumes_screened": {"2026-05-01": 200}}
+
+
+def test_concurrent_processes_rotating_the_same_log_lose_no_events():
+    code = (
+        "from utils import logger\n"
+        "import os\n"
+        "logger.LOG_ROTATE_MAX_BYTES = 5000\n"
+        "for i in range(500):\n"
+        "    logger.log_user_action(f'user{os.getpid()}@example.com', f'ACTION_{i}')\n"
+        "    if i % 25 == 0:\n"
+        "        logger.flush_logs()\n"
+        "logger.flush_logs()\n"
+    )
+    _run_processes(code, 4)
+
+    assert len(logger.get_user_activity_logs()) == 2000
+    with open(logger.LOG_SEGMENT_INDEX_FILE, encoding="utf-8") as f:
+        indexed = [meta["file"] for segments in json.load(f).values() for meta in segments]
+    on_disk = [name for name in os.listdir(logger.LOG_SEGMENT_DIR) if name.endswith(".jsonl.gz")]
+    assert len(indexed) > 1
+    assert sorted(indexed) == sorted(on_disk)
+    assert not os.path.exists(f"{logger.USER_ACTIVITY_LOG_FILE}.rotating")
+
+
+def _write_activity_log(entries):
+    os.makedirs(logger.LOG_DIR, exist_ok=True)
+    with open(logger.USER_ACTIVITY_LOG_FILE, "a", encoding="utf-8") as f:
+        for timestamp, user_email, action in entries:
+            f.write(json.dumps({"timestamp": timestamp, "user_email": user_email, "action": action, "details": {}, "ip_address": None}) + "\n")
+
+
+ACTIVITY = [
+    ("2026-03-01T09:00:00", "a@example.com", "LOGIN"),
+    ("2026-03-02T09:00:00", "b@example.com", "LOGIN"),
+    ("2026-03-02T10:00:00", "a@example.com", "SCREEN"),
+    ("2026-03-03T09:00:00", "a@example.com", "LOGIN"),
+    ("2026-03-04T09:00:00", "b@example.com", "SCREEN"),
+]
+
+
+def _check_activity_queries():
+    entries, total = logger.query_user_activity_logs(user_email="a@example.com")
+    assert total == 3
+    assert [entry["timestamp"] for entry in entries] == ["2026-03-03T09:00:00", "2026-03-02T10:00:00", "2026-03-01T09:00:00"]
+
+    entries, total = logger.query_user_activity_logs(start_date=date(2026, 3, 2), end_date=date(2026, 3, 3), action="LOGIN")
+    assert total == 2 and [entry["user_email"] for entry in entries] == ["a@example.com", "b@example.com"]
+
+    entries, total = logger.query_user_activity_logs(limit=2, offset=2)
+    assert total == 5 and [entry["timestamp"] for entry in entries] == ["2026-03-02T10:00:00", "2026-03-02T09:00:00"]
+    assert logger.get_user_activity_filter_options() == (["a@example.com", "b@example.com"], ["LOGIN", "SCREEN"])
+
+
+def test_jsonl_log_queries(monkeypatch):
+    monkeypatch.setattr(logger, "LOG_RETENTION_DAYS", 0) # The fixed dates above may be past retention
+    _write_activity_log(ACTIVITY)
+    _check_activity_queries()
+
+
+def test_sqlite_backend_imports_existing_logs_and_answers_the_same_queries(monkeypatch):
+    monkeypatch.setattr(logger, "LOG_RETENTION_DAYS", 0)
+    _write_activity_log(ACTIVITY)
+    monkeypatch.setattr(logger, "LOG_BACKEND", logger.LOG_BACKEND_SQLITE)
+    logger._initialize_db()
+    _check_activity_queries()
+
+    logger.log_system_event("WARNING", "DISK_LOW")
+    logger.update_metrics_summary("total_resumes_screened", 2, date="2026-03-04")
+    logger.snapshot_metrics()
+    assert [entry["event"] for entry in logger.query_system_events_logs(level="WARNING")[0]] == ["DISK_LOW"]
+    assert logger.get_metrics_summary() == {"total_resumes_screened": {"2026-03-04": 2}}
+
+
+def _days_ago(days, hour=9):
+    return (datetime.now() - timedelta(days=days)).replace(hour=hour, minute=0, second=0, microsecond=0).isoformat()
+
+
+def _add_segment(entries):
+    """Compacts (timestamp, user_email, action) entries into a new user activity segment."""
+    source_filepath = os.path.join(logger.LOG_DIR, "segment_source.jsonl")
+    os.makedirs(logger.LOG_DIR, exist_ok=True)
+    with open(source_filepath, "w", encoding="utf-8") as f:
+        for timestamp, user_email, action in entries:
+            f.write(json.dumps({"timestamp": timestamp, "user_email": user_email, "action": action}) + "\n")
+    logger._compact_to_segment(source_filepath, logger.USER_ACTIVITY_LOG_FILE)
+    return logger._load_segment_index()[os.path.basename(logger.USER_ACTIVITY_LOG_FILE)][-1]
+
+
+def test_active_log_with_an_earlier_day_is_rotated_into_a_segment(monkeypatch):
+    monkeypatch.setattr(logger, "LOG_RETENTION_DAYS", 0)
+    _write_activity_log([(_days_ago(2), "a@example.com", "LOGIN"), (_days_ago(2, hour=10), "b@example.com", "SCREEN")])
+
+    logger.log_user_action("c@example.com", "LOGIN")
+    logger.flush_logs()
+
+    [segment] = logger._load_segment_index()[os.path.basename(logger.USER_ACTIVITY_LOG_FILE)]
+    assert segment["num_entries"] == 2
+    assert (segment["first_timestamp"], segment["last_timestamp"]) == (_days_ago(2), _days_ago(2, hour=10))
+    assert segment["values"] == {"user_email": ["a@example.com", "b@example.com"], "action": ["LOGIN", "SCREEN"]}
+    assert [entry["user_email"] for entry in _read_lines(logger.USER_ACTIVITY_LOG_FILE)] == ["c@example.com"]
+    assert [entry["user_email"] for entry in logger.get_user_activity_logs()] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert logger.get_user_activity_filter_options() == (["a@example.com", "b@example.com", "c@example.com"], ["LOGIN", "SCREEN"])
+
+
+def test_date_range_reads_only_open_overlapping_segments():
+    old_segment = _add_segment([(_days_ago(10), "a@example.com", "LOGIN")])
+    _add_segment([(_days_ago(3), "b@example.com", "LOGIN")])
+    # An unreadable file would raise if it were opened
+    with open(os.path.join(logger.LOG_SEGMENT_DIR, old_segment["file"]), "wb") as f:
+        f.write(b"not gzip")
+
+    start = (datetime.now() - timedelta(days=4)).date()
+    entries, total = logger.query_user_activity_logs(start_date=start)
+    assert total == 1 and entries[0]["user_email"] == "b@example.com"
+
+
+def test_retention_deletes_only_expired_segments(monkeypatch):
+    monkeypatch.setattr(logger, "LOG_RETENTION_DAYS", 30)
+    expired = _add_segment([(_days_ago(40), "a@example.com", "LOGIN")])
+    kept = _add_segment([(_days_ago(20), "b@example.com", "LOGIN")])
+
+    logger.apply_log_retention()
+
+    assert logger._load_segment_index()[os.path.basename(logger.USER_ACTIVITY_LOG_FILE)] == [kept]
+    assert not os.path.exists(os.path.join(logger.LOG_SEGMENT_DIR, expired["file"]))
+    assert os.path.exists(os.path.join(logger.LOG_SEGMENT_DIR, kept["file"]))
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from datetime import date
+
+from utils import logger
+from utils.metrics_rollups import METRICS_ROLLUPS_FILE, apply_increments, empty_rollups, load_rollups, main, window_total
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+METRICS = {
+    "total_resumes_screened": {"2026-05-01": 3, "2026-05-20": 2},
+    "user_resumes_screened": {
+        "a@example.com": {"2026-05-01": 1, "2026-05-20": 4},
+        "b@example.com": {"2026-05-20": 5}
+    }
+}
+
+
+def test_apply_increments_builds_daily_and_per_user_totals():
+    rollups = apply_increments(empty_rollups(), METRICS)
+    assert rollups["daily"] == {
+        "total_resumes_screened": {"2026-05-01": 3, "2026-05-20": 2},
+        "user_resumes_screened": {"2026-05-01": 1, "2026-05-20": 9}
+    }
+    assert rollups["per_user"] == {"user_resumes_screened": {"a@example.com": 5, "b@example.com": 5}}
+
+    apply_increments(rollups, {"user_resumes_screened": {"a@example.com": {"2026-05-20": 1}}})
+    assert rollups["daily"]["user_resumes_screened"]["2026-05-20"] == 10
+    assert rollups["per_user"]["user_resumes_screened"]["a@example.com"] == 6
+
+
+def test_window_total_includes_today_and_the_days_before():
+    rollups = apply_increments(empty_rollups(), METRICS)
+    assert window_total(rollups, "user_resumes_screened", 7, today=date(2026, 5, 20)) == 9
+    assert window_total(rollups, "user_resumes_screened", 20, today=date(2026, 5, 20)) == 10
+    assert window_total(rollups, "user_resumes_screened", 7, today=date(2026, 5, 19)) == 0
+    assert window_total(rollups, "missing_metric", 30) == 0
+
+
+def test_snapshots_keep_rollups_in_step_with_the_metrics_store():
+    logger.update_metrics_summary("user_resumes_screened", 2, user_email="a@example.com", date="2026-05-20")
+    assert load_rollups() is None
+    assert logger.get_metrics_rollups()["per_user"] == {"user_resumes_screened": {"a@example.com": 2}}
+
+    logger.snapshot_metrics()
+    logger.update_metrics_summary("user_resumes_screened", 1, user_email="b@example.com", date="2026-05-20")
+    assert load_rollups()["per_user"] == {"user_resumes_screened": {"a@example.com": 2}}
+    assert logger.get_metrics_rollups()["daily"] == {"user_resumes_screened": {"2026-05-20": 3}}
+    logger.snapshot_metrics()
+
+
+def test_rebuild_command_recomputes_rollups_from_the_store():
+    logger.update_metrics_summary("total_resumes_screened", 4, date="2026-05-20")
+    logger.snapshot_metrics()
+    os.remove(METRICS_ROLLUPS_FILE)
+
+    assert main(["rebuild"]) == 0
+    assert load_rollups()["daily"] == {"total_resumes_screened": {"2026-05-20": 4}}
+    assert main([]) == 2
+
+
+def test_concurrent_processes_do_not_lose_rollup_increments():
+    code = (
+        "from utils import logger\n"
+        "for _ in range(50):\n"
+        "    logger.update_metrics_summary('user_resumes_screened', 1, user_email='a@example.com', date='2026-05-20')\n"
+        "    logger.snapshot_metrics()\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    processes = [subprocess.Popen([sys.executable, "-c", code], env=env) for _ in range(4)]
+    assert [process.wait(timeout=60) for process in processes] == [0] * 4
+    assert load_rollups()["per_user"] == {"user_resumes_screened": {"a@example.com": 200}}
@@ -0,0 +1,63 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+from utils import scoring
+
+
+@pytest.fixture
+def counting_loader(monkeypatch):
+    """Replaces load_models with a slow loader that counts its calls, and resets the shared state."""
+    calls = []
+
+    def load_models():
+        calls.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return "encoder", "relevance model"
+
+    monkeypatch.setattr(scoring, "load_models", load_models)
+    monkeypatch.setattr(scoring, "_models", None)
+    monkeypatch.setattr(scoring, "_warmup_thread", None)
+    return calls
+
+
+def test_concurrent_callers_share_one_load(counting_loader):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(scoring.get_models())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(counting_loader) == 1
+    assert results == [("encoder", "relevance model")] * 8
+
+
+def test_warmup_starts_at_most_one_thread(counting_loader):
+    warmup_thread = scoring.start_model_warmup()
+    assert scoring.start_model_warmup() is warmup_thread
+    warmup_thread.join()
+    assert scoring.get_models() == ("encoder", "relevance model")
+    assert counting_loader == ["model-warmup"]
+
+
+def test_failed_encoder_load_is_retried(monkeypatch):
+    attempts = []
+
+    def load_encoder(model_name):
+        attempts.append(model_name)
+        if len(attempts) == 1:
+            raise OSError("download failed")
+        return "encoder"
+
+    monkeypatch.setattr(scoring, "load_encoder", load_encoder)
+    monkeypatch.setattr(scoring, "_encoder", None)
+    assert scoring.get_encoder() is None
+    assert scoring.get_encoder() == "encoder"
+    assert scoring.get_encoder() == "encoder"
+    assert len(attempts) == 2
@@ -0,0 +1,33 @@
+import signal
+import time
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+
+from utils import pdf_extraction
+from utils.pdf_extraction import extract_texts_parallel
+
+
+def test_empty_batch():
+    assert extract_texts_parallel([]) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_bad_files_are_reported_in_upload_order(max_workers):
+    pdf_files = [(f"resume_{i}.pdf", b"not a pdf " + str(i).encode()) for i in range(3)]
+    results = extract_texts_parallel(pdf_files, max_workers=max_workers, timeout=30)
+    assert [result["file_name"] for result in results] == ["resume_0.pdf", "resume_1.pdf", "resume_2.pdf"]
+    for result in results:
+        assert result["text"] is None
+        assert result["error"]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="timeouts are enforced with SIGALRM")
+def test_single_worker_extraction_is_timed_out(monkeypatch):
+    monkeypatch.setattr(pdf_extraction.pdfplumber, "open", lambda stream: time.sleep(5))
+    start = time.monotonic()
+    results = extract_texts_parallel([("slow.pdf", b"%PDF-1.4")], max_workers=1, timeout=0.2)
+    assert time.monotonic() - start < 2
+    assert results[0]["text"] is None and results[0]["error"] == "Timed out after 0.2 seconds"
+    assert signal.getsignal(signal.SIGALRM) is signal.SIG_DFL
@@ -0,0 +1,43 @@
+import os
+import time
+
+from utils import resume_cache
+from utils.resume_cache import cache_resume, enforce_cache_limit, get_cached_resume, pdf_hash
+
+
+def test_cache_roundtrip_merges_fields_and_embeddings():
+    digest = pdf_hash(b"%PDF-1.4 resume")
+    assert get_cached_resume(digest) is None
+
+    cache_resume(digest, {"text": "python developer", "embeddings": {"minilm": [0.1, 0.2]}})
+    cache_resume(digest, {"years_experience": 4, "embeddings": {"onnx": [0.3]}})
+
+    entry = get_cached_resume(digest)
+    assert entry["text"] == "python developer"
+    assert entry["years_experience"] == 4
+    assert entry["embeddings"] == {"minilm": [0.1, 0.2], "onnx": [0.3]}
+
+
+def test_corrupted_entry_is_a_miss_and_gets_overwritten():
+    digest = pdf_hash(b"broken")
+    os.makedirs(resume_cache.RESUME_CACHE_DIR)
+    with open(os.path.join(resume_cache.RESUME_CACHE_DIR, f"{digest}.json"), "w") as f:
+        f.write("{not json")
+    assert get_cached_resume(digest) is None
+
+    cache_resume(digest, {"text": "fixed"})
+    assert get_cached_resume(digest)["text"] == "fixed"
+
+
+def test_enforce_cache_limit_evicts_least_recently_used_entries():
+    digests = [pdf_hash(str(i).encode()) for i in range(4)]
+    for i, digest in enumerate(digests):
+        cache_resume(digest, {"text": "x" * 1000})
+        path = os.path.join(resume_cache.RESUME_CACHE_DIR, f"{digest}.json")
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+    entry_size = os.path.getsize(os.path.join(resume_cache.RESUME_CACHE_DIR, f"{digests[0]}.json"))
+
+    enforce_cache_limit(max_bytes=entry_size * 3)
+
+    remaining = [get_cached_resume(digest) is not None for digest in digests]
+    assert remaining == [False, False, True, True]
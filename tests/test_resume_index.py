@@ -0,0 +1,139 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils import resume_index
+from utils.resume_index import (
+    QUERY_MODE_AND, QUERY_MODE_OR, add_resumes, get_resume_index, phrase_matches, search_index, tokenize
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RESUMES = [
+    ("doc1", "alice.pdf", "Python developer. Machine learning with Python and SQL."),
+    ("doc2", "bob.pdf", "Java developer; some machine work, learning Python."),
+    ("doc3", "carol.pdf", "C++ and C# engineer, Node.js services, SQL."),
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    """Each test starts without an in-memory index (its working directory has no index files either)."""
+    monkeypatch.setattr(resume_index, "_index", None)
+    monkeypatch.setattr(resume_index, "_index_state", None)
+
+
+def _forget_in_memory_index():
+    resume_index._index = None
+    resume_index._index_state = None
+
+
+def test_tokenize_keeps_skill_spellings_together():
+    assert [term for term, _ in tokenize("C++, C#, Node.js and ASP.NET.")] == ["c++", "c#", "node.js", "and", "asp.net"]
+
+
+def test_offsets_index_the_original_text_when_lowercasing_changes_its_length():
+    text = "İstanbul office; Python and SQL"
+    assert [(term, text[start:start + len(term)]) for term, start in tokenize(text) if term in ("python", "sql")] == [("python", "Python"), ("sql", "SQL")]
+    add_resumes([("doc1", "deniz.pdf", text)])
+    index = get_resume_index()
+    assert [text[start:end] for start, end in phrase_matches(index, "İstanbul office")["doc1"]] == ["İstanbul office"]
+    assert [text[start:end] for start, end in phrase_matches(index, "python")["doc1"]] == ["Python"]
+
+
+def test_phrase_matches_return_char_spans_of_whole_phrases():
+    add_resumes(RESUMES)
+    index = get_resume_index()
+    text = RESUMES[0][2]
+    assert phrase_matches(index, "machine learning") == {"doc1": [(text.index("Machine"), text.index(" with"))]}
+    assert [text[start:end] for start, end in phrase_matches(index, "python")["doc1"]] == ["Python", "Python"]
+    assert set(phrase_matches(index, "python")) == {"doc1", "doc2"}
+    assert phrase_matches(index, "python", doc_ids={"doc2"}).keys() == {"doc2"}
+    assert phrase_matches(index, "learning machine") == {}
+    assert phrase_matches(index, "rust") == {}
+
+
+def test_search_index_and_or_modes():
+    add_resumes(RESUMES)
+    index = get_resume_index()
+    assert set(search_index(index, ["python", "sql"], QUERY_MODE_AND)) == {"doc1"}
+    assert set(search_index(index, ["python", "sql"], QUERY_MODE_OR)) == {"doc1", "doc2", "doc3"}
+    assert set(search_index(index, ["c++", "node.js"])) == {"doc3"}
+    assert search_index(index, []) == {}
+
+
+def test_resumes_are_indexed_once_and_survive_a_reload():
+    assert add_resumes(RESUMES[:2]) == 2
+    assert add_resumes(RESUMES) == 1
+    _forget_in_memory_index()
+    index = get_resume_index()
+    assert sorted(index["docs"]) == ["doc1", "doc2", "doc3"]
+    assert index["total_tokens"] == sum(len(tokenize(text)) for _, _, text in RESUMES)
+
+
+def test_log_is_compacted_into_a_snapshot(monkeypatch):
+    monkeypatch.setattr(resume_index, "RESUME_INDEX_COMPACT_BYTES", 1)
+    add_resumes(RESUMES[:1])
+    assert os.path.exists(resume_index.RESUME_INDEX_FILE)
+    assert os.path.getsize(resume_index.RESUME_INDEX_LOG_FILE) == 0
+    monkeypatch.setattr(resume_index, "RESUME_INDEX_COMPACT_BYTES", 64 * 1024 * 1024)
+    add_resumes(RESUMES[1:])
+
+    _forget_in_memory_index()
+    assert sorted(get_resume_index()["docs"]) == ["doc1", "doc2", "doc3"]
+
+
+def test_concurrent_processes_do_not_drop_each_others_resumes():
+    code = (
+        "import os\n"
+        "from utils import resume_index\n"
+        "resume_index.RESUME_INDEX_COMPACT_BYTES = 4096\n"
+        "for i in range(20):\n"
+        "    resume_index.add_resumes([(f'{os.getpid()}-{i}', 'r.pdf', 'python developer with sql')])\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    processes = [subprocess.Popen([sys.executable, "-c", code], env=env) for _ in range(4)]
+    assert [process.wait(timeout=60) for process in processes] == [0] * 4
+
+    index = get_resume_index()
+    assert len(index["docs"]) == 80
+    assert index["total_tokens"] == 80 * 4
+    assert len(index["postings"]["python"]) == 80
+
+
+def test_bm25_ranks_rarer_and_more_frequent_matches_first():
+    add_resumes([
+        ("many", "many.pdf", "python python python sql"),
+        ("once", "once.pdf", "python sql " + "filler " * 20),
+        ("rare", "rare.pdf", "kubernetes python"),
+        ("none", "none.pdf", "accounting and payroll"),
+    ])
+    index = get_resume_index()
+
+    ranked = resume_index.rank_results(index, search_index(index, ["python"], QUERY_MODE_OR))
+    assert [doc_id for doc_id, _ in ranked] == ["many", "rare", "once"]
+    # A match on the rarer term outweighs one on the common term
+    ranked = resume_index.rank_results(index, search_index(index, ["kubernetes", "sql"], QUERY_MODE_OR))
+    assert ranked[0][0] == "rare"
+    assert all(score > 0 for _, score in ranked)
+
+
+def test_rank_results_keeps_only_the_top_k():
+    add_resumes([(f"doc{i}", "r.pdf", "python " * (i + 1) + "sql") for i in range(10)])
+    index = get_resume_index()
+    ranked = resume_index.rank_results(index, search_index(index, ["python"]), top_k=3)
+    assert [doc_id for doc_id, _ in ranked] == ["doc9", "doc8", "doc7"]
+    assert resume_index.rank_results(index, {}) == []
+
+
+def test_reciprocal_rank_fusion_uses_ranks_not_scores():
+    keyword_ranking = [("a", 12.5), ("b", 7.0), ("c", 0.5)]
+    semantic_ranking = [("c", 0.91), ("a", 0.90), ("d", 0.10)]
+    fused = resume_index.reciprocal_rank_fusion([keyword_ranking, semantic_ranking], k=60)
+    assert [doc_id for doc_id, _ in fused] == ["a", "c", "b", "d"]
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+    assert fused[2][1] == pytest.approx(1 / 62)
+    assert resume_index.reciprocal_rank_fusion([keyword_ranking, semantic_ranking], top_k=2) == fused[:2]
+    assert resume_index.reciprocal_rank_fusion([]) == []
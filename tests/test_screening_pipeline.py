@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pdfplumber")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+from utils.features import FEATURE_FINGERPRINT
+from utils.resume_cache import cache_resume, get_cached_resume, pdf_hash
+from utils.scoring import EMBEDDING_CACHE_KEY
+from utils.screening_pipeline import screen_resumes
+
+JD = "Data scientist: Python, SQL and machine learning"
+PDF_BYTES = b"%PDF-1.4 cached resume"
+
+
+class FixedModel:
+    def predict(self, features):
+        return 40 + 10 * np.asarray(features)[:, -1]
+
+
+def _cache_parsed_resume(fake_encoder, skills, skills_fingerprint):
+    cache_resume(pdf_hash(PDF_BYTES), {
+        "text": "Jane Doe\nPython and SQL analyst building machine learning models",
+        "years_experience": 3,
+        "years_experience_date": datetime.now().strftime("%Y-%m-%d"),
+        "email": "jane@example.com",
+        "phone": None,
+        "skills": skills,
+        "skills_fingerprint": skills_fingerprint,
+        "embeddings": {EMBEDDING_CACHE_KEY: [0.0] * fake_encoder.dim}
+    })
+
+
+def test_cached_skills_from_the_current_skill_filter_are_reused(fake_encoder):
+    _cache_parsed_resume(fake_encoder, ["cobol"], FEATURE_FINGERPRINT)
+    screened, failures = screen_resumes([("jane.pdf", PDF_BYTES)], JD, ["python"], 0, 0, fake_encoder, FixedModel())
+    assert failures == [] and len(screened) == 1
+    assert get_cached_resume(pdf_hash(PDF_BYTES))["skills"] == ["cobol"]
+
+
+def test_cached_skills_from_another_skill_filter_are_recomputed(fake_encoder):
+    _cache_parsed_resume(fake_encoder, ["cobol"], "v0-0000000000000000")
+    screen_resumes([("jane.pdf", PDF_BYTES)], JD, ["python"], 0, 0, fake_encoder, FixedModel())
+    entry = get_cached_resume(pdf_hash(PDF_BYTES))
+    assert entry["skills_fingerprint"] == FEATURE_FINGERPRINT
+    assert "cobol" not in entry["skills"] and "python" in entry["skills"]
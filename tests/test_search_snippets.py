@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+import search # Only defines the page and injects its CSS on import
+
+HIGHLIGHT = "<span class='highlight'>{}</span>"
+
+
+def test_overlapping_hits_merge_into_one_highlight():
+    content = "Worked on machine learning pipelines."
+    start = content.index("machine")
+    snippets = search._keyword_snippets(content, {
+        "machine learning": [(start, start + len("machine learning"))],
+        "learning": [(content.index("learning"), content.index(" pipelines"))]
+    })
+    assert snippets == [f"Worked on {HIGHLIGHT.format('machine learning')} pipelines."]
+
+
+def test_nearby_hits_share_one_snippet_and_far_hits_get_their_own():
+    content = "python and sql" + " filler" * 100 + " python again"
+    far_start = content.rindex("python")
+    snippets = search._keyword_snippets(content, {
+        "python": [(0, 6), (far_start, far_start + 6)],
+        "sql": [(11, 14)]
+    })
+    assert len(snippets) == 2
+    assert snippets[0].startswith(f"{HIGHLIGHT.format('python')} and {HIGHLIGHT.format('sql')}")
+    assert snippets[1].endswith(f"{HIGHLIGHT.format('python')} again")
+
+
+def test_snippet_count_is_capped():
+    content = ("python" + " " * 300) * (search.MAX_SNIPPETS_PER_RESULT + 3)
+    spans = [(start, start + 6) for start in range(0, len(content), 306)]
+    snippets = search._keyword_snippets(content, {"python": spans})
+    assert len(snippets) == search.MAX_SNIPPETS_PER_RESULT + 1
+    assert snippets[-1] == "(+3 more matching passages)"
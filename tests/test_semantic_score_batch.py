@@ -0,0 +1,55 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+from utils.scoring import semantic_score, semantic_score_batch
+
+JD = "Data scientist: Python, SQL, machine learning and statistics"
+RESUMES = [
+    "Python and SQL analyst, built machine learning models",
+    "Retail store manager",
+    "Statistics PhD, machine learning research in Python",
+]
+YEARS = [4, 1, 6]
+
+
+class FixedModel:
+    """Relevance model stub: predicts a score from the keyword overlap feature (last column)."""
+
+    def predict(self, features):
+        return 40 + 10 * np.asarray(features)[:, -1]
+
+
+def test_batch_matches_per_resume_scores(fake_encoder):
+    expected = [semantic_score(resume_text, JD, years, fake_encoder, FixedModel()) for resume_text, years in zip(RESUMES, YEARS)]
+    results = semantic_score_batch(RESUMES, JD, YEARS, fake_encoder, FixedModel())
+    assert len(results) == len(expected)
+    for (score, _, similarity), (expected_score, _, expected_similarity) in zip(results, expected):
+        # float32 batch arithmetic may differ from the single-row path in the last rounded digit
+        assert score == pytest.approx(expected_score, abs=0.011)
+        assert similarity == pytest.approx(expected_similarity, abs=0.011)
+
+
+def test_batch_encodes_jd_once_and_resumes_in_one_call(fake_encoder):
+    semantic_score_batch(RESUMES, JD, YEARS, fake_encoder, FixedModel())
+    assert [len(texts) for texts in fake_encoder.calls] == [1, len(RESUMES)]
+
+
+def test_missing_models_fall_back_to_keyword_scores():
+    results = semantic_score_batch(RESUMES, JD, YEARS, None, None)
+    assert len(results) == len(RESUMES)
+    assert all(similarity == 0.0 for _, _, similarity in results)
+    assert semantic_score_batch([], JD, [], None, None) == []
+
+
+def test_computed_resume_features_are_handed_back_for_caching(fake_encoder):
+    resume_embeddings = [fake_encoder.encode(["cached"])[0], None, None]
+    fake_encoder.calls.clear()
+    computed = {}
+    semantic_score_batch(RESUMES, JD, YEARS, fake_encoder, FixedModel(), resume_embeddings=resume_embeddings, computed=computed)
+    assert [len(texts) for texts in fake_encoder.calls] == [1, 2]
+    assert resume_embeddings[1:] == [None, None]
+    assert len(computed["resume_embeddings"]) == len(RESUMES) and len(computed["resume_skill_sets"]) == len(RESUMES)
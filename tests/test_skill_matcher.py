@@ -0,0 +1,49 @@
+import random
+import re
+
+from utils.skill_matcher import build_skill_automaton, extract_skills, find_skill_spans
+
+SKILLS = [
+    "python", "java", "javascript", "c++", "c#", "machine learning", "learning", "deep learning",
+    "sql", "nosql", "node.js", "react", "react native", "aws", "data analysis", "analysis", "go"
+]
+FILLER = ["experience", "with", "and", "in", "using", "built", "team", "the", "a", "of", "years", "-", ",", "."]
+
+
+def regex_extract(skills, text):
+    """The per-skill \\b...\\b loop the automaton replaced (longest phrases first, matches blanked out)."""
+    found = set()
+    for skill in sorted({skill.lower() for skill in skills}, key=len, reverse=True):
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text):
+            found.add(skill)
+            text = re.sub(pattern, " ", text)
+    return found
+
+
+def test_extract_skills_matches_regex_loop_on_random_texts():
+    automaton = build_skill_automaton(SKILLS)
+    rng = random.Random(0)
+    for _ in range(500):
+        words = [rng.choice(SKILLS) if rng.random() < 0.4 else rng.choice(FILLER) for _ in range(rng.randint(1, 30))]
+        text = " ".join(words)
+        assert extract_skills(automaton, text) == regex_extract(SKILLS, text), text
+
+
+def test_longer_phrase_claims_its_words():
+    automaton = build_skill_automaton(SKILLS)
+    assert extract_skills(automaton, "deep learning and machine learning") == {"deep learning", "machine learning"}
+    assert extract_skills(automaton, "learning react native") == {"learning", "react native"}
+
+
+def test_matches_require_word_boundaries():
+    automaton = build_skill_automaton(SKILLS)
+    assert extract_skills(automaton, "golang javascripts pythonic") == set()
+    assert extract_skills(automaton, "go, java.") == {"go", "java"}
+    assert find_skill_spans(automaton, "sql nosql") == [(0, 3), (4, 9)]
+
+
+def test_skills_are_matched_case_insensitively_and_deduplicated():
+    automaton = build_skill_automaton(["Python", "python ", "SQL"])
+    assert automaton["patterns"] == {"python", "sql"}
+    assert extract_skills(automaton, "python and sql") == {"python", "sql"}
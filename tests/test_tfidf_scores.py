@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from utils.scoring import TFIDF_MODE_BATCH, TFIDF_MODE_PAIRWISE, tfidf_similarity_scores
+
+JD = "Senior Python developer with Django, PostgreSQL and AWS experience"
+RESUMES = [
+    "Python developer, five years of Django and PostgreSQL on AWS",
+    "Registered nurse working night shifts in the emergency room",
+    "Java developer who also writes some Python",
+]
+
+
+def test_single_resume_batch_matches_pairwise():
+    # With one resume both modes fit the vectorizer on the same two documents
+    for resume_text in RESUMES:
+        assert tfidf_similarity_scores(JD, [resume_text], mode=TFIDF_MODE_BATCH) == \
+            tfidf_similarity_scores(JD, [resume_text], mode=TFIDF_MODE_PAIRWISE)
+
+
+def test_batch_scores_keep_order_and_rank_like_pairwise():
+    batch = tfidf_similarity_scores(JD, RESUMES, mode=TFIDF_MODE_BATCH)
+    pairwise = tfidf_similarity_scores(JD, RESUMES, mode=TFIDF_MODE_PAIRWISE)
+    assert len(batch) == len(RESUMES)
+    assert sorted(range(len(RESUMES)), key=batch.__getitem__) == sorted(range(len(RESUMES)), key=pairwise.__getitem__)
+    assert batch[1] == 0.0
+    assert tfidf_similarity_scores(JD, [JD, JD])[0] == pytest.approx(100.0)
+
+
+def test_precomputed_jd_terms_match_raw_jd_text():
+    analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+    jd_terms = {}
+    for term in analyzer(JD):
+        jd_terms[term] = jd_terms.get(term, 0) + 1
+    assert tfidf_similarity_scores(JD, RESUMES, jd_terms=jd_terms) == tfidf_similarity_scores(JD, RESUMES)
+
+
+def test_empty_input_and_unscorable_texts():
+    assert tfidf_similarity_scores(JD, []) == []
+    # Only stop words: the vectorizer has an empty vocabulary, which is reported as zero similarity
+    assert tfidf_similarity_scores("the and of", ["a the"]) == [0.0]
+    assert tfidf_similarity_scores("the and of", ["a the"], mode=TFIDF_MODE_PAIRWISE) == [0.0]
@@ -0,0 +1,129 @@
+import json
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("nltk")
+
+import train_model
+from utils import features
+
+RECORDS = [
+    {"jd_text": "Data scientist: Python and SQL", "resume_text": "Python analyst", "relevance_score": 80.0},
+    {"jd_text": "Data scientist: Python and SQL", "resume_text": "Retail manager", "relevance_score": 10.0},
+    {"jd_text": "Java backend engineer", "resume_text": "Java and Spring developer", "relevance_score": 85.0},
+    {"jd_text": "Java backend engineer", "resume_text": "Python analyst", "relevance_score": 30.0},
+    {"jd_text": "Data scientist: Python and SQL", "resume_text": "SQL reporting", "relevance_score": 55.0},
+]
+
+
+@pytest.fixture
+def training_file(tmp_path):
+    path = tmp_path / "pairs.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in RECORDS), encoding="utf-8")
+    return str(path)
+
+
+def test_cache_key_covers_data_encoder_and_feature_fingerprint(monkeypatch):
+    key = train_model.dataset_cache_key(RECORDS, "all-MiniLM-L6-v2")
+    assert key == train_model.dataset_cache_key(iter(RECORDS), "all-MiniLM-L6-v2")
+    assert key != train_model.dataset_cache_key(RECORDS, "all-MiniLM-L6-v2:onnx")
+    assert key != train_model.dataset_cache_key(RECORDS[:-1], "all-MiniLM-L6-v2")
+    assert key != train_model.dataset_cache_key([dict(RECORDS[0], relevance_score=81.0)] + RECORDS[1:], "all-MiniLM-L6-v2")
+    monkeypatch.setattr(features, "FEATURE_VERSION", features.FEATURE_VERSION + 1)
+    monkeypatch.setattr(train_model, "FEATURE_FINGERPRINT", features.feature_fingerprint(features._skill_filter()))
+    assert key != train_model.dataset_cache_key(RECORDS, "all-MiniLM-L6-v2")
+
+
+def test_cache_key_changes_with_the_skill_filter(monkeypatch):
+    key = train_model.dataset_cache_key(RECORDS, "all-MiniLM-L6-v2")
+    monkeypatch.setattr(train_model, "FEATURE_FINGERPRINT", features.feature_fingerprint(set(features._skill_filter()) | {"cobol"}))
+    assert key != train_model.dataset_cache_key(RECORDS, "all-MiniLM-L6-v2")
+
+
+def test_cached_features_roundtrip_memory_mapped():
+    assert train_model.load_cached_features("missing") is None
+    X = np.arange(12, dtype=np.float32).reshape(4, 3)
+    y = np.array([1, 2, 3, 4], dtype=np.float32)
+    train_model.save_cached_features("key", X, y)
+    X_loaded, y_loaded = train_model.load_cached_features("key")
+    assert isinstance(X_loaded, np.memmap)
+    assert (X_loaded == X).all() and (y_loaded == y).all()
+    assert not [name for name in os.listdir(train_model.FEATURE_CACHE_DIR) if name.endswith(".tmp")]
+
+
+def test_training_file_is_featurized_in_chunks_and_cached(training_file, fake_encoder, monkeypatch):
+    monkeypatch.setattr(train_model, "load_encoder", lambda model_name: fake_encoder)
+    X, y = train_model.featurize_training_file(training_file, "key", chunk_size=2)
+
+    assert X.shape == (len(RECORDS), 2 * fake_encoder.dim + 2)
+    assert y.tolist() == [record["relevance_score"] for record in RECORDS]
+    # Two distinct JDs across three chunks: each is encoded once, then served from the memo
+    jd_texts = {record["jd_text"].lower() for record in RECORDS}
+    assert sum(1 for texts in fake_encoder.calls for text in texts if text in jd_texts) == 2
+    assert sorted(os.listdir(train_model.FEATURE_CACHE_DIR)) == ["key.X.npy", "key.y.npy"]
+
+
+def test_halving_search_fits_and_reports_each_round(capsys):
+    from sklearn.tree import DecisionTreeRegressor
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(90, 4))
+    y = X[:, 0] * 3 + rng.normal(scale=0.1, size=90)
+
+    search = train_model.build_search(DecisionTreeRegressor(random_state=0), {"max_depth": [1, 2, 4, 8], "min_samples_leaf": [1, 5]}, train_model.SEARCH_MODE_HALVING)
+    assert type(search).__name__ == "HalvingGridSearchCV"
+    search.fit(X, y)
+    train_model.print_search_timings(search, 1.0)
+
+    output = capsys.readouterr().out
+    assert "round 0" in output and f"round {search.n_iterations_ - 1}" in output
+    assert type(train_model.build_search(DecisionTreeRegressor(), {"max_depth": [1]})).__name__ == "GridSearchCV"
+
+
+def test_select_model_prefers_the_fastest_model_within_the_r2_tolerance():
+    candidates = [
+        ("random_forest", None, {"r2": 0.900, "predict_single_ms": 9.0}),
+        ("hist_gradient_boosting", None, {"r2": 0.895, "predict_single_ms": 1.0}),
+        ("other", None, {"r2": 0.800, "predict_single_ms": 0.1}),
+    ]
+    assert train_model.select_model(candidates)[0] == "hist_gradient_boosting"
+    candidates[1][2]["r2"] = 0.85
+    assert train_model.select_model(candidates)[0] == "random_forest"
+
+
+def _quick_candidate(model_type, X_train, y_train, X_test, y_test, search_mode):
+    from sklearn.tree import DecisionTreeRegressor
+    model = DecisionTreeRegressor(max_depth=2, random_state=0).fit(X_train, y_train)
+    return model, {"model_type": model_type, "estimator": model_type, "mse": 0.0, "r2": 0.5}
+
+
+def test_main_saves_the_chosen_model_and_removes_candidate_files(training_file, fake_encoder, monkeypatch):
+    monkeypatch.setattr(train_model, "load_encoder", lambda model_name: fake_encoder)
+    monkeypatch.setattr(train_model, "train_candidate", _quick_candidate)
+
+    assert train_model.main(["--data", training_file, "--model", train_model.MODEL_TYPE_COMPARE]) == 0
+
+    with open(train_model.MODEL_METRICS_PATH, encoding="utf-8") as f:
+        metrics = json.load(f)
+    assert metrics["model_type"] in train_model.MODEL_TYPES
+    assert [candidate["model_type"] for candidate in metrics["candidates"]] == list(train_model.MODEL_TYPES)
+    assert metrics["model_size_bytes"] == os.path.getsize(train_model.MODEL_SAVE_PATH)
+    assert not [name for name in os.listdir(".") if name.endswith(".tmp")]
+
+
+def test_failed_training_leaves_no_temp_files(training_file, fake_encoder, monkeypatch):
+    def fail_second_candidate(model_type, *args):
+        if model_type == train_model.MODEL_TYPES[1]:
+            raise MemoryError("out of memory")
+        return _quick_candidate(model_type, *args)
+
+    monkeypatch.setattr(train_model, "load_encoder", lambda model_name: fake_encoder)
+    monkeypatch.setattr(train_model, "train_candidate", fail_second_candidate)
+
+    with pytest.raises(MemoryError):
+        train_model.main(["--data", training_file])
+    assert not os.path.exists(train_model.MODEL_SAVE_PATH)
+    assert not [name for name in os.listdir(".") if name.endswith(".tmp")]
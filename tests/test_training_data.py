@@ -0,0 +1,76 @@
+import csv
+import json
+
+import pytest
+
+from utils.training_data import iter_training_chunks, iter_training_records
+
+
+def _write_jsonl(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    return str(path)
+
+
+def test_bad_jsonl_rows_are_skipped_and_counted(tmp_path):
+    path = _write_jsonl(tmp_path / "pairs.jsonl", [
+        json.dumps({"jd_text": "jd", "resume_text": "resume", "relevance_score": 70}),
+        "{not json",
+        "",
+        json.dumps({"jd_text": "jd", "resume_text": "resume"}),
+        json.dumps({"jd_text": "jd", "resume_text": "  ", "relevance_score": 70}),
+        json.dumps({"jd_text": "jd", "resume_text": "resume", "relevance_score": "high"}),
+        json.dumps({"jd_text": "jd", "resume_text": "resume", "relevance_score": "NaN"}),
+        json.dumps(["jd", "resume", 70]),
+        json.dumps({"jd_text": "jd 2", "resume_text": "resume 2", "relevance_score": "55.5", "extra": 1}),
+    ])
+    stats = {}
+    records = list(iter_training_records(path, stats=stats))
+    assert records == [
+        {"jd_text": "jd", "resume_text": "resume", "relevance_score": 70.0},
+        {"jd_text": "jd 2", "resume_text": "resume 2", "relevance_score": 55.5},
+    ]
+    assert stats == {"rows": 8, "skipped": 6}
+
+
+def test_bad_csv_rows_are_skipped(tmp_path):
+    path = tmp_path / "pairs.csv"
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["jd_text", "resume_text", "relevance_score", "source"])
+        writer.writerow(["jd", "resume\nwith a newline", "80", "ats"])
+        writer.writerow(["jd", "", "80", "ats"])
+        writer.writerow(["jd", "resume", "", "ats"])
+        writer.writerow(["jd", "resume " * 50000, "60", "ats"]) # Longer than csv's default field limit
+    stats = {}
+    records = list(iter_training_records(str(path), stats=stats))
+    assert [record["relevance_score"] for record in records] == [80.0, 60.0]
+    assert records[0]["resume_text"] == "resume\nwith a newline"
+    assert stats == {"rows": 4, "skipped": 2}
+
+
+def test_records_are_grouped_into_chunks(tmp_path):
+    path = _write_jsonl(tmp_path / "pairs.jsonl", [
+        json.dumps({"jd_text": "jd", "resume_text": f"resume {i}", "relevance_score": i}) for i in range(5)
+    ])
+    assert [len(chunk) for chunk in iter_training_chunks(path, chunk_size=2)] == [2, 2, 1]
+
+
+def test_unsupported_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported"):
+        list(iter_training_records(str(tmp_path / "pairs.xlsx")))
+
+
+def test_parquet_rows_are_read_in_batches(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pa.table({
+        "jd_text": ["jd"] * 5,
+        "resume_text": ["resume", None, "resume", "resume", "resume"],
+        "relevance_score": [10.0, 20.0, None, 40.0, 50.0],
+        "source": ["ats"] * 5,
+    })
+    path = str(tmp_path / "pairs.parquet")
+    pq.write_table(table, path)
+    stats = {}
+    assert [record["relevance_score"] for record in iter_training_records(path, chunk_size=2, stats=stats)] == [10.0, 40.0, 50.0]
+    assert stats == {"rows": 5, "skipped": 2}
@@ -0,0 +1,108 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from utils import vector_index
+from utils.vector_index import add_vectors, get_vector_index, search_vectors
+
+ENCODER_KEY = "all-MiniLM-L6-v2"
+DIM = 384
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def fresh_vector_index(monkeypatch):
+    monkeypatch.setattr(vector_index, "_vector_index", None)
+    monkeypatch.setattr(vector_index, "_vector_index_stat", None)
+
+
+def _clustered_vectors(num_vectors, num_clusters=40, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(num_clusters, DIM))
+    return (centers[rng.integers(num_clusters, size=num_vectors)] + 0.3 * rng.normal(size=(num_vectors, DIM))).astype(np.float32)
+
+
+def _brute_force(vectors, query, top_k):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    similarities = normalized @ (query / np.linalg.norm(query))
+    return [f"doc{row}" for row in np.argsort(-similarities)[:top_k]]
+
+
+def test_flat_index_search_is_exact():
+    vectors = _clustered_vectors(300)
+    add_vectors([f"doc{row}" for row in range(300)], vectors, ENCODER_KEY)
+    index = get_vector_index(ENCODER_KEY)
+    assert index["trained_size"] == 0
+    query = vectors[7] + 0.1
+    results = search_vectors(index, query, top_k=10)
+    assert [doc_id for doc_id, _ in results] == _brute_force(vectors, query, 10)
+    assert results[0][1] >= results[-1][1]
+
+
+def test_ivf_recall_against_brute_force(monkeypatch):
+    monkeypatch.setattr(vector_index, "IVF_MIN_VECTORS", 1000)
+    vectors = _clustered_vectors(2000)
+    add_vectors([f"doc{row}" for row in range(2000)], vectors, ENCODER_KEY)
+    index = get_vector_index(ENCODER_KEY)
+    assert index["trained_size"] == 2000
+
+    rng = np.random.default_rng(1)
+    recalls = []
+    for row in rng.choice(2000, size=20, replace=False):
+        query = vectors[row] + 0.1 * rng.normal(size=DIM).astype(np.float32)
+        found = {doc_id for doc_id, _ in search_vectors(index, query, top_k=10)}
+        recalls.append(len(found & set(_brute_force(vectors, query, 10))) / 10)
+    assert np.mean(recalls) >= 0.9
+
+
+def test_inverted_lists_cover_every_row_once(monkeypatch):
+    monkeypatch.setattr(vector_index, "IVF_MIN_VECTORS", 400)
+    add_vectors([f"doc{row}" for row in range(400)], _clustered_vectors(400), ENCODER_KEY)
+    add_vectors([f"new{row}" for row in range(50)], _clustered_vectors(50, seed=2), ENCODER_KEY) # Assigned, not retrained
+    index = get_vector_index(ENCODER_KEY)
+    assert index["trained_size"] == 400 and len(index["assignments"]) == 450
+    assert sorted(index["list_rows"].tolist()) == list(range(450))
+    for cluster in range(len(index["centroids"])):
+        rows = index["list_rows"][index["list_offsets"][cluster]:index["list_offsets"][cluster + 1]]
+        assert (index["assignments"][rows] == cluster).all()
+
+
+def test_scoped_search_only_scores_the_given_documents(monkeypatch):
+    monkeypatch.setattr(vector_index, "IVF_MIN_VECTORS", 400)
+    vectors = _clustered_vectors(400)
+    add_vectors([f"doc{row}" for row in range(400)], vectors, ENCODER_KEY)
+    results = search_vectors(get_vector_index(ENCODER_KEY), vectors[0], top_k=10, doc_ids={"doc5", "doc9", "unknown"})
+    assert sorted(doc_id for doc_id, _ in results) == ["doc5", "doc9"]
+
+
+def test_index_is_persisted_and_keyed_by_encoder():
+    vectors = _clustered_vectors(20)
+    assert add_vectors([f"doc{row}" for row in range(20)], vectors, ENCODER_KEY) == 20
+    assert add_vectors(["doc0", "doc20"], vectors[:2], ENCODER_KEY) == 1
+    assert os.path.exists(vector_index.VECTOR_INDEX_FILE)
+
+    vector_index._vector_index = None
+    index = get_vector_index(ENCODER_KEY)
+    assert len(index["vectors"]) == 21 and index["row_by_doc_id"]["doc20"] == 20
+    assert len(get_vector_index(f"{ENCODER_KEY}:onnx")["vectors"]) == 0
+
+
+def test_concurrent_processes_keep_each_others_vectors():
+    code = (
+        "import os\n"
+        "import numpy as np\n"
+        "from utils.vector_index import add_vectors\n"
+        "rng = np.random.default_rng(os.getpid())\n"
+        "for batch in range(10):\n"
+        f"    add_vectors([f'{{os.getpid()}}-{{batch}}-{{i}}' for i in range(5)], rng.normal(size=(5, {DIM})), {ENCODER_KEY!r})\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    processes = [subprocess.Popen([sys.executable, "-c", code], env=env) for _ in range(4)]
+    assert [process.wait(timeout=60) for process in processes] == [0] * 4
+
+    index = get_vector_index(ENCODER_KEY)
+    assert len(index["vectors"]) == len(set(index["doc_ids"].tolist())) == 200
@@ -0,0 +1,148 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+from utils.jd_artifacts import get_jd_artifact
+from utils.logger import log_system_event
+from utils.pdf_extraction import DEFAULT_MAX_WORKERS
+from utils.scoring import EMBEDDING_BATCH_SIZE, TFIDF_MODE_BATCH, TFIDF_MODE_PAIRWISE, get_models
+from utils.screening_pipeline import screen_resumes
+
+# Headless bulk screening, invoked as:
+#   python -m screener batch --jd data/x.txt --resumes dir/ --out results.parquet
+# Uses the same screen_resumes pipeline as the Streamlit screener page, without importing streamlit.
+
+# Resumes are read and scored in chunks of this size so memory stays flat for large directories
+DEFAULT_CHUNK_SIZE = 200
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(prog="python -m screener batch", description="Screen a directory of resume PDFs against a job description.")
+    parser.add_argument("--jd", required=True, help="Path to the job description .txt file")
+    parser.add_argument("--resumes", required=True, help="Directory containing resume PDFs")
+    parser.add_argument("--out", required=True, help="Output file (.parquet or .csv)")
+    parser.add_argument("--required-skills", default="Python, SQL, Data Analysis, Machine Learning", help="Comma-separated required skills")
+    parser.add_argument("--min-experience", type=float, default=2, help="Minimum years of experience required")
+    parser.add_argument("--cutoff", type=float, default=75, help="Minimum similarity score (%%) for shortlisting")
+    parser.add_argument("--tfidf-mode", choices=[TFIDF_MODE_BATCH, TFIDF_MODE_PAIRWISE], default=TFIDF_MODE_BATCH, help="TF-IDF similarity mode")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="PDF extraction worker processes")
+    parser.add_argument("--batch-size", type=int, default=EMBEDDING_BATCH_SIZE, help="Embedding batch size")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Resumes read and scored per chunk")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the on-disk resume cache")
+    return parser
+
+
+def _collect_pdf_paths(resume_dir):
+    """Returns the PDF files directly inside resume_dir, sorted by name."""
+    return sorted(
+        os.path.join(resume_dir, file_name)
+        for file_name in os.listdir(resume_dir)
+        if file_name.lower().endswith(".pdf")
+    )
+
+
+def _result_row(parsed):
+    """Flattens a screened resume into the same columns as the screener page's results table."""
+    return {
+        "Resume Name": parsed["resume_name"],
+        "Candidate Name": parsed["candidate_name"],
+        "Email": parsed["email"] or "N/A",
+        "Phone": parsed["phone"] or "N/A",
+        "Years Experience": parsed["years_experience"],
+        "Score (%)": parsed["similarity_score_percent"],
+        "Matched Skills": ", ".join(parsed["matched_skills"]) if parsed["matched_skills"] else "None",
+        "Missing Skills": ", ".join(parsed["missing_skills"]) if parsed["missing_skills"] else "None",
+        "Predicted Status": parsed["predicted_status"],
+        "Match Level": parsed["match_level"],
+        "Semantic Score": parsed["semantic_score"],
+        "Semantic Similarity": parsed["semantic_similarity"],
+        "Error": None
+    }
+
+
+def _write_results(df_results, out_path):
+    out_dir = os.path.dirname(out_path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    if out_path.lower().endswith(".parquet"):
+        df_results.to_parquet(out_path, index=False)
+    else:
+        df_results.to_csv(out_path, index=False)
+
+
+def main(argv=None):
+    args = _build_parser().parse_args(argv)
+
+    with open(args.jd, "r", encoding="utf-8") as f:
+        jd_text = f.read()
+    required_skills = [skill.strip().lower() for skill in args.required_skills.split(',') if skill.strip()]
+    pdf_paths = _collect_pdf_paths(args.resumes)
+    if not pdf_paths:
+        print(f"No PDF files found in {args.resumes}", file=sys.stderr)
+        return 1
+
+    print("Loading models...", file=sys.stderr)
+    model, ml_model = get_models()
+    if model is None or ml_model is None:
+        print("Warning: models failed to load; semantic scores fall back to keyword overlap.", file=sys.stderr)
+
+    # The JD side (embedding, skills, TF-IDF terms) is computed once and reused from its sidecar artifact
+    jd_artifact = get_jd_artifact(args.jd, model)
+
+    log_system_event("INFO", "BATCH_SCREENING_STARTED", {"jd_file": args.jd, "num_resumes": len(pdf_paths), "tfidf_mode": args.tfidf_mode})
+    rows = []
+    num_failed = 0
+    start_time = time.perf_counter()
+
+    for chunk_start in range(0, len(pdf_paths), args.chunk_size):
+        chunk_paths = pdf_paths[chunk_start:chunk_start + args.chunk_size]
+        pdf_files = []
+        for path in chunk_paths:
+            with open(path, "rb") as f:
+                pdf_files.append((os.path.basename(path), f.read()))
+
+        screened, failures = screen_resumes(
+            pdf_files,
+            jd_text,
+            required_skills,
+            args.min_experience,
+            args.cutoff,
+            model,
+            ml_model,
+            tfidf_mode=args.tfidf_mode,
+            use_cache=not args.no_cache,
+            max_workers=args.workers,
+            batch_size=args.batch_size,
+            jd_artifact=jd_artifact
+        )
+        rows.extend(_result_row(parsed) for parsed in screened)
+        for failure in failures:
+            rows.append({"Resume Name": failure["file_name"], "Predicted Status": "Failed to Parse", "Error": failure["error"]})
+        num_failed += len(failures)
+
+        done = chunk_start + len(chunk_paths)
+        elapsed = time.perf_counter() - start_time
+        print(f"[{done}/{len(pdf_paths)}] screened, {num_failed} failed, {done / elapsed:.2f} resumes/sec", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start_time
+    _write_results(pd.DataFrame(rows), args.out)
+
+    throughput = len(pdf_paths) / elapsed if elapsed > 0 else 0.0
+    print(f"Screened {len(pdf_paths)} resume(s) ({num_failed} failed) in {elapsed:.1f}s: {throughput:.2f} resumes/sec")
+    print(f"Results written to {args.out}")
+    log_system_event("INFO", "BATCH_SCREENING_COMPLETE", {
+        "jd_file": args.jd,
+        "num_resumes": len(pdf_paths),
+        "num_failed": num_failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "resumes_per_second": round(throughput, 3),
+        "output_file": args.out
+    })
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# Pluggable sentence encoders for all-MiniLM-L6-v2.
+#
+# Backends (selected with the SCREENER_ENCODER_BACKEND environment variable):
+#   "torch"     - sentence-transformers on PyTorch (default, reference implementation)
+#   "onnx"      - the same network exported to ONNX, run with onnxruntime (fp32)
+#   "onnx-int8" - the ONNX export with dynamic int8 weight quantization
+#
+# The ONNX backends only need onnxruntime + tokenizers at runtime (no torch), see
+# requirements-onnx.txt. The model files are produced once with:
+#   python -m utils.encoders export
+# and checked against the torch reference with:
+#   python -m utils.encoders verify
+#
+# Tolerance: embeddings are L2-normalised, so parity is measured as the cosine similarity
+# between the ONNX and torch embedding of the same text. "verify" fails if any text falls
+# below ONNX_FP32_MIN_COSINE (fp32) or ONNX_INT8_MIN_COSINE (int8).
+
+ENCODER_BACKEND_TORCH = "torch"
+ENCODER_BACKEND_ONNX = "onnx"
+ENCODER_BACKEND_ONNX_INT8 = "onnx-int8"
+ENCODER_BACKENDS = (ENCODER_BACKEND_TORCH, ENCODER_BACKEND_ONNX, ENCODER_BACKEND_ONNX_INT8)
+
+ENCODER_BACKEND = os.environ.get("SCREENER_ENCODER_BACKEND", ENCODER_BACKEND_TORCH)
+ONNX_MODEL_DIR = os.environ.get("SCREENER_ONNX_MODEL_DIR", os.path.join("models", "all-MiniLM-L6-v2-onnx"))
+ONNX_FP32_FILE = "model.onnx"
+ONNX_INT8_FILE = "model-int8.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+
+# all-MiniLM-L6-v2 truncates inputs at 256 word pieces
+MAX_SEQ_LENGTH = 256
+
+ONNX_FP32_MIN_COSINE = 0.9999
+ONNX_INT8_MIN_COSINE = 0.99
+
+
+class OnnxMiniLMEncoder:
+    """
+    ONNX Runtime implementation of the all-MiniLM-L6-v2 sentence transformer:
+    BERT forward pass, attention-masked mean pooling, then L2 normalisation.
+    encode() mirrors SentenceTransformer.encode for the arguments this app uses.
+    """
+
+    def __init__(self, model_dir=ONNX_MODEL_DIR, quantized=False):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        model_path = os.path.join(model_dir, ONNX_INT8_FILE if quantized else ONNX_FP32_FILE)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"{model_path} not found. Run `python -m utils.encoders export` first.")
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, TOKENIZER_FILE))
+        self.tokenizer.enable_truncation(max_length=MAX_SEQ_LENGTH)
+        self.tokenizer.enable_padding()
+        self.session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+    def _encode_batch(self, sentences):
+        encodings = self.tokenizer.encode_batch(sentences)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+        feeds = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": attention_mask,
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+        }
+        token_embeddings = self.session.run(None, {name: value for name, value in feeds.items() if name in self.input_names})[0]
+
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+
+    def encode(self, sentences, batch_size=32, **kwargs):
+        """Encodes a string (-> 1-D array) or a list of strings (-> 2-D float32 array)."""
+        single_sentence = isinstance(sentences, str)
+        if single_sentence:
+            sentences = [sentences]
+        if not sentences:
+            return np.zeros((0, 384), dtype=np.float32)
+
+        # Sort by length so each batch pads to a similar size, then restore the input order
+        order = np.argsort([-len(sentence) for sentence in sentences], kind="stable")
+        embeddings = np.empty((len(sentences), 384), dtype=np.float32)
+        for start in range(0, len(sentences), batch_size):
+            batch_indices = order[start:start + batch_size]
+            embeddings[batch_indices] = self._encode_batch([sentences[i] for i in batch_indices])
+        return embeddings[0] if single_sentence else embeddings
+
+
+def load_encoder(model_name="all-MiniLM-L6-v2", backend=None):
+    """Returns an encoder with a SentenceTransformer-compatible encode() for the requested backend."""
+    backend = backend or ENCODER_BACKEND
+    if backend == ENCODER_BACKEND_TORCH:
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model_name)
+    if backend in (ENCODER_BACKEND_ONNX, ENCODER_BACKEND_ONNX_INT8):
+        return OnnxMiniLMEncoder(ONNX_MODEL_DIR, quantized=backend == ENCODER_BACKEND_ONNX_INT8)
+    raise ValueError(f"Unknown encoder backend '{backend}'. Expected one of {ENCODER_BACKENDS}.")
+
+
+def encoder_cache_key(model_name="all-MiniLM-L6-v2", backend=None):
+    """Key under which embeddings are cached, so vectors from different backends never mix."""
+    backend = backend or ENCODER_BACKEND
+    return model_name if backend == ENCODER_BACKEND_TORCH else f"{model_name}:{backend}"
+
+
+def export_onnx_model(model_name="all-MiniLM-L6-v2", output_dir=ONNX_MODEL_DIR, quantize=True):
+    """
+    Exports the transformer part of the sentence-transformers model to ONNX (and optionally an
+    int8 dynamically quantized copy) plus its tokenizer. Needs torch; run once at build time.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(output_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    st_model.tokenizer.save_pretrained(output_dir) # Writes tokenizer.json for the fast tokenizer
+
+    dummy = st_model.tokenizer(["export sample"], return_tensors="pt")
+    fp32_path = os.path.join(output_dir, ONNX_FP32_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            (dummy["input_ids"], dummy["attention_mask"], dummy["token_type_ids"]),
+            fp32_path,
+            input_names=["input_ids", "attention_mask", "token_type_ids"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "token_type_ids": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"}
+            },
+            opset_version=14
+        )
+    print(f"Exported {fp32_path}")
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        int8_path = os.path.join(output_dir, ONNX_INT8_FILE)
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+        print(f"Exported {int8_path}")
+
+
+def verify_onnx_model(model_name="all-MiniLM-L6-v2", texts=None):
+    """
+    Compares ONNX embeddings against the torch reference and prints the minimum cosine similarity
+    per backend. Returns True if every available ONNX backend is within its documented tolerance.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if texts is None:
+        texts = []
+        data_dir = "data"
+        for file_name in sorted(os.listdir(data_dir)):
+            if file_name.endswith(".txt"):
+                with open(os.path.join(data_dir, file_name), "r", encoding="utf-8") as f:
+                    texts.append(f.read())
+    reference = np.asarray(SentenceTransformer(model_name, device="cpu").encode(texts, normalize_embeddings=True))
+
+    all_within_tolerance = True
+    for backend, min_cosine in ((ENCODER_BACKEND_ONNX, ONNX_FP32_MIN_COSINE), (ENCODER_BACKEND_ONNX_INT8, ONNX_INT8_MIN_COSINE)):
+        try:
+            encoder = load_encoder(model_name, backend=backend)
+        except FileNotFoundError as e:
+            print(f"{backend}: skipped ({e})")
+            continue
+        cosines = (encoder.encode(texts) * reference).sum(axis=1)
+        within_tolerance = bool(cosines.min() >= min_cosine)
+        all_within_tolerance = all_within_tolerance and within_tolerance
+        print(f"{backend}: min cosine {cosines.min():.6f}, mean {cosines.mean():.6f} over {len(texts)} texts (tolerance {min_cosine}) -> {'OK' if within_tolerance else 'FAIL'}")
+    return all_within_tolerance
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.encoders", description="Export and verify ONNX MiniLM encoders.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="Export all-MiniLM-L6-v2 to ONNX (needs torch)")
+    export_parser.add_argument("--output-dir", default=ONNX_MODEL_DIR)
+    export_parser.add_argument("--no-quantize", action="store_true", help="Skip the int8 quantized model")
+    subparsers.add_parser("verify", help="Check ONNX embeddings against the torch reference")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        export_onnx_model(output_dir=args.output_dir, quantize=not args.no_quantize)
+        return 0
+    return 0 if verify_onnx_model() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import hashlib
+
+import numpy as np
+
+from utils.scoring import (
+    EMBEDDING_BATCH_SIZE, MASTER_SKILLS, STOP_WORDS,
+    clean_text, extract_relevant_keywords, extract_years_of_experience
+)
+
+# Feature vectors for the relevance model, shared by train_model.py and scoring so that the model is
+# trained on exactly what it sees at inference time:
+#   [jd_embedding (d), resume_embedding (d), years_of_experience, keyword_overlap]
+# Keyword overlap is the number of MASTER_SKILLS (or, if that is empty, non-stop-word) keywords
+# shared by the JD and the resume, as extracted by utils.scoring.extract_relevant_keywords.
+# Bump FEATURE_VERSION whenever that definition changes, so cached feature matrices are rebuilt.
+FEATURE_VERSION = 1
+
+
+def _skill_filter():
+    return MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS
+
+
+def feature_fingerprint(skill_filter):
+    """FEATURE_VERSION plus a short hash of a skill filter (order-insensitive)."""
+    return f"v{FEATURE_VERSION}-" + hashlib.sha256("\n".join(sorted(skill_filter)).encode("utf-8")).hexdigest()[:16]
+
+
+# Identifies the keyword definition in effect, so anything derived from extracted keywords (JD artifacts,
+# cached resume skills, cached feature matrices) can detect that it was built under another one
+FEATURE_FINGERPRINT = feature_fingerprint(_skill_filter())
+
+
+def featurize_pairs(jd_texts, resume_texts, model, years_exps=None, batch_size=EMBEDDING_BATCH_SIZE,
+                    resume_embeddings=None, resume_skill_sets=None, jd_embeddings=None, jd_skill_sets=None):
+    """
+    Builds the feature matrix for parallel lists of JD and resume texts.
+
+    Identical JD strings are cleaned, encoded and keyword-extracted once, and all resumes go through a
+    single batched model.encode call. Returns a dict:
+      "features":           C-contiguous float32 array of shape (n, 2 * d + 2)
+      "jd_embeddings":      float32 (n, d) view of the JD columns
+      "resume_embeddings":  float32 (n, d) view of the resume columns
+      "years":              float32 (n,) years of experience
+      "keyword_overlaps":   float32 (n,) keyword overlap counts
+      "jd_keyword_counts":  float32 (n,) number of keywords extracted from each row's JD
+      "resume_skill_sets":  list of n keyword sets, one per resume
+
+    years_exps optionally supplies years of experience per resume (None entries count as 0); when
+    omitted they're extracted from the resume text. resume_embeddings / resume_skill_sets are optional
+    lists parallel to resume_texts holding precomputed values, with None for resumes that still need
+    them. They are not modified; the completed values are the returned "resume_embeddings" rows and
+    "resume_skill_sets", so the caller can cache them.
+    jd_embeddings / jd_skill_sets optionally map a JD text to its precomputed embedding / keyword set.
+    """
+    num_pairs = len(resume_texts)
+    if len(jd_texts) != num_pairs:
+        raise ValueError(f"Got {len(jd_texts)} JD texts for {num_pairs} resume texts")
+    if not num_pairs:
+        raise ValueError("No (JD, resume) pairs to featurize")
+    skill_filter = _skill_filter()
+    jd_embeddings = jd_embeddings or {}
+    jd_skill_sets = jd_skill_sets or {}
+
+    # Each distinct JD is processed once; jd_rows maps every pair to its JD's row
+    unique_jds = list(dict.fromkeys(jd_texts))
+    jd_row_by_text = {jd_text: row for row, jd_text in enumerate(unique_jds)}
+    jd_rows = np.fromiter((jd_row_by_text[jd_text] for jd_text in jd_texts), dtype=np.intp, count=num_pairs)
+    jd_cleans = [clean_text(jd_text) for jd_text in unique_jds]
+
+    to_encode = [row for row, jd_text in enumerate(unique_jds) if jd_embeddings.get(jd_text) is None]
+    encoded = iter(model.encode([jd_cleans[row] for row in to_encode], batch_size=batch_size) if to_encode else [])
+    unique_jd_embeds = np.vstack([
+        next(encoded) if jd_embeddings.get(jd_text) is None else np.asarray(jd_embeddings[jd_text])
+        for jd_text in unique_jds
+    ]).astype(np.float32, copy=False)
+    unique_jd_skills = [
+        set(jd_skill_sets[jd_text]) if jd_skill_sets.get(jd_text) is not None else extract_relevant_keywords(jd_clean, skill_filter)
+        for jd_text, jd_clean in zip(unique_jds, jd_cleans)
+    ]
+
+    # Only resumes without a precomputed embedding / keyword set are processed
+    resume_embeddings = list(resume_embeddings) if resume_embeddings is not None else [None] * num_pairs
+    resume_skill_sets = list(resume_skill_sets) if resume_skill_sets is not None else [None] * num_pairs
+    missing_embeddings = [i for i, embedding in enumerate(resume_embeddings) if embedding is None]
+    missing_skills = [i for i, skill_set in enumerate(resume_skill_sets) if skill_set is None]
+    resume_cleans = {i: clean_text(resume_texts[i]) for i in set(missing_embeddings) | set(missing_skills)}
+    if missing_embeddings:
+        new_embeds = model.encode([resume_cleans[i] for i in missing_embeddings], batch_size=batch_size)
+        for i, embedding in zip(missing_embeddings, new_embeds):
+            resume_embeddings[i] = embedding
+    for i in missing_skills:
+        resume_skill_sets[i] = extract_relevant_keywords(resume_cleans[i], skill_filter)
+
+    if years_exps is None:
+        years_exps = [extract_years_of_experience(resume_text) for resume_text in resume_texts]
+
+    dim = unique_jd_embeds.shape[1]
+    features = np.empty((num_pairs, 2 * dim + 2), dtype=np.float32)
+    features[:, :dim] = unique_jd_embeds[jd_rows]
+    features[:, dim:2 * dim] = np.vstack([np.asarray(embedding, dtype=np.float32) for embedding in resume_embeddings])
+    features[:, 2 * dim] = [float(years) if years is not None else 0.0 for years in years_exps]
+    features[:, 2 * dim + 1] = [
+        len(unique_jd_skills[jd_row].intersection(resume_skill_set))
+        for jd_row, resume_skill_set in zip(jd_rows, resume_skill_sets)
+    ]
+    jd_keyword_counts = np.array([len(skills) for skills in unique_jd_skills], dtype=np.float32)
+
+    return {
+        "features": features,
+        "jd_embeddings": features[:, :dim],
+        "resume_embeddings": features[:, dim:2 * dim],
+        "years": features[:, 2 * dim],
+        "keyword_overlaps": features[:, 2 * dim + 1],
+        "jd_keyword_counts": jd_keyword_counts[jd_rows],
+        "resume_skill_sets": resume_skill_sets
+    }
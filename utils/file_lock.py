@@ -0,0 +1,34 @@
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+# Cross-process locks for read-modify-replace updates of shared data files (metrics, rollups,
+# indexes) that several Streamlit / CLI processes may update at the same time. The lock is held
+# on a sidecar "<path>.lock" file, so the data file itself can still be replaced atomically.
+# Locks are advisory: only code that goes through file_lock() is serialized.
+
+
+@contextmanager
+def file_lock(path):
+    """Holds an exclusive lock on f"{path}.lock" for the duration of the with block, waiting for it if needed."""
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1) # Retries for ~10 s, then raises OSError
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,121 @@
+import collections
+import hashlib
+import json
+import os
+import traceback
+from datetime import datetime
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from utils.features import FEATURE_FINGERPRINT
+from utils.logger import log_system_event
+from utils.scoring import EMBEDDING_CACHE_KEY, MASTER_SKILLS, STOP_WORDS, clean_text, extract_relevant_keywords
+
+# Precomputed JD-side screening inputs, stored as a sidecar JSON per JD file:
+#   data/jd_artifacts/<jd file name>.<hash of its resolved path>.json
+# holding the cleaned text, extracted skill set, TF-IDF terms and per-encoder embeddings. The path hash
+# keeps same-named JDs in different folders apart; the file name is only there for readability.
+# A sidecar is valid while the JD file's mtime and size are unchanged, or, if they changed,
+# while its SHA-256 still matches (e.g. the file was re-uploaded with identical content), and only if
+# it was built under the current keyword definition (FEATURE_FINGERPRINT: feature version + skill list).
+JD_ARTIFACT_DIR = os.path.join("data", "jd_artifacts")
+
+
+def _artifact_path(jd_path):
+    path_hash = hashlib.sha256(os.path.realpath(jd_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(JD_ARTIFACT_DIR, f"{os.path.basename(jd_path)}.{path_hash}.json")
+
+
+def _file_sha256(jd_path):
+    with open(jd_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _write_artifact(jd_path, artifact):
+    os.makedirs(JD_ARTIFACT_DIR, exist_ok=True)
+    path = _artifact_path(jd_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding="utf-8") as f:
+        json.dump(artifact, f)
+    os.replace(tmp_path, path)
+
+
+def build_jd_artifact(jd_path, model=None):
+    """
+    Computes and saves the sidecar artifact for a JD file. The embedding is only included
+    when an encoder is passed; it is filled in later by get_jd_artifact otherwise.
+    """
+    with open(jd_path, "rb") as f:
+        jd_bytes = f.read()
+    jd_text = jd_bytes.decode("utf-8")
+    stat = os.stat(jd_path)
+    jd_clean = clean_text(jd_text)
+    tfidf_analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+
+    artifact = {
+        "jd_file": os.path.basename(jd_path),
+        "sha256": hashlib.sha256(jd_bytes).hexdigest(),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "feature_fingerprint": FEATURE_FINGERPRINT,
+        "clean_text": jd_clean,
+        "skills": sorted(extract_relevant_keywords(jd_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)),
+        "tfidf_terms": dict(collections.Counter(tfidf_analyzer(jd_text.lower()))),
+        "embeddings": {},
+        "built_at": datetime.now().isoformat()
+    }
+    if model is not None:
+        artifact["embeddings"][EMBEDDING_CACHE_KEY] = [float(x) for x in model.encode(jd_clean)]
+
+    _write_artifact(jd_path, artifact)
+    log_system_event("INFO", "JD_ARTIFACT_BUILT", {"jd_file": artifact["jd_file"], "num_skills": len(artifact["skills"]), "has_embedding": model is not None})
+    return artifact
+
+
+def load_jd_artifact(jd_path):
+    """Returns the stored artifact for a JD file if it is still valid for the file's current content, else None."""
+    try:
+        with open(_artifact_path(jd_path), 'r', encoding="utf-8") as f:
+            artifact = json.load(f)
+        stat = os.stat(jd_path)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    # Skills / TF-IDF terms extracted under a different keyword definition are stale regardless of the file
+    if artifact.get("feature_fingerprint") != FEATURE_FINGERPRINT:
+        return None
+    if artifact.get("mtime") == stat.st_mtime and artifact.get("size") == stat.st_size:
+        return artifact
+    # File was touched; it is still valid if the content hash is unchanged
+    if artifact.get("sha256") == _file_sha256(jd_path):
+        artifact["mtime"], artifact["size"] = stat.st_mtime, stat.st_size
+        _write_artifact(jd_path, artifact)
+        return artifact
+    return None
+
+
+def get_jd_artifact(jd_path, model=None):
+    """
+    Returns a valid artifact for a JD file, rebuilding it if missing or stale, and adding the
+    embedding for the active encoder backend if it isn't stored yet. Never raises: on failure
+    it logs and returns None so screening can fall back to computing the JD side itself.
+    """
+    try:
+        artifact = load_jd_artifact(jd_path)
+        if artifact is None:
+            return build_jd_artifact(jd_path, model)
+        if model is not None and EMBEDDING_CACHE_KEY not in artifact.get("embeddings", {}):
+            artifact.setdefault("embeddings", {})[EMBEDDING_CACHE_KEY] = [float(x) for x in model.encode(artifact["clean_text"])]
+            _write_artifact(jd_path, artifact)
+        return artifact
+    except Exception as e:
+        log_system_event("ERROR", "JD_ARTIFACT_FAILED", {"jd_file": os.path.basename(jd_path), "error": str(e), "traceback": traceback.format_exc()})
+        return None
+
+
+def delete_jd_artifact(jd_path):
+    """Removes the sidecar artifact of a deleted JD file, if any."""
+    try:
+        os.remove(_artifact_path(jd_path))
+    except FileNotFoundError:
+        pass
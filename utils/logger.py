@@ -1,21 +1,118 @@
+import atexit
+import gzip
 import json
 import os
+import queue
+import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
 
+from utils.file_lock import file_lock
+from utils.metrics_rollups import apply_increments, load_rollups, rebuild_rollups, save_rollups
+
 # Define log file paths
 # Assuming 'data' directory exists in your project root for storing persistent files
 LOG_DIR = "data"
-USER_ACTIVITY_LOG_FILE = os.path.join(LOG_DIR, "user_activity_log.json")
-SYSTEM_EVENTS_LOG_FILE = os.path.join(LOG_DIR, "system_events_log.json")
+# Event logs are append-only JSON Lines (one JSON object per line), so logging an event
+# costs one small append instead of rewriting the whole history.
+USER_ACTIVITY_LOG_FILE = os.path.join(LOG_DIR, "user_activity_log.jsonl")
+SYSTEM_EVENTS_LOG_FILE = os.path.join(LOG_DIR, "system_events_log.jsonl")
 METRICS_SUMMARY_FILE = os.path.join(LOG_DIR, "metrics_summary.json")
 
+# Pre-JSONL logs (a single JSON array per file); migrated once on import
+LEGACY_USER_ACTIVITY_LOG_FILE = os.path.join(LOG_DIR, "user_activity_log.json")
+LEGACY_SYSTEM_EVENTS_LOG_FILE = os.path.join(LOG_DIR, "system_events_log.json")
+
+# Rotation: the active JSONL log only ever holds one day's events (and at most LOG_ROTATE_MAX_BYTES).
+# Older data is compacted into gzip segments under LOG_SEGMENT_DIR, described by a small index
+# (time range, entry count and distinct filter values per segment) so date-range reads only open
+# the segments that overlap the range. Segments whose newest entry is older than
+# LOG_RETENTION_DAYS are deleted (0 keeps everything); the SQLite backend applies the same retention.
+LOG_SEGMENT_DIR = os.path.join(LOG_DIR, "log_segments")
+LOG_SEGMENT_INDEX_FILE = os.path.join(LOG_SEGMENT_DIR, "index.json")
+LOG_ROTATE_MAX_BYTES = 20 * 1024 * 1024
+LOG_RETENTION_DAYS = int(os.environ.get("SCREENER_LOG_RETENTION_DAYS", "180"))
+
+# Columns whose distinct values are recorded per segment for the admin panel's filter dropdowns
+_SEGMENT_INDEX_COLUMNS = {
+    USER_ACTIVITY_LOG_FILE: ("user_email", "action"),
+    SYSTEM_EVENTS_LOG_FILE: ("level",)
+}
+
+# Storage backend for event logs and metrics (SCREENER_LOG_BACKEND):
+#   "jsonl"  - the JSON Lines logs and metrics_summary.json above (default)
+#   "sqlite" - tables in data/logs.db, indexed so the admin panel's date/user/action/level
+#              filters and pagination run as SQL queries instead of in-memory scans
+# Existing JSONL logs and metrics are imported into an empty database on first use.
+LOG_BACKEND_JSONL = "jsonl"
+LOG_BACKEND_SQLITE = "sqlite"
+LOG_BACKEND = os.environ.get("SCREENER_LOG_BACKEND", LOG_BACKEND_JSONL)
+LOG_DB_FILE = os.path.join(LOG_DIR, "logs.db")
+
+# Table and columns for each event log in the SQLite backend; "details" is stored as JSON text
+_SQLITE_LOG_TABLES = {
+    USER_ACTIVITY_LOG_FILE: ("user_activity", ("timestamp", "user_email", "action", "details", "ip_address")),
+    SYSTEM_EVENTS_LOG_FILE: ("system_events", ("timestamp", "level", "event", "details", "stacktrace"))
+}
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS user_activity (
+    id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, user_email TEXT, action TEXT, details TEXT, ip_address TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_user_activity_timestamp ON user_activity (timestamp);
+CREATE INDEX IF NOT EXISTS idx_user_activity_user ON user_activity (user_email, timestamp);
+CREATE INDEX IF NOT EXISTS idx_user_activity_action ON user_activity (action, timestamp);
+CREATE TABLE IF NOT EXISTS system_events (
+    id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, level TEXT, event TEXT, details TEXT, stacktrace TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_system_events_timestamp ON system_events (timestamp);
+CREATE INDEX IF NOT EXISTS idx_system_events_level ON system_events (level, timestamp);
+CREATE TABLE IF NOT EXISTS metrics (
+    key TEXT NOT NULL, user_email TEXT NOT NULL, date TEXT NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (key, user_email, date)
+);
+"""
+
+# Log calls only enqueue; a background writer thread drains the queue and writes in batches,
+# flushing once LOG_FLUSH_BATCH_SIZE items are pending or LOG_FLUSH_INTERVAL_SECONDS have
+# passed, and again at interpreter exit.
+LOG_QUEUE_MAX_SIZE = int(os.environ.get("SCREENER_LOG_QUEUE_SIZE", "10000"))
+LOG_FLUSH_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+# What a log call does when the queue is full: "block" waits for the writer to catch up
+# (nothing is lost), "drop" discards the event and counts it in a LOG_EVENTS_DROPPED event.
+LOG_QUEUE_FULL_POLICY_BLOCK = "block"
+LOG_QUEUE_FULL_POLICY_DROP = "drop"
+LOG_QUEUE_FULL_POLICY = os.environ.get("SCREENER_LOG_QUEUE_FULL_POLICY", LOG_QUEUE_FULL_POLICY_BLOCK)
+
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+_writer_thread = None
+_writer_lock = threading.Lock()
+_dropped_events = 0 # Guarded by _dropped_events_lock: incremented by any logging thread, reset by the writer
+_dropped_events_lock = threading.Lock()
+_FLUSH = "flush" # Queue item kind used by flush_logs() to wait for everything queued before it
+
+# Metrics are counted in memory and merged into metrics_summary.json by a snapshot thread every
+# METRICS_SNAPSHOT_INTERVAL_SECONDS (and at exit). Only the increments since the last snapshot are
+# held in memory, and each snapshot merges them into the file under a cross-process file lock
+# (metrics_file_lock), so several app processes can share the file without overwriting each other's counts.
+METRICS_SNAPSHOT_INTERVAL_SECONDS = 30.0
+_pending_metrics = {}
+_metrics_lock = threading.Lock()
+_snapshot_lock = threading.Lock() # Held for a whole snapshot so readers never see increments in neither place
+_snapshot_thread = None
+_last_retention_date = None
+
 def _initialize_log_file(filepath):
     """Initializes a JSON log file if it doesn't exist, ensuring the directory exists."""
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR)
+    os.makedirs(LOG_DIR, exist_ok=True)
     if not os.path.exists(filepath):
-        with open(filepath, 'w') as f:
-            json.dump([], f) # Start with an empty list for logs
+        try:
+            # Exclusive create: never truncates a file another process wrote since the check above
+            with open(filepath, 'x') as f:
+                json.dump([], f) # Start with an empty list for logs
+        except FileExistsError:
+            pass
 
 def _read_json_file(filepath):
     """Reads content from a JSON file. Initializes if it doesn't exist."""
@@ -38,6 +135,433 @@ def _write_json_file(filepath, data):
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=4)
 
+def _read_jsonl(filepath):
+    """Reads all entries from a JSON Lines log, skipping blank or partially written lines."""
+    if not os.path.exists(filepath):
+        return []
+    entries = []
+    with open(filepath, 'r', encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue # e.g. a line cut short by a crash mid-append
+    return entries
+
+def _migrate_json_array_log(legacy_filepath, jsonl_filepath):
+    """
+    One-time migration of a legacy JSON-array log to JSON Lines. Legacy entries are placed
+    before anything already in the JSONL file, and the old file is renamed to *.migrated
+    so the migration never runs twice.
+    """
+    if not os.path.exists(legacy_filepath):
+        return
+    # Every process runs this on import; the lock makes sure only one of them migrates
+    with file_lock(jsonl_filepath):
+        if not os.path.exists(legacy_filepath):
+            return # Another process migrated it while we waited
+        try:
+            with open(legacy_filepath, 'r') as f:
+                legacy_entries = json.load(f)
+        except json.JSONDecodeError:
+            legacy_entries = []
+        if not isinstance(legacy_entries, list):
+            legacy_entries = []
+
+        tmp_filepath = f"{jsonl_filepath}.{os.getpid()}.tmp"
+        with open(tmp_filepath, 'w', encoding="utf-8") as f:
+            for entry in legacy_entries:
+                f.write(json.dumps(entry, default=str) + "\n")
+            if os.path.exists(jsonl_filepath):
+                with open(jsonl_filepath, 'r', encoding="utf-8") as existing:
+                    f.write(existing.read())
+        os.replace(tmp_filepath, jsonl_filepath)
+        os.replace(legacy_filepath, f"{legacy_filepath}.migrated")
+    log_system_event("INFO", "LOG_MIGRATED", {"num_entries": len(legacy_entries), "from": legacy_filepath, "to": jsonl_filepath})
+
+def _load_segment_index():
+    """Returns {log file name: [segment metadata, ...]} from the segment index."""
+    try:
+        with open(LOG_SEGMENT_INDEX_FILE, 'r', encoding="utf-8") as f:
+            index = json.load(f)
+        return index if isinstance(index, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def _save_segment_index(index):
+    os.makedirs(LOG_SEGMENT_DIR, exist_ok=True)
+    tmp_filepath = f"{LOG_SEGMENT_INDEX_FILE}.{os.getpid()}.tmp"
+    _write_json_file(tmp_filepath, index)
+    os.replace(tmp_filepath, LOG_SEGMENT_INDEX_FILE)
+
+def _compact_to_segment(source_filepath, log_file):
+    """
+    Gzips a (renamed-away) log file into a new segment and records it in the segment index.
+    Called with file_lock(log_file) held; the index, shared by all logs, has its own lock.
+    """
+    log_name = os.path.basename(log_file)
+    os.makedirs(LOG_SEGMENT_DIR, exist_ok=True)
+
+    meta = {"first_timestamp": None, "last_timestamp": None, "num_entries": 0, "values": {column: set() for column in _SEGMENT_INDEX_COLUMNS[log_file]}}
+    tmp_filepath = os.path.join(LOG_SEGMENT_DIR, f"{log_name}.{os.getpid()}.tmp")
+    with open(source_filepath, 'r', encoding="utf-8") as src, gzip.open(tmp_filepath, 'wt', encoding="utf-8") as dst:
+        for line in src:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            dst.write(line if line.endswith("\n") else line + "\n")
+            timestamp = entry.get("timestamp", "")
+            if meta["first_timestamp"] is None or timestamp < meta["first_timestamp"]:
+                meta["first_timestamp"] = timestamp
+            if meta["last_timestamp"] is None or timestamp > meta["last_timestamp"]:
+                meta["last_timestamp"] = timestamp
+            meta["num_entries"] += 1
+            for column, values in meta["values"].items():
+                if entry.get(column) is not None:
+                    values.add(entry[column])
+
+    if meta["num_entries"] == 0:
+        os.remove(tmp_filepath)
+        os.remove(source_filepath)
+        return
+    meta["values"] = {column: sorted(values) for column, values in meta["values"].items()}
+    with file_lock(LOG_SEGMENT_INDEX_FILE):
+        index = _load_segment_index()
+        segments = index.setdefault(log_name, [])
+        sequence = len(segments)
+        while True: # Retention may have removed earlier segments, so the count alone isn't unique
+            segment_name = f"{log_name[:-len('.jsonl')]}.{meta['first_timestamp'][:10]}.{sequence:05d}.jsonl.gz"
+            if not os.path.exists(os.path.join(LOG_SEGMENT_DIR, segment_name)):
+                break
+            sequence += 1
+        os.replace(tmp_filepath, os.path.join(LOG_SEGMENT_DIR, segment_name))
+        meta["file"] = segment_name
+        segments.append(meta)
+        _save_segment_index(index)
+    os.remove(source_filepath)
+
+def _maybe_rotate(log_file):
+    """
+    Rotates the active log into a segment if it holds an earlier day's events or is too large.
+    Must be called with file_lock(log_file) held, so the size check, rename and compaction (and
+    appends, see _write_batch) of one log never interleave across processes.
+    """
+    rotating_filepath = f"{log_file}.rotating"
+    if os.path.exists(rotating_filepath): # Left over from an interrupted rotation
+        _compact_to_segment(rotating_filepath, log_file)
+    try:
+        size = os.path.getsize(log_file)
+        with open(log_file, 'r', encoding="utf-8") as f:
+            first_date = json.loads(f.readline()).get("timestamp", "")[:10]
+    except (OSError, json.JSONDecodeError):
+        return
+    if size < LOG_ROTATE_MAX_BYTES and first_date >= datetime.now().strftime("%Y-%m-%d"):
+        return
+    os.replace(log_file, rotating_filepath)
+    _compact_to_segment(rotating_filepath, log_file)
+
+def apply_log_retention():
+    """Deletes log segments (or SQLite rows) older than LOG_RETENTION_DAYS."""
+    if LOG_RETENTION_DAYS <= 0:
+        return
+    cutoff = (datetime.now() - timedelta(days=LOG_RETENTION_DAYS)).strftime("%Y-%m-%d")
+    if LOG_BACKEND == LOG_BACKEND_SQLITE:
+        with _connect_db() as conn:
+            for table, _ in _SQLITE_LOG_TABLES.values():
+                conn.execute(f"DELETE FROM {table} WHERE timestamp < ?", (cutoff,))
+        conn.close()
+        return
+
+    with file_lock(LOG_SEGMENT_INDEX_FILE):
+        index = _load_segment_index()
+        removed = 0
+        for log_name, segments in index.items():
+            kept = []
+            for meta in segments:
+                if meta["last_timestamp"] < cutoff:
+                    try:
+                        os.remove(os.path.join(LOG_SEGMENT_DIR, meta["file"]))
+                    except FileNotFoundError:
+                        pass
+                    removed += 1
+                else:
+                    kept.append(meta)
+            index[log_name] = kept
+        if removed:
+            _save_segment_index(index)
+
+def _iter_log_entries(log_file, start_ts=None, end_ts=None):
+    """
+    Yields the entries of a JSONL log (segments, oldest first, then the active file), only opening
+    segments whose time range overlaps [start_ts, end_ts). Entries themselves are not filtered.
+    """
+    segments = sorted(_load_segment_index().get(os.path.basename(log_file), []), key=lambda meta: meta["first_timestamp"])
+    for meta in segments:
+        if (start_ts and meta["last_timestamp"] < start_ts) or (end_ts and meta["first_timestamp"] >= end_ts):
+            continue
+        try:
+            with gzip.open(os.path.join(LOG_SEGMENT_DIR, meta["file"]), 'rt', encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            continue # Removed by retention in another process
+    yield from _read_jsonl(log_file)
+
+def _connect_db():
+    """Opens a connection to the SQLite log store. Connections are short-lived and per-thread."""
+    conn = sqlite3.connect(LOG_DB_FILE, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL") # Readers (admin panel) don't block the writer thread
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def _sqlite_insert_entries(conn, log_file, entries):
+    table, columns = _SQLITE_LOG_TABLES[log_file]
+    rows = [
+        tuple(json.dumps(entry.get(column), default=str) if column == "details" else entry.get(column) for column in columns)
+        for entry in entries
+    ]
+    conn.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+
+def _sqlite_row_to_entry(row):
+    entry = dict(row)
+    entry.pop("id", None)
+    if entry.get("details") is not None:
+        entry["details"] = json.loads(entry["details"])
+    return entry
+
+def _flatten_metrics(metrics):
+    """Yields (key, user_email or '', date, count) rows from the nested metrics structure."""
+    for key, values in metrics.items():
+        for name, value in values.items():
+            if isinstance(value, dict): # {user_email: {date: count}}
+                for date, count in value.items():
+                    yield key, name, date, count
+            else: # {date: count}
+                yield key, "", name, value
+
+def _initialize_db():
+    """Creates the SQLite schema and imports existing JSONL logs/metrics into an empty database."""
+    if not os.path.exists(LOG_DIR):
+        os.makedirs(LOG_DIR)
+    with _connect_db() as conn:
+        conn.executescript(_SQLITE_SCHEMA)
+        for log_file, (table, _) in _SQLITE_LOG_TABLES.items():
+            if conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None and os.path.exists(log_file):
+                _sqlite_insert_entries(conn, log_file, list(_iter_log_entries(log_file)))
+        if conn.execute("SELECT 1 FROM metrics LIMIT 1").fetchone() is None and os.path.exists(METRICS_SUMMARY_FILE):
+            metrics = _read_json_file(METRICS_SUMMARY_FILE)
+            if isinstance(metrics, dict):
+                conn.executemany("INSERT INTO metrics (key, user_email, date, count) VALUES (?, ?, ?, ?)", list(_flatten_metrics(metrics)))
+    conn.close()
+
+def _apply_metric_increment(metrics, key, value, user_email, date):
+    """Adds value to the {metric_key: {user_email (optional): {date: count}}} structure in place."""
+    # Ensure the top-level metric key exists
+    if key not in metrics:
+        metrics[key] = {}
+
+    if user_email: # User-specific metrics (e.g., user_resumes_screened)
+        if user_email not in metrics[key]:
+            metrics[key][user_email] = {}
+        # Increment the count for that user on that specific date
+        metrics[key][user_email][date] = metrics[key][user_email].get(date, 0) + value
+    else: # Global metrics (e.g., total_resumes_screened)
+        # Increment the global count for that specific date
+        metrics[key][date] = metrics[key].get(date, 0) + value
+
+def _merge_metrics(target, source):
+    """Adds every count in the nested metrics dict `source` into `target` in place."""
+    for name, value in source.items():
+        if isinstance(value, dict):
+            existing = target.get(name)
+            if not isinstance(existing, dict):
+                existing = target[name] = {}
+            _merge_metrics(existing, value)
+        else:
+            target[name] = target.get(name, 0) + value
+
+def _read_metrics_snapshot():
+    if LOG_BACKEND == LOG_BACKEND_SQLITE:
+        metrics = {}
+        conn = _connect_db()
+        try:
+            for row in conn.execute("SELECT key, user_email, date, count FROM metrics"):
+                _apply_metric_increment(metrics, row["key"], row["count"], row["user_email"], row["date"])
+        finally:
+            conn.close()
+        return metrics
+    metrics = _read_json_file(METRICS_SUMMARY_FILE)
+    return metrics if isinstance(metrics, dict) else {} # Ensure it's a dictionary for metrics
+
+def metrics_file_lock():
+    """Cross-process lock held while the metrics store (and its rollups) is read, merged and replaced."""
+    return file_lock(METRICS_SUMMARY_FILE)
+
+def _persist_metric_increments(pending):
+    # The store and its rollups are both read, merged and replaced under one cross-process lock,
+    # so concurrent snapshots from other processes can't overwrite each other's increments
+    with metrics_file_lock():
+        if LOG_BACKEND == LOG_BACKEND_SQLITE:
+            with _connect_db() as conn:
+                conn.executemany(
+                    "INSERT INTO metrics (key, user_email, date, count) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (key, user_email, date) DO UPDATE SET count = count + excluded.count",
+                    list(_flatten_metrics(pending))
+                )
+            conn.close()
+        else:
+            metrics = _read_metrics_snapshot()
+            _merge_metrics(metrics, pending)
+            tmp_filepath = f"{METRICS_SUMMARY_FILE}.{os.getpid()}.tmp"
+            _write_json_file(tmp_filepath, metrics)
+            os.replace(tmp_filepath, METRICS_SUMMARY_FILE)
+
+        # Keep the dashboard rollups in step; they are only rebuilt from the full history if missing
+        rollups = load_rollups()
+        if rollups is None:
+            rebuild_rollups(_read_metrics_snapshot())
+        else:
+            save_rollups(apply_increments(rollups, pending))
+
+def snapshot_metrics():
+    """
+    Merges the in-memory metric increments into the metrics store: metrics_summary.json (replaced
+    atomically) or, with the SQLite backend, the metrics table.
+    """
+    global _pending_metrics
+    with _snapshot_lock:
+        with _metrics_lock:
+            pending, _pending_metrics = _pending_metrics, {}
+        if not pending:
+            return
+        try:
+            _persist_metric_increments(pending)
+        except Exception as e:
+            # Keep the increments for the next snapshot rather than losing them
+            with _metrics_lock:
+                _merge_metrics(_pending_metrics, pending)
+            print(f"Warning: failed to write metrics snapshot: {e}")
+
+def _metrics_snapshot_loop():
+    while True:
+        time.sleep(METRICS_SNAPSHOT_INTERVAL_SECONDS)
+        snapshot_metrics()
+
+def _ensure_snapshot_thread():
+    global _snapshot_thread
+    if _snapshot_thread is not None and _snapshot_thread.is_alive():
+        return
+    with _writer_lock:
+        if _snapshot_thread is None or not _snapshot_thread.is_alive():
+            _snapshot_thread = threading.Thread(target=_metrics_snapshot_loop, name="metrics-snapshot", daemon=True)
+            _snapshot_thread.start()
+
+def _write_batch(batch):
+    """Writes a batch of queued items with one append (or one SQLite transaction) per log."""
+    global _dropped_events, _last_retention_date
+    entries_by_file = {}
+    for kind, payload in batch:
+        if kind != _FLUSH:
+            entries_by_file.setdefault(kind, []).append(payload)
+
+    with _dropped_events_lock:
+        dropped, _dropped_events = _dropped_events, 0
+    if dropped:
+        entries_by_file.setdefault(SYSTEM_EVENTS_LOG_FILE, []).append({
+            "timestamp": datetime.now().isoformat(),
+            "level": "WARNING",
+            "event": "LOG_EVENTS_DROPPED",
+            "details": {"num_dropped": dropped, "queue_max_size": LOG_QUEUE_MAX_SIZE},
+            "stacktrace": None
+        })
+    if not entries_by_file:
+        return
+
+    # Retention runs at most once a day, on the first write of the day
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    if _last_retention_date != today_str:
+        _last_retention_date = today_str
+        apply_log_retention()
+
+    if LOG_BACKEND == LOG_BACKEND_SQLITE:
+        with _connect_db() as conn:
+            for filepath, entries in entries_by_file.items():
+                _sqlite_insert_entries(conn, filepath, entries)
+        conn.close()
+        return
+
+    if not os.path.exists(LOG_DIR):
+        os.makedirs(LOG_DIR)
+    for filepath, entries in entries_by_file.items():
+        # Other processes rotate the same file; appending under the lock means no batch can land in a
+        # file that is being renamed away and compacted
+        with file_lock(filepath):
+            _maybe_rotate(filepath)
+            with open(filepath, 'a', encoding="utf-8") as f:
+                f.write("".join(json.dumps(entry, default=str) + "\n" for entry in entries))
+
+def _log_writer_loop():
+    """Background writer: collects queued items into batches and writes them out."""
+    while True:
+        batch = [_log_queue.get()]
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL_SECONDS
+        while len(batch) < LOG_FLUSH_BATCH_SIZE and batch[-1][0] != _FLUSH:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_log_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        except Exception as e:
+            # Never let a bad write kill the writer; the batch is lost but logging carries on
+            print(f"Warning: failed to write {len(batch)} log item(s): {e}")
+        finally:
+            for kind, payload in batch:
+                if kind == _FLUSH:
+                    payload.set()
+
+def _ensure_writer_thread():
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        # Also restarts the writer in a forked child, where the parent's thread doesn't exist
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_log_writer_loop, name="log-writer", daemon=True)
+            _writer_thread.start()
+
+def _enqueue(kind, payload):
+    """Hands an item to the background writer, applying LOG_QUEUE_FULL_POLICY if the queue is full."""
+    global _dropped_events
+    _ensure_writer_thread()
+    if LOG_QUEUE_FULL_POLICY == LOG_QUEUE_FULL_POLICY_DROP:
+        try:
+            _log_queue.put_nowait((kind, payload))
+        except queue.Full:
+            with _dropped_events_lock:
+                _dropped_events += 1
+    else:
+        _log_queue.put((kind, payload))
+
+def flush_logs(timeout: float = 10.0):
+    """Blocks until everything logged before this call has been written (or timeout seconds pass)."""
+    if _writer_thread is None or not _writer_thread.is_alive():
+        return
+    flushed = threading.Event()
+    _log_queue.put((_FLUSH, flushed))
+    flushed.wait(timeout)
+
 def log_user_action(user_email: str, action: str, details: dict = None, ip_address: str = None):
     """Logs a user's action to the user activity log."""
     log_entry = {
@@ -47,9 +571,7 @@ def log_user_action(user_email: str, action: str, details: dict = None, ip_addre
         "details": details if details is not None else {},
         "ip_address": ip_address
     }
-    logs = _read_json_file(USER_ACTIVITY_LOG_FILE)
-    logs.append(log_entry)
-    _write_json_file(USER_ACTIVITY_LOG_FILE, logs)
+    _enqueue(USER_ACTIVITY_LOG_FILE, log_entry)
     # print(f"Logged user action: {log_entry}") # Uncomment for debugging
 
 def log_system_event(level: str, event: str, details: dict = None, stacktrace: str = None):
@@ -61,52 +583,156 @@ def log_system_event(level: str, event: str, details: dict = None, stacktrace: s
         "details": details if details is not None else {},
         "stacktrace": stacktrace
     }
-    logs = _read_json_file(SYSTEM_EVENTS_LOG_FILE)
-    logs.append(log_entry)
-    _write_json_file(SYSTEM_EVENTS_LOG_FILE, logs)
+    _enqueue(SYSTEM_EVENTS_LOG_FILE, log_entry)
     # print(f"Logged system event: {log_entry}") # Uncomment for debugging
 
+def _read_all_entries(log_file):
+    flush_logs()
+    if LOG_BACKEND == LOG_BACKEND_SQLITE:
+        conn = _connect_db()
+        try:
+            return [_sqlite_row_to_entry(row) for row in conn.execute(f"SELECT * FROM {_SQLITE_LOG_TABLES[log_file][0]} ORDER BY id")]
+        finally:
+            conn.close()
+    return list(_iter_log_entries(log_file))
+
 def get_user_activity_logs():
     """Retrieves all user activity logs."""
-    return _read_json_file(USER_ACTIVITY_LOG_FILE)
+    return _read_all_entries(USER_ACTIVITY_LOG_FILE)
 
 def get_system_events_logs():
     """Retrieves all system events logs."""
-    return _read_json_file(SYSTEM_EVENTS_LOG_FILE)
+    return _read_all_entries(SYSTEM_EVENTS_LOG_FILE)
+
+def _query_log(log_file, filters, start_date=None, end_date=None, limit=None, offset=0):
+    """
+    Returns (entries, total) for log entries matching every {column: value} in filters and
+    falling within [start_date, end_date] (datetime.date, inclusive), newest first. total counts
+    all matches; entries is the limit/offset page of them.
+    """
+    flush_logs()
+    # ISO timestamps sort lexicographically, so date bounds become string range conditions
+    start_ts = start_date.isoformat() if start_date else None
+    end_ts = (end_date + timedelta(days=1)).isoformat() if end_date else None
+
+    if LOG_BACKEND == LOG_BACKEND_SQLITE:
+        conditions, params = [], []
+        if start_ts:
+            conditions.append("timestamp >= ?")
+            params.append(start_ts)
+        if end_ts:
+            conditions.append("timestamp < ?")
+            params.append(end_ts)
+        for column, value in filters.items():
+            conditions.append(f"{column} = ?")
+            params.append(value)
+        table = _SQLITE_LOG_TABLES[log_file][0]
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        conn = _connect_db()
+        try:
+            total = conn.execute(f"SELECT COUNT(*) FROM {table}{where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT * FROM {table}{where} ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                params + [limit if limit is not None else -1, offset]
+            ).fetchall()
+        finally:
+            conn.close()
+        return [_sqlite_row_to_entry(row) for row in rows], total
+
+    matches = [
+        entry for entry in _iter_log_entries(log_file, start_ts, end_ts)
+        if (not start_ts or entry.get("timestamp", "") >= start_ts)
+        and (not end_ts or entry.get("timestamp", "") < end_ts)
+        and all(entry.get(column) == value for column, value in filters.items())
+    ]
+    matches.sort(key=lambda entry: entry.get("timestamp", ""), reverse=True)
+    return matches[offset:offset + limit if limit is not None else None], len(matches)
+
+def _distinct_log_values(log_file, column):
+    """Sorted distinct non-null values of one column of a log (for filter dropdowns)."""
+    flush_logs()
+    if LOG_BACKEND == LOG_BACKEND_SQLITE:
+        conn = _connect_db()
+        try:
+            # Served from the (column, timestamp) index
+            return [row[0] for row in conn.execute(f"SELECT DISTINCT {column} FROM {_SQLITE_LOG_TABLES[log_file][0]} WHERE {column} IS NOT NULL ORDER BY {column}")]
+        finally:
+            conn.close()
+    # Segment values come from the segment index; only the active file is scanned
+    values = {entry[column] for entry in _read_jsonl(log_file) if entry.get(column) is not None}
+    for meta in _load_segment_index().get(os.path.basename(log_file), []):
+        values.update(meta["values"].get(column, []))
+    return sorted(values)
+
+def query_user_activity_logs(start_date=None, end_date=None, user_email: str = None, action: str = None, limit: int = None, offset: int = 0):
+    """Filtered, paginated user activity logs, newest first. Returns (entries, total_matching)."""
+    filters = {}
+    if user_email:
+        filters["user_email"] = user_email
+    if action:
+        filters["action"] = action
+    return _query_log(USER_ACTIVITY_LOG_FILE, filters, start_date, end_date, limit, offset)
+
+def query_system_events_logs(start_date=None, end_date=None, level: str = None, limit: int = None, offset: int = 0):
+    """Filtered, paginated system events, newest first. Returns (entries, total_matching)."""
+    filters = {"level": level} if level else {}
+    return _query_log(SYSTEM_EVENTS_LOG_FILE, filters, start_date, end_date, limit, offset)
+
+def get_user_activity_filter_options():
+    """Returns (users, actions) present in the user activity log."""
+    return _distinct_log_values(USER_ACTIVITY_LOG_FILE, "user_email"), _distinct_log_values(USER_ACTIVITY_LOG_FILE, "action")
+
+def get_system_event_levels():
+    """Returns the levels present in the system events log."""
+    return _distinct_log_values(SYSTEM_EVENTS_LOG_FILE, "level")
 
 def update_metrics_summary(key: str, value: int, user_email: str = None, date: str = None):
     """
     Updates a specific metric in the metrics summary.
     Metrics are stored nested: {metric_key: {user_email (optional): {date: count}}}
     """
-    metrics = _read_json_file(METRICS_SUMMARY_FILE)
-    if not isinstance(metrics, dict): # Ensure it's a dictionary for metrics
-        metrics = {}
-
     if not date:
         date = datetime.now().strftime("%Y-%m-%d")
-
-    # Ensure the top-level metric key exists
-    if key not in metrics:
-        metrics[key] = {}
-
-    if user_email: # User-specific metrics (e.g., user_resumes_screened)
-        if user_email not in metrics[key]:
-            metrics[key][user_email] = {}
-        # Increment the count for that user on that specific date
-        metrics[key][user_email][date] = metrics[key][user_email].get(date, 0) + value
-    else: # Global metrics (e.g., total_resumes_screened)
-        # Increment the global count for that specific date
-        metrics[key][date] = metrics[key].get(date, 0) + value
-
-    _write_json_file(METRICS_SUMMARY_FILE, metrics)
+    # Counted in memory; written to disk by the next snapshot_metrics()
+    _ensure_snapshot_thread()
+    with _metrics_lock:
+        _apply_metric_increment(_pending_metrics, key, value, user_email, date)
     # print(f"Updated metric: {key}, {user_email if user_email else 'global'}, {date}, +{value}") # Uncomment for debugging
 
 def get_metrics_summary():
-    """Retrieves the full metrics summary."""
-    return _read_json_file(METRICS_SUMMARY_FILE)
+    """Retrieves the full metrics summary: the last snapshot plus the live in-memory counts."""
+    with _snapshot_lock:
+        metrics = _read_metrics_snapshot()
+        with _metrics_lock:
+            _merge_metrics(metrics, _pending_metrics)
+    return metrics
+
+def get_metrics_rollups():
+    """
+    Returns the pre-aggregated metrics ({"daily": {key: {date: count}}, "per_user": {key: {user: count}}},
+    see utils/metrics_rollups.py) including the live in-memory counts.
+    """
+    with _snapshot_lock:
+        rollups = load_rollups()
+        if rollups is None:
+            with metrics_file_lock():
+                rollups = rebuild_rollups(_read_metrics_snapshot())
+        with _metrics_lock:
+            apply_increments(rollups, _pending_metrics)
+    return rollups
+
+def rebuild_metrics_rollups():
+    """Recomputes the rollups from the persisted metrics store (see utils/metrics_rollups.py) and returns them."""
+    with _snapshot_lock:
+        with metrics_file_lock():
+            return rebuild_rollups(_read_metrics_snapshot())
 
-# Ensure log directories/files exist on import
-_initialize_log_file(USER_ACTIVITY_LOG_FILE)
-_initialize_log_file(SYSTEM_EVENTS_LOG_FILE)
+# Ensure log directories/files exist on import, converting pre-JSONL logs first
+_migrate_json_array_log(LEGACY_USER_ACTIVITY_LOG_FILE, USER_ACTIVITY_LOG_FILE)
+_migrate_json_array_log(LEGACY_SYSTEM_EVENTS_LOG_FILE, SYSTEM_EVENTS_LOG_FILE)
 _initialize_log_file(METRICS_SUMMARY_FILE)
+if LOG_BACKEND == LOG_BACKEND_SQLITE:
+    _initialize_db()
+# Write out whatever is still queued or counted when the process exits
+atexit.register(flush_logs)
+atexit.register(snapshot_metrics)
@@ -0,0 +1,84 @@
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Pre-aggregated views of the metrics for the admin dashboard, kept in data/metrics_rollups.json:
+#   {"daily":    {metric_key: {date: count}},        - per-day totals (summed over users for user metrics)
+#    "per_user": {metric_key: {user_email: count}}}  - all-time totals per user
+# They are updated incrementally from each metrics snapshot's increments (see utils/logger.py),
+# so reading them never touches the raw {key: {user: {date: count}}} history. Rolling 7/30-day
+# windows are summed from the last days of "daily" when read.
+# Updates of the shared file happen under the same cross-process lock as the metrics store
+# (utils.logger.metrics_file_lock), so concurrent snapshots can't overwrite each other's increments.
+METRICS_ROLLUPS_FILE = os.path.join("data", "metrics_rollups.json")
+ROLLUP_WINDOWS_DAYS = (7, 30)
+
+
+def empty_rollups():
+    return {"daily": {}, "per_user": {}}
+
+
+def apply_increments(rollups, increments):
+    """Folds nested {key: {user_email (optional): {date: count}}} increments into rollups in place."""
+    for key, values in increments.items():
+        daily = rollups["daily"].setdefault(key, {})
+        for name, value in values.items():
+            if isinstance(value, dict): # User-specific metric: {user_email: {date: count}}
+                per_user = rollups["per_user"].setdefault(key, {})
+                for date, count in value.items():
+                    daily[date] = daily.get(date, 0) + count
+                    per_user[name] = per_user.get(name, 0) + count
+            else: # Global metric: {date: count}
+                daily[name] = daily.get(name, 0) + value
+    return rollups
+
+
+def load_rollups():
+    try:
+        with open(METRICS_ROLLUPS_FILE, 'r', encoding="utf-8") as f:
+            rollups = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(rollups, dict) or "daily" not in rollups or "per_user" not in rollups:
+        return None
+    return rollups
+
+
+def save_rollups(rollups):
+    os.makedirs(os.path.dirname(METRICS_ROLLUPS_FILE), exist_ok=True)
+    tmp_filepath = f"{METRICS_ROLLUPS_FILE}.{os.getpid()}.tmp"
+    with open(tmp_filepath, 'w', encoding="utf-8") as f:
+        json.dump(rollups, f, indent=4)
+    os.replace(tmp_filepath, METRICS_ROLLUPS_FILE)
+
+
+def rebuild_rollups(metrics):
+    """Recomputes the rollups from the full metrics history and saves them."""
+    rollups = apply_increments(empty_rollups(), metrics)
+    save_rollups(rollups)
+    return rollups
+
+
+def window_total(rollups, key, days, today=None):
+    """Total of a metric over the last `days` days, today included."""
+    today = today or datetime.now().date()
+    first_date = (today - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    last_date = today.strftime("%Y-%m-%d")
+    return sum(count for date, count in rollups["daily"].get(key, {}).items() if first_date <= date <= last_date)
+
+
+def main(argv=None):
+    """`python -m utils.metrics_rollups rebuild` recomputes the rollups from the metrics store."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv != ["rebuild"]:
+        print("Usage: python -m utils.metrics_rollups rebuild", file=sys.stderr)
+        return 2
+    from utils.logger import rebuild_metrics_rollups
+    rollups = rebuild_metrics_rollups()
+    print(f"Rebuilt rollups for {len(rollups['daily'])} metric(s) in {METRICS_ROLLUPS_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
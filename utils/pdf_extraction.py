@@ -0,0 +1,109 @@
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from io import BytesIO
+
+import pdfplumber
+
+from utils.logger import log_system_event
+
+# Default number of worker processes used to extract text from uploaded PDFs
+DEFAULT_MAX_WORKERS = max(1, min(4, os.cpu_count() or 1))
+# Default number of seconds a single PDF may take before it is reported as timed out
+DEFAULT_TIMEOUT_SECONDS = 60
+
+
+class _ExtractionTimeout(Exception):
+    """Raised inside a worker process when a single PDF exceeds its time budget."""
+
+
+def _raise_extraction_timeout(signum, frame):
+    raise _ExtractionTimeout()
+
+
+def _extract_text_worker(pdf_bytes, timeout):
+    """
+    Extracts text from raw PDF bytes with pdfplumber, in a worker process or (single file) in-process.
+    Returns (text, error); exactly one of them is None.
+    """
+    # SIGALRM only exists on Unix and can only be handled on the main thread (Streamlit runs scripts on
+    # other threads); without it, in-process extraction is unbounded and pool workers rely on the parent
+    use_alarm = timeout and hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_extraction_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+            text = ''.join(page.extract_text() or '' for page in pdf.pages)
+        return text, None
+    except _ExtractionTimeout:
+        return None, f"Timed out after {timeout} seconds"
+    except Exception as e:
+        return None, str(e)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+def extract_texts_parallel(pdf_files, max_workers=DEFAULT_MAX_WORKERS, timeout=DEFAULT_TIMEOUT_SECONDS):
+    """
+    Extracts text from many PDFs concurrently using a process pool.
+
+    pdf_files is a list of (file_name, pdf_bytes) tuples in upload order.
+    Returns a list of dicts in the same order, one per file:
+        {"file_name": str, "text": str or None, "error": str or None}
+    A file that fails to parse or exceeds `timeout` seconds gets text=None and an error
+    message instead of aborting the whole batch.
+    """
+    results = [
+        {"file_name": file_name, "text": None, "error": None}
+        for file_name, _ in pdf_files
+    ]
+    if not pdf_files:
+        return results
+
+    batch_start = time.perf_counter()
+    workers = max(1, min(max_workers or 1, len(pdf_files)))
+
+    if workers == 1:
+        # Not worth spawning processes for a single file (or when parallelism is disabled)
+        for result, (_, pdf_bytes) in zip(results, pdf_files):
+            result["text"], result["error"] = _extract_text_worker(pdf_bytes, timeout)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            submitted_at = time.monotonic()
+            futures = [executor.submit(_extract_text_worker, pdf_bytes, timeout) for _, pdf_bytes in pdf_files]
+            for position, (result, future) in enumerate(zip(results, futures)):
+                try:
+                    # Backstop for platforms without SIGALRM; the worker normally enforces the timeout itself.
+                    # Each deadline is fixed from submission, allowing for the files queued ahead of this one,
+                    # so a stuck batch is bounded by its total budget rather than a fresh wait per file.
+                    wait = None
+                    if timeout:
+                        deadline = submitted_at + (position // workers + 1) * (timeout + 5)
+                        wait = max(0.0, deadline - time.monotonic())
+                    result["text"], result["error"] = future.result(timeout=wait)
+                except FutureTimeoutError:
+                    future.cancel()
+                    result["error"] = f"Timed out after {timeout} seconds"
+                except Exception as e:
+                    # e.g. BrokenProcessPool if a worker crashed on a malformed file
+                    result["error"] = str(e)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    for result in results:
+        if result["error"] is not None:
+            log_system_event("ERROR", "PDF_EXTRACTION_FAILED", {"filename": result["file_name"], "error": result["error"]})
+
+    log_system_event("INFO", "PDF_BATCH_EXTRACTED", {
+        "num_files": len(pdf_files),
+        "num_failed": sum(1 for result in results if result["error"] is not None),
+        "workers": workers,
+        "elapsed_seconds": round(time.perf_counter() - batch_start, 3)
+    })
+    return results
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import traceback
+from datetime import datetime
+
+from utils.logger import log_system_event
+
+# Content-addressed cache of per-resume work (extracted text, experience, contact info,
+# skills and embeddings), keyed by the SHA-256 of the raw PDF bytes.
+# Each entry is a single JSON file; file mtime doubles as the LRU access time.
+RESUME_CACHE_DIR = os.path.join("data", "resume_cache")
+RESUME_CACHE_MAX_BYTES = 512 * 1024 * 1024 # Evict least recently used entries beyond this size
+# Eviction trims down to this fraction of the limit so it doesn't run on every single write
+RESUME_CACHE_EVICT_TO_RATIO = 0.9
+
+
+def pdf_hash(pdf_bytes):
+    """Returns the SHA-256 hex digest used as the cache key for a PDF."""
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def _entry_path(digest):
+    return os.path.join(RESUME_CACHE_DIR, f"{digest}.json")
+
+
+def get_cached_resume(digest):
+    """
+    Returns the cached entry dict for a PDF digest, or None on a miss.
+    A hit refreshes the entry's access time for LRU eviction.
+    """
+    path = _entry_path(digest)
+    try:
+        with open(path, 'r', encoding="utf-8") as f:
+            entry = json.load(f)
+        os.utime(path, None)
+        return entry if isinstance(entry, dict) else None
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        # A corrupted entry is just treated as a miss and overwritten on the next write
+        log_system_event("WARNING", "RESUME_CACHE_READ_FAILED", {"digest": digest, "error": str(e)})
+        return None
+
+
+def cache_resume(digest, fields):
+    """
+    Merges `fields` into the cache entry for a PDF digest and writes it atomically.
+    Nested "embeddings" dicts ({model_name: vector}) are merged rather than replaced,
+    so vectors from different encoders can live side by side.
+    """
+    try:
+        os.makedirs(RESUME_CACHE_DIR, exist_ok=True)
+        entry = get_cached_resume(digest) or {}
+        embeddings = dict(entry.get("embeddings", {}))
+        embeddings.update(fields.get("embeddings", {}))
+        entry.update(fields)
+        entry["embeddings"] = embeddings
+        entry["updated_at"] = datetime.now().isoformat()
+
+        path = _entry_path(digest)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        # Caching is an optimization; never fail a screening because of it
+        log_system_event("ERROR", "RESUME_CACHE_WRITE_FAILED", {"digest": digest, "error": str(e), "traceback": traceback.format_exc()})
+
+
+def enforce_cache_limit(max_bytes=RESUME_CACHE_MAX_BYTES):
+    """Deletes least recently used entries until the cache is back under its size limit."""
+    if not os.path.isdir(RESUME_CACHE_DIR):
+        return
+    entries = []
+    total_bytes = 0
+    for file_name in os.listdir(RESUME_CACHE_DIR):
+        if not file_name.endswith(".json"):
+            continue
+        path = os.path.join(RESUME_CACHE_DIR, file_name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total_bytes += stat.st_size
+
+    if total_bytes <= max_bytes:
+        return
+
+    target_bytes = max_bytes * RESUME_CACHE_EVICT_TO_RATIO
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total_bytes <= target_bytes:
+            break
+        try:
+            os.remove(path)
+            total_bytes -= size
+            evicted += 1
+        except FileNotFoundError:
+            continue
+    log_system_event("INFO", "RESUME_CACHE_EVICTED", {"entries_evicted": evicted, "cache_bytes": total_bytes})
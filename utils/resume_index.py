@@ -0,0 +1,289 @@
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+import traceback
+from array import array
+from datetime import datetime
+
+from utils.file_lock import file_lock
+from utils.logger import log_system_event
+
+# Persistent inverted index over every resume ingested through the search page.
+#
+#   {"docs":     {doc_id: {"name": file name, "text": resume text, "offsets": array of token char starts,
+#                          "added_at": iso timestamp}},
+#    "postings": {term: {doc_id: array of token positions}},
+#    "total_tokens": sum of document lengths (for BM25's average document length)}
+#
+# doc_id is the PDF's SHA-256 (the resume cache key), so re-uploading a resume never indexes it twice.
+# Multi-word keywords are answered as phrase queries from the token positions, and snippet/highlight
+# spans come straight from the stored char offsets; nothing is re-scanned at query time.
+#
+# On disk it is a base snapshot (RESUME_INDEX_FILE) plus an append-only log (RESUME_INDEX_LOG_FILE) of
+# pickled [(doc_id, name, text, added_at), ...] batches, so adding resumes appends just the new batch
+# instead of re-pickling the whole index. Once the log passes RESUME_INDEX_COMPACT_BYTES it is folded
+# into a new snapshot. Writers (from any process) are serialized by a file lock and index on top of
+# everything already on disk, so concurrent uploads never drop each other's resumes; only one process
+# writes at a time. The index is held in memory per process; a reader replays just the log tail that
+# other processes appended since it last looked, and reloads fully after a compaction.
+RESUME_INDEX_FILE = os.path.join("data", "resume_index.pkl")
+RESUME_INDEX_LOG_FILE = os.path.join("data", "resume_index.log")
+RESUME_INDEX_COMPACT_BYTES = 64 * 1024 * 1024
+
+QUERY_MODE_AND = "and"
+QUERY_MODE_OR = "or"
+
+# Okapi BM25 parameters (the usual defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+DEFAULT_TOP_K = 50
+
+# Reciprocal rank fusion constant (Cormack et al.); dampens the weight of top ranks
+RRF_K = 60
+
+# Word tokens, keeping skill spellings like "c++", "c#", "node.js" and "asp.net" in one piece
+TOKEN_PATTERN = re.compile(r"\w+(?:[.+#]\w+)*[+#]*")
+
+_index = None
+_index_state = None # (snapshot signature, log bytes replayed) the in-memory index reflects
+_index_lock = threading.Lock()
+
+
+def tokenize(text):
+    """
+    Returns (lowercased token, char_start) pairs. Offsets index the original text: lowercasing can change
+    a string's length (e.g. "İ" becomes two code points), so each token is lowercased on its own.
+    """
+    return [(match.group().lower(), match.start()) for match in TOKEN_PATTERN.finditer(text)]
+
+
+def _empty_index():
+    return {"docs": {}, "postings": {}, "total_tokens": 0}
+
+
+def _index_documents(index, batch):
+    """Adds (doc_id, file_name, text, added_at) tuples to the in-memory index, skipping known doc_ids."""
+    postings = index["postings"]
+    for doc_id, name, text, added_at in batch:
+        if doc_id in index["docs"]:
+            continue
+        tokens = tokenize(text)
+        positions_by_term = {}
+        for position, (term, _) in enumerate(tokens):
+            positions_by_term.setdefault(term, array("I")).append(position)
+        for term, positions in positions_by_term.items():
+            postings.setdefault(term, {})[doc_id] = positions
+        index["total_tokens"] = index.get("total_tokens", 0) + len(tokens)
+        index["docs"][doc_id] = {
+            "name": name,
+            "text": text,
+            "offsets": array("I", (char_start for _, char_start in tokens)),
+            "added_at": added_at
+        }
+
+
+def _replay_log(index, offset):
+    """Indexes the log batches from byte offset on; returns the offset after the last complete batch."""
+    try:
+        with open(RESUME_INDEX_LOG_FILE, "rb") as f:
+            f.seek(offset)
+            while True:
+                try:
+                    batch = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError):
+                    break # End of log, or a batch another process is still appending
+                _index_documents(index, batch)
+                offset = f.tell()
+    except FileNotFoundError:
+        pass
+    return offset
+
+
+def _save_index(index):
+    os.makedirs(os.path.dirname(RESUME_INDEX_FILE), exist_ok=True)
+    tmp_path = f"{RESUME_INDEX_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, RESUME_INDEX_FILE)
+    return _snapshot_signature()
+
+
+def _snapshot_signature():
+    try:
+        stat = os.stat(RESUME_INDEX_FILE)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _disk_state():
+    snapshot_signature = _snapshot_signature()
+    try:
+        log_size = os.path.getsize(RESUME_INDEX_LOG_FILE)
+    except OSError:
+        log_size = 0
+    return snapshot_signature, log_size
+
+
+def get_resume_index():
+    """Returns the in-memory index, catching up with (or reloading) whatever other processes wrote to disk."""
+    global _index, _index_state
+    snapshot_signature, log_size = _disk_state()
+    if _index is not None and _index_state == (snapshot_signature, log_size):
+        return _index
+    with _index_lock:
+        if _index is not None and _index_state[0] == snapshot_signature and _index_state[1] <= log_size:
+            # Same snapshot: only the log tail appended since the last look is new
+            _index_state = (snapshot_signature, _replay_log(_index, _index_state[1]))
+            return _index
+        index = _empty_index()
+        if snapshot_signature is not None:
+            try:
+                with open(RESUME_INDEX_FILE, "rb") as f:
+                    index = pickle.load(f)
+            except Exception as e:
+                log_system_event("ERROR", "RESUME_INDEX_LOAD_FAILED", {"error": str(e), "traceback": traceback.format_exc()})
+        _index, _index_state = index, (snapshot_signature, _replay_log(index, 0))
+    return _index
+
+
+def add_resumes(resumes):
+    """
+    Indexes (doc_id, file_name, text) tuples that aren't in the index yet, appending them to the
+    index log as one batch. Returns the number of newly indexed resumes.
+    """
+    global _index_state
+    with file_lock(RESUME_INDEX_FILE):
+        index = get_resume_index() # Includes everything other writers appended before we got the lock
+        added_at = datetime.now().isoformat()
+        batch = [(doc_id, name, text, added_at) for doc_id, name, text in resumes if doc_id not in index["docs"]]
+        if not batch:
+            return 0
+        with _index_lock:
+            try:
+                os.makedirs(os.path.dirname(RESUME_INDEX_LOG_FILE), exist_ok=True)
+                with open(RESUME_INDEX_LOG_FILE, "ab") as f:
+                    pickle.dump(batch, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    log_size = f.tell()
+                _index_documents(index, batch)
+                _index_state = (_index_state[0], log_size)
+                if log_size > RESUME_INDEX_COMPACT_BYTES:
+                    # Fold the log into a new snapshot; a crash in between only makes the log replay known docs
+                    snapshot_signature = _save_index(index)
+                    open(RESUME_INDEX_LOG_FILE, "wb").close()
+                    _index_state = (snapshot_signature, 0)
+            except OSError as e:
+                _index_documents(index, batch)
+                log_system_event("ERROR", "RESUME_INDEX_SAVE_FAILED", {"error": str(e)})
+    log_system_event("INFO", "RESUME_INDEX_UPDATED", {"num_added": len(batch), "num_docs": len(index["docs"]), "num_terms": len(index["postings"])})
+    return len(batch)
+
+
+def phrase_matches(index, phrase, doc_ids=None):
+    """
+    Returns {doc_id: [(char_start, char_end), ...]} for every occurrence of the (single- or
+    multi-word) phrase, optionally limited to doc_ids. Phrases are matched on whole tokens.
+    """
+    terms = [term for term, _ in tokenize(phrase)]
+    if not terms:
+        return {}
+    term_postings = [index["postings"].get(term, {}) for term in terms]
+    if any(not postings for postings in term_postings):
+        return {}
+
+    # Only documents containing every term can contain the phrase; walk the rarest term's list
+    candidate_ids = min(term_postings, key=len).keys()
+    if doc_ids is not None:
+        candidate_ids = [doc_id for doc_id in candidate_ids if doc_id in doc_ids]
+
+    matches = {}
+    for doc_id in candidate_ids:
+        if any(doc_id not in postings for postings in term_postings):
+            continue
+        later_positions = [set(postings[doc_id]) for postings in term_postings[1:]]
+        starts = [
+            position for position in term_postings[0][doc_id]
+            if all(position + offset + 1 in positions for offset, positions in enumerate(later_positions))
+        ]
+        if starts:
+            # A lowercased term may be longer or shorter than its original spelling, so the span ends where
+            # the last token does in the document text
+            doc = index["docs"][doc_id]
+            offsets = doc["offsets"]
+            matches[doc_id] = [
+                (offsets[position], TOKEN_PATTERN.match(doc["text"], offsets[position + len(terms) - 1]).end())
+                for position in starts
+            ]
+    return matches
+
+
+def search_index(index, keywords, mode=QUERY_MODE_AND, doc_ids=None):
+    """
+    Answers a multi-keyword query from the postings lists.
+    Returns {doc_id: {keyword: [(char_start, char_end), ...]}} for documents that match all keywords
+    (mode "and") or any keyword (mode "or").
+    """
+    matches_by_keyword = {keyword: phrase_matches(index, keyword, doc_ids) for keyword in keywords}
+    if not matches_by_keyword:
+        return {}
+    if mode == QUERY_MODE_AND:
+        result_ids = set.intersection(*(set(matches) for matches in matches_by_keyword.values()))
+    else:
+        result_ids = set().union(*(matches for matches in matches_by_keyword.values()))
+    return {
+        doc_id: {keyword: matches[doc_id] for keyword, matches in matches_by_keyword.items() if doc_id in matches}
+        for doc_id in result_ids
+    }
+
+
+def _document_frequency(index, keyword):
+    """Number of indexed resumes containing the keyword (a single term, or a phrase)."""
+    terms = [term for term, _ in tokenize(keyword)]
+    if len(terms) == 1:
+        return len(index["postings"].get(terms[0], {}))
+    return len(phrase_matches(index, keyword))
+
+
+def rank_results(index, results, top_k=DEFAULT_TOP_K):
+    """
+    Scores search_index() results with Okapi BM25 (each keyword or phrase is one query term, its
+    frequency being the number of matches in the resume) and returns the top_k as
+    [(doc_id, score), ...], best first. Collection statistics are over the whole index.
+    """
+    if not results:
+        return []
+    num_docs = len(index["docs"])
+    avg_doc_length = (index.get("total_tokens") or sum(len(doc["offsets"]) for doc in index["docs"].values())) / num_docs
+
+    keywords = {keyword for matches in results.values() for keyword in matches}
+    idf = {}
+    for keyword in keywords:
+        doc_freq = _document_frequency(index, keyword)
+        idf[keyword] = math.log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def bm25(doc_id):
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * len(index["docs"][doc_id]["offsets"]) / avg_doc_length)
+        return sum(
+            idf[keyword] * len(spans) * (BM25_K1 + 1) / (len(spans) + length_norm)
+            for keyword, spans in results[doc_id].items()
+        )
+
+    # A bounded heap keeps this O(n log k) rather than sorting every hit
+    return heapq.nlargest(top_k, ((doc_id, bm25(doc_id)) for doc_id in results), key=lambda item: item[1])
+
+
+def reciprocal_rank_fusion(rankings, k=RRF_K, top_k=DEFAULT_TOP_K):
+    """
+    Fuses several rankings ([(doc_id, score), ...], best first) into one by reciprocal rank fusion:
+    each document scores sum(1 / (k + rank)) over the rankings it appears in. Only ranks are used,
+    so rankings with incomparable scores (BM25, cosine similarity) combine cleanly.
+    Returns the top_k as [(doc_id, fused_score), ...], best first.
+    """
+    fused = {}
+    for ranking in rankings:
+        for rank, (doc_id, _) in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return heapq.nlargest(top_k, fused.items(), key=lambda item: item[1])
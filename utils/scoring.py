@@ -0,0 +1,695 @@
+import os
+import re
+import threading
+import traceback
+from datetime import datetime
+
+import joblib
+import nltk
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.encoders import ENCODER_BACKEND, load_encoder, encoder_cache_key
+from utils.logger import log_system_event
+from utils.skill_matcher import build_skill_automaton, extract_skills
+
+# Resume scoring logic shared by the Streamlit screener page and headless batch screening.
+# Nothing in this module imports streamlit.
+
+# Download NLTK stopwords data if not already downloaded
+try:
+    nltk.data.find('corpora/stopwords')
+except LookupError:
+    nltk.download('stopwords')
+    log_system_event("INFO", "NLTK_DOWNLOAD", {"resource": "stopwords"}) # Log NLTK download
+
+# --- Embedding + ML Model ---
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+# Cached embeddings are keyed per encoder backend (see utils/encoders.py)
+EMBEDDING_CACHE_KEY = encoder_cache_key(EMBEDDING_MODEL_NAME)
+ML_MODEL_PATH = "ml_screening_model.pkl"
+# Number of resumes passed to the sentence transformer per forward pass during batched scoring
+EMBEDDING_BATCH_SIZE = 32
+
+def load_models():
+    """
+    Loads the sentence encoder (backend chosen by SCREENER_ENCODER_BACKEND) and the pickled
+    relevance model. Returns (model, ml_model), or (None, None) if either fails to load.
+    """
+    try:
+        model = get_encoder()
+        if model is None:
+            raise RuntimeError(f"Sentence encoder {EMBEDDING_MODEL_NAME} failed to load.")
+        if not os.path.exists(ML_MODEL_PATH):
+            raise FileNotFoundError(f"{ML_MODEL_PATH} not found.")
+        ml_model = joblib.load(ML_MODEL_PATH)
+        log_system_event("INFO", "ML_MODEL_LOADED", {"model_name": EMBEDDING_MODEL_NAME, "encoder_backend": ENCODER_BACKEND, "ml_model_file": ML_MODEL_PATH})
+        return model, ml_model
+    except Exception as e:
+        log_system_event("ERROR", "ML_MODEL_LOAD_FAILED", {"error": str(e), "traceback": traceback.format_exc()})
+        return None, None
+
+# Lazily loaded (model, ml_model) pair shared by every caller in the process.
+# Nothing is loaded at import time; the first get_models() call (or the warm-up thread) pays the cost.
+_models = None
+_models_lock = threading.Lock()
+_warmup_thread = None
+_warmup_lock = threading.Lock()
+# The sentence encoder on its own, for callers that only embed text (e.g. JD uploads); shared with get_models()
+_encoder = None
+_encoder_lock = threading.Lock()
+
+def get_encoder():
+    """
+    Returns the shared sentence encoder, loading only the encoder (not the relevance model) on first use.
+    Returns None if it fails to load; unlike get_models(), a failed load is retried on the next call.
+    """
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                try:
+                    _encoder = load_encoder(EMBEDDING_MODEL_NAME)
+                except Exception as e:
+                    log_system_event("ERROR", "ENCODER_LOAD_FAILED", {"error": str(e), "traceback": traceback.format_exc()})
+    return _encoder
+
+def get_models():
+    """
+    Returns the shared (model, ml_model) pair, loading it on first use.
+    Thread-safe: concurrent callers wait for the single in-flight load instead of loading twice.
+    A failed load is remembered as (None, None), like the previous cached loader.
+    """
+    global _models
+    if _models is None:
+        with _models_lock:
+            if _models is None:
+                _models = load_models()
+    return _models
+
+def start_model_warmup():
+    """
+    Starts a background daemon thread that loads the models, so app start-up isn't blocked
+    and the first screening usually finds them ready. Safe to call on every Streamlit rerun;
+    at most one warm-up thread is ever started per process.
+    """
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is None and _models is None:
+            _warmup_thread = threading.Thread(target=get_models, name="model-warmup", daemon=True)
+            _warmup_thread.start()
+    return _warmup_thread
+
+# --- Stop Words List (Using NLTK) ---
+NLTK_STOP_WORDS = set(nltk.corpus.stopwords.words('english'))
+CUSTOM_STOP_WORDS = set([
+    "work", "experience", "years", "year", "months", "month", "day", "days", "project", "projects",
+    "team", "teams", "developed", "managed", "led", "created", "implemented", "designed",
+    "responsible", "proficient", "knowledge", "ability", "strong", "proven", "demonstrated",
+    "solution", "solutions", "system", "systems", "platform", "platforms", "framework", "frameworks",
+    "database", "databases", "server", "servers", "cloud", "computing", "machine", "learning",
+    "artificial", "intelligence", "api", "apis", "rest", "graphql", "agile", "scrum", "kanban",
+    "devops", "ci", "cd", "testing", "qa",
+    "security", "network", "networking", "virtualization",
+    "containerization", "docker", "kubernetes", "git", "github", "gitlab", "bitbucket", "jira",
+    "confluence", "slack", "microsoft", "google", "amazon", "azure", "oracle", "sap", "crm", "erp",
+    "salesforce", "servicenow", "tableau", "powerbi", "qlikview", "excel", "word", "powerpoint",
+    "outlook", "visio", "html", "css", "js", "web", "data", "science", "analytics", "engineer",
+    "software", "developer", "analyst", "business", "management", "reporting", "analysis", "tools",
+    "python", "java", "javascript", "c++", "c#", "php", "ruby", "go", "swift", "kotlin", "r",
+    "sql", "nosql", "linux", "unix", "windows", "macos", "ios", "android", "mobile", "desktop",
+    "application", "applications", "frontend", "backend", "fullstack", "ui", "ux", "design",
+    "architecture", "architect", "engineering", "scientist", "specialist", "consultant",
+    "associate", "senior", "junior", "lead", "principal", "director", "manager", "head", "chief",
+    "officer", "president", "vice", "executive", "ceo", "cto", "cfo", "coo", "hr", "human",
+    "resources", "recruitment", "talent", "acquisition", "onboarding", "training", "development",
+    "performance", "compensation", "benefits", "payroll", "compliance", "legal", "finance",
+    "accounting", "auditing", "tax", "budgeting", "forecasting", "investments", "marketing",
+    "sales", "customer", "service", "support", "operations", "supply", "chain", "logistics",
+    "procurement", "manufacturing", "production", "quality", "assurance", "control", "research",
+    "innovation", "product", "program", "portfolio", "governance", "risk", "communication",
+    "presentation", "negotiation", "problem", "solving", "critical", "thinking", "analytical",
+    "creativity", "adaptability", "flexibility", "teamwork", "collaboration", "interpersonal",
+    "organizational", "time", "multitasking", "detail", "oriented", "independent", "proactive",
+    "self", "starter", "results", "driven", "client", "facing", "stakeholder", "engagement",
+    "vendor", "budget", "cost", "reduction", "process", "improvement", "standardization",
+    "optimization", "automation", "digital", "transformation", "change", "methodologies",
+    "industry", "regulations", "regulatory", "documentation", "technical", "writing",
+    "dashboards", "visualizations", "workshops", "feedback", "reviews", "appraisals",
+    "offboarding", "employee", "relations", "diversity", "inclusion", "equity", "belonging",
+    "corporate", "social", "responsibility", "csr", "sustainability", "environmental", "esg",
+    "ethics", "integrity", "professionalism", "confidentiality", "discretion", "accuracy",
+    "precision", "efficiency", "effectiveness", "scalability", "robustness", "reliability",
+    "vulnerability", "assessment", "penetration", "incident", "response", "disaster",
+    "recovery", "continuity", "bcp", "drp", "gdpr", "hipaa", "soc2", "iso", "nist", "pci",
+    "dss", "ccpa", "privacy", "protection", "grc", "cybersecurity", "information", "infosec",
+    "threat", "intelligence", "soc", "event", "siem", "identity", "access", "iam", "privileged",
+    "pam", "multi", "factor", "authentication", "mfa", "single", "sign", "on", "sso",
+    "encryption", "decryption", "firewall", "ids", "ips", "vpn", "endpoint", "antivirus",
+    "malware", "detection", "forensics", "handling", "assessments", "policies", "procedures",
+    "guidelines", "mitre", "att&ck", "modeling", "secure", "lifecycle", "sdlc", "awareness",
+    "phishing", "vishing", "smishing", "ransomware", "spyware", "adware", "rootkits",
+    "botnets", "trojans", "viruses", "worms", "zero", "day", "exploits", "patches", "patching",
+    "updates", "upgrades", "configuration", "ticketing", "crm", "erp", "scm", "hcm", "financial",
+    "accounting", "bi", "warehousing", "etl", "extract", "transform", "load", "lineage",
+    "master", "mdm", "lakes", "marts", "big", "hadoop", "spark", "kafka", "flink", "mongodb",
+    "cassandra", "redis", "elasticsearch", "relational", "mysql", "postgresql", "db2",
+    "teradata", "snowflake", "redshift", "synapse", "bigquery", "aurora", "dynamodb",
+    "documentdb", "cosmosdb", "graph", "neo4j", "graphdb", "timeseries", "influxdb",
+    "timescaledb", "columnar", "vertica", "clickhouse", "vector", "pinecone", "weaviate",
+    "milvus", "qdrant", "chroma", "faiss", "annoy", "hnswlib", "scikit", "learn", "tensorflow",
+    "pytorch", "keras", "xgboost", "lightgbm", "catboost", "statsmodels", "numpy", "pandas",
+    "matplotlib", "seaborn", "plotly", "bokeh", "dash", "flask", "django", "fastapi", "spring",
+    "boot", ".net", "core", "node.js", "express.js", "react", "angular", "vue.js", "svelte",
+    "jquery", "bootstrap", "tailwind", "sass", "less", "webpack", "babel", "npm", "yarn",
+    "ansible", "terraform", "jenkins", "gitlab", "github", "actions", "codebuild", "codepipeline",
+    "codedeploy", "build", "deploy", "run", "lambda", "functions", "serverless", "microservices",
+    "gateway", "mesh", "istio", "linkerd", "grpc", "restful", "soap", "message", "queues",
+    "rabbitmq", "activemq", "bus", "sqs", "sns", "pubsub", "version", "control", "svn",
+    "mercurial", "trello", "asana", "monday.com", "smartsheet", "project", "primavera",
+    "zendesk", "freshdesk", "itil", "cobit", "prince2", "pmp", "master", "owner", "lean",
+    "six", "sigma", "black", "belt", "green", "yellow", "qms", "9001", "27001", "14001",
+    "ohsas", "18001", "sa", "8000", "cmii", "cmi", "cism", "cissp", "ceh", "comptia",
+    "security+", "network+", "a+", "linux+", "ccna", "ccnp", "ccie", "certified", "solutions",
+    "architect", "developer", "sysops", "administrator", "specialty", "professional", "azure",
+    "az-900", "az-104", "az-204", "az-303", "az-304", "az-400", "az-500", "az-700", "az-800",
+    "az-801", "dp-900", "dp-100", "dp-203", "ai-900", "ai-102", "da-100", "pl-900", "pl-100",
+    "pl-200", "pl-300", "pl-400", "pl-500", "ms-900", "ms-100", "ms-101", "ms-203", "ms-500",
+    "ms-700", "ms-720", "ms-740", "ms-600", "sc-900", "sc-200", "sc-300", "sc-400", "md-100",
+    "md-101", "mb-200", "mb-210", "mb-220", "mb-230", "mb-240", "mb-260", "mb-300", "mb-310",
+    "mb-320", "mb-330", "mb-340", "mb-400", "mb-500", "mb-600", "mb-700", "mb-800", "mb-910",
+    "mb-920", "gcp-ace", "gcp-pca", "gcp-pde", "gcp-pse", "gcp-pml", "gcp-psa", "gcp-pcd",
+    "gcp-pcn", "gcp-psd", "gcp-pda", "gcp-pci", "gcp-pws", "gcp-pwa", "gcp-pme", "gcp-pms",
+    "gcp-pmd", "gcp-pma", "gcp-pmc", "gcp-pmg", "cisco", "juniper", "red", "hat", "rhcsa",
+    "rhce", "vmware", "vcpa", "vcpd", "vcpi", "vcpe", "vcpx", "citrix", "cc-v", "cc-p",
+    "cc-e", "cc-m", "cc-s", "cc-x", "palo", "alto", "pcnsa", "pcnse", "fortinet", "fcsa",
+    "fcsp", "fcc", "fcnsp", "fct", "fcp", "fcs", "fce", "fcn", "fcnp", "fcnse"
+])
+STOP_WORDS = NLTK_STOP_WORDS.union(CUSTOM_STOP_WORDS)
+
+# --- MASTER SKILLS LIST ---
+# Paste your comprehensive list of skills here.
+# These skills will be used to filter words for the word cloud and
+# to identify 'Matched Keywords' and 'Missing Skills'.
+# Keep this set empty if you want the system to use its default stop word filtering.
+MASTER_SKILLS = set([
+        # Product & Project Management
+    "Product Strategy", "Roadmap Development", "Agile Methodologies", "Scrum", "Kanban", "Jira", "Trello",
+    "Feature Prioritization", "OKRs", "KPIs", "Stakeholder Management", "A/B Testing", "User Stories", "Epics",
+    "Product Lifecycle", "Sprint Planning", "Project Charter", "Gantt Charts", "MVP", "Backlog Grooming",
+    "Risk Management", "Change Management", "Program Management", "Portfolio Management", "PMP", "CSM",
+
+    # Software Development & Engineering
+    "Python", "Java", "JavaScript", "C++", "C#", "Go", "Ruby", "PHP", "Swift", "Kotlin", "TypeScript",
+    "HTML5", "CSS3", "React", "Angular", "Vue.js", "Node.js", "Django", "Flask", "Spring Boot", "Express.js",
+    "Git", "GitHub", "GitLab", "Bitbucket", "REST APIs", "GraphQL", "Microservices", "System Design",
+    "Unit Testing", "Integration Testing", "End-to-End Testing", "Test Automation", "CI/CD", "Docker", "Kubernetes",
+    "Serverless", "AWS Lambda", "Azure Functions", "Google Cloud Functions", "WebSockets", "Kafka", "RabbitMQ",
+    "Redis", "SQL", "NoSQL", "PostgreSQL", "MySQL", "MongoDB", "Cassandra", "Elasticsearch", "Neo4j",
+    "Data Structures", "Algorithms", "Object-Oriented Programming", "Functional Programming", "Bash Scripting",
+    "Shell Scripting", "DevOps", "DevSecOps", "SRE", "CloudFormation", "Terraform", "Ansible", "Puppet", "Chef",
+    "Jenkins", "CircleCI", "GitHub Actions", "Azure DevOps", "Jira", "Confluence", "Swagger", "OpenAPI",
+
+    # Data Science & AI/ML
+    "Machine Learning", "Deep Learning", "Natural Language Processing", "Computer Vision", "Reinforcement Learning",
+    "Scikit-learn", "TensorFlow", "PyTorch", "Keras", "XGBoost", "LightGBM", "Data Cleaning", "Feature Engineering",
+    "Model Evaluation", "Statistical Modeling", "Time Series Analysis", "Predictive Modeling", "Clustering",
+    "Classification", "Regression", "Neural Networks", "Convolutional Networks", "Recurrent Networks",
+    "Transformers", "LLMs", "Prompt Engineering", "Generative AI", "MLOps", "Data Munging", "A/B Testing",
+    "Experiment Design", "Hypothesis Testing", "Bayesian Statistics", "Causal Inference", "Graph Neural Networks",
+
+    # Data Analytics & BI
+    "SQL", "Python (Pandas, NumPy)", "R", "Excel (Advanced)", "Tableau", "Power BI", "Looker", "Qlik Sense",
+    "Google Data Studio", "Dax", "M Query", "ETL", "ELT", "Data Warehousing", "Data Lake", "Data Modeling",
+    "Business Intelligence", "Data Visualization", "Dashboarding", "Report Generation", "Google Analytics",
+    "BigQuery", "Snowflake", "Redshift", "Data Governance", "Data Quality", "Statistical Analysis",
+    "Requirements Gathering", "Data Storytelling",
+
+    # Cloud & Infrastructure
+    "AWS", "Azure", "Google Cloud Platform", "GCP", "Cloud Architecture", "Hybrid Cloud", "Multi-Cloud",
+    "Virtualization", "VMware", "Hyper-V", "Linux Administration", "Windows Server", "Networking", "TCP/IP",
+    "DNS", "VPN", "Firewalls", "Load Balancing", "CDN", "Monitoring", "Logging", "Alerting", "Prometheus",
+    "Grafana", "Splunk", "ELK Stack", "Cloud Security", "IAM", "VPC", "Storage (S3, Blob, GCS)", "Databases (RDS, Azure SQL)",
+    "Container Orchestration", "Infrastructure as Code", "IaC",
+
+    # UI/UX & Design
+    "Figma", "Adobe XD", "Sketch", "Photoshop", "Illustrator", "InDesign", "User Research", "Usability Testing",
+    "Wireframing", "Prototyping", "UI Design", "UX Design", "Interaction Design", "Information Architecture",
+    "Design Systems", "Accessibility", "Responsive Design", "User Flows", "Journey Mapping", "Design Thinking",
+    "Visual Design", "Motion Graphics",
+
+    # Marketing & Sales
+    "Digital Marketing", "SEO", "SEM", "Content Marketing", "Email Marketing", "Social Media Marketing",
+    "Google Ads", "Facebook Ads", "LinkedIn Ads", "Marketing Automation", "HubSpot", "Salesforce Marketing Cloud",
+    "CRM", "Lead Generation", "Sales Strategy", "Negotiation", "Account Management", "Market Research",
+    "Campaign Management", "Conversion Rate Optimization", "CRO", "Brand Management", "Public Relations",
+    "Copywriting", "Content Creation", "Analytics (Google Analytics, SEMrush, Ahrefs)",
+
+    # Finance & Accounting
+    "Financial Modeling", "Valuation", "Financial Reporting", "GAAP", "IFRS", "Budgeting", "Forecasting",
+    "Variance Analysis", "Auditing", "Taxation", "Accounts Payable", "Accounts Receivable", "Payroll",
+    "QuickBooks", "SAP FICO", "Oracle Financials", "Cost Accounting", "Management Accounting", "Treasury Management",
+    "Investment Analysis", "Risk Analysis", "Compliance (SOX, AML)",
+
+    # Human Resources (HR)
+    "Talent Acquisition", "Recruitment", "Onboarding", "Employee Relations", "HRIS (Workday, SuccessFactors)",
+    "Compensation & Benefits", "Performance Management", "Workforce Planning", "HR Policies", "Labor Law",
+    "Training & Development", "Diversity & Inclusion", "Conflict Resolution", "Employee Engagement",
+
+    # Customer Service & Support
+    "Customer Relationship Management", "CRM", "Zendesk", "ServiceNow", "Intercom", "Live Chat", "Ticketing Systems",
+    "Issue Resolution", "Technical Support", "Customer Success", "Client Retention", "Communication Skills",
+
+    # General Business & Soft Skills (often paired with technical skills)
+    "Strategic Planning", "Business Development", "Vendor Management", "Process Improvement", "Operations Management",
+    "Project Coordination", "Public Speaking", "Presentation Skills", "Cross-functional Collaboration",
+    "Problem Solving", "Critical Thinking", "Analytical Skills", "Adaptability", "Time Management",
+    "Organizational Skills", "Attention to Detail", "Leadership", "Mentorship", "Team Leadership",
+    "Decision Making", "Negotiation", "Client Management", "Stakeholder Communication", "Active Listening",
+    "Creativity", "Innovation", "Research", "Data Analysis", "Report Writing", "Documentation",
+    "Microsoft Office Suite", "Google Workspace", "Slack", "Zoom", "Confluence", "SharePoint",
+    "Cybersecurity", "Information Security", "Risk Assessment", "Compliance", "GDPR", "HIPAA", "ISO 27001",
+    "Penetration Testing", "Vulnerability Management", "Incident Response", "Security Audits", "Forensics",
+    "Threat Intelligence", "SIEM", "Firewall Management", "Endpoint Security", "Identity and Access Management",
+    "IAM", "Cryptography", "Network Security", "Application Security", "Cloud Security",
+
+    # Specific Certifications/Tools often treated as skills
+    "PMP", "CSM", "AWS Certified", "Azure Certified", "GCP Certified", "CCNA", "CISSP", "CISM", "CompTIA Security+",
+    "ITIL", "Lean Six Sigma", "CFA", "CPA", "SHRM-CP", "PHR", "CEH", "OSCP", "Splunk", "ServiceNow", "Salesforce",
+    "Workday", "SAP", "Oracle", "Microsoft Dynamics", "NetSuite", "Adobe Creative Suite", "Canva", "Mailchimp",
+    "Hootsuite", "Buffer", "SEMrush", "Ahrefs", "Moz", "Screaming Frog", "JMeter", "Postman", "SoapUI",
+    "Git", "SVN", "Perforce", "Confluence", "Jira", "Asana", "Trello", "Monday.com", "Miro", "Lucidchart",
+    "Visio", "MS Project", "Primavera", "AutoCAD", "SolidWorks", "MATLAB", "LabVIEW", "Simulink", "ANSYS",
+    "CATIA", "NX", "Revit", "ArcGIS", "QGIS", "OpenCV", "NLTK", "SpaCy", "Gensim", "Hugging Face Transformers",
+    "Docker Compose", "Helm", "Ansible Tower", "SaltStack", "Chef InSpec", "Terraform Cloud", "Vault",
+    "Consul", "Nomad", "Prometheus", "Grafana", "Alertmanager", "Loki", "Tempo", "Jaeger", "Zipkin",
+    "Fluentd", "Logstash", "Kibana", "Grafana Loki", "Datadog", "New Relic", "AppDynamics", "Dynatrace",
+    "Nagios", "Zabbix", "Icinga", "PRTG", "SolarWinds", "Wireshark", "Nmap", "Metasploit", "Burp Suite",
+    "OWASP ZAP", "Nessus", "Qualys", "Rapid7", "Tenable", "CrowdStrike", "SentinelOne", "Palo Alto Networks",
+    "Fortinet", "Cisco Umbrella", "Okta", "Auth0", "Keycloak", "Ping Identity", "Active Directory",
+    "LDAP", "OAuth", "JWT", "OpenID Connect", "SAML", "MFA", "SSO", "PKI", "TLS/SSL", "VPN", "IDS/IPS",
+    "DLP", "CASB", "SOAR", "XDR", "EDR", "MDR", "GRC", "GDPR Compliance", "HIPAA Compliance", "PCI DSS Compliance",
+    "ISO 27001 Compliance", "NIST Framework", "COBIT", "ITIL Framework", "Scrum Master", "Product Owner",
+    "Agile Coach", "Release Management", "Change Control", "Configuration Management", "Asset Management",
+    "Service Desk", "Incident Management", "Problem Management", "Change Management", "Release Management",
+    "Service Level Agreements", "SLAs", "Operational Level Agreements", "OLAs", "Underpinning Contracts", "UCs",
+    "Knowledge Management", "Continual Service Improvement", "CSI", "Service Catalog", "Service Portfolio",
+    "Relationship Management", "Supplier Management", "Financial Management for IT Services",
+    "Demand Management", "Capacity Management", "Availability Management", "Information Security Management",
+    "Supplier Relationship Management", "Contract Management", "Procurement Management", "Quality Management",
+    "Test Management", "Defect Management", "Requirements Management", "Scope Management", "Time Management",
+    "Cost Management", "Quality Management", "Resource Management", "Communications Management",
+    "Risk Management", "Procurement Management", "Stakeholder Management", "Integration Management",
+    "Project Charter", "Project Plan", "Work Breakdown Structure", "WBS", "Gantt Chart", "Critical Path Method",
+    "CPM", "Earned Value Management", "EVM", "PERT", "CPM", "Crashing", "Fast Tracking", "Resource Leveling",
+    "Resource Smoothing", "Agile Planning", "Scrum Planning", "Kanban Planning", "Sprint Backlog",
+    "Product Backlog", "User Story Mapping", "Relative Sizing", "Planning Poker", "Velocity", "Burndown Chart",
+    "Burnup Chart", "Cumulative Flow Diagram", "CFD", "Value Stream Mapping", "VSM", "Lean Principles",
+    "Six Sigma", "Kaizen", "Kanban", "Total Quality Management", "TQM", "Statistical Process Control", "SPC",
+    "Control Charts", "Pareto Analysis", "Fishbone Diagram", "5 Whys", "FMEA", "Root Cause Analysis", "RCA",
+    "Corrective Actions", "Preventive Actions", "CAPA", "Non-conformance Management", "Audit Management",
+    "Document Control", "Record Keeping", "Training Management", "Calibration Management", "Supplier Quality Management",
+    "Customer Satisfaction Measurement", "Net Promoter Score", "NPS", "Customer Effort Score", "CES",
+    "Customer Satisfaction Score", "CSAT", "Voice of Customer", "VOC", "Complaint Handling", "Warranty Management",
+    "Returns Management", "Service Contracts", "Service Agreements", "Maintenance Management", "Field Service Management",
+    "Asset Management", "Enterprise Asset Management", "EAM", "Computerized Maintenance Management System", "CMMS",
+    "Geographic Information Systems", "GIS", "GPS", "Remote Sensing", "Image Processing", "CAD", "CAM", "CAE",
+    "FEA", "CFD", "PLM", "PDM", "ERP", "CRM", "SCM", "HRIS", "BI", "Analytics", "Data Science", "Machine Learning",
+    "Deep Learning", "NLP", "Computer Vision", "AI", "Robotics", "Automation", "IoT", "Blockchain", "Cybersecurity",
+    "Cloud Computing", "Big Data", "Data Warehousing", "ETL", "Data Modeling", "Data Governance", "Data Quality",
+    "Data Migration", "Data Integration", "Data Virtualization", "Data Lakehouse", "Data Mesh", "Data Fabric",
+    "Data Catalog", "Data Lineage", "Metadata Management", "Master Data Management", "MDM",
+    "Customer Data Platform", "CDP", "Digital Twin", "Augmented Reality", "AR", "Virtual Reality", "VR",
+    "Mixed Reality", "MR", "Extended Reality", "XR", "Game Development", "Unity", "Unreal Engine", "C# (Unity)",
+    "C++ (Unreal Engine)", "Game Design", "Level Design", "Character Design", "Environment Design",
+    "Animation (Game)", "Rigging", "Texturing", "Shading", "Lighting", "Rendering", "Game Physics",
+    "Game AI", "Multiplayer Networking", "Game Monetization", "Game Analytics", "Playtesting",
+    "Game Publishing", "Streaming (Gaming)", "Community Management (Gaming)",
+    "Game Art", "Game Audio", "Sound Design (Game)", "Music Composition (Game)", "Voice Acting (Game)",
+    "Narrative Design", "Storytelling (Game)", "Dialogue Writing", "World Building", "Lore Creation",
+    "Game Scripting", "Modding", "Game Engine Development", "Graphics Programming", "Physics Programming",
+    "AI Programming (Game)", "Network Programming (Game)", "Tools Programming (Game)", "UI Programming (Game)",
+    "Shader Development", "VFX (Game)", "Technical Art", "Technical Animation", "Technical Design",
+    "Build Engineering (Game)", "Release Engineering (Game)", "Live Operations (Game)", "Game Balancing",
+    "Economy Design (Game)", "Progression Systems (Game)", "Retention Strategies (Game)", "Monetization Strategies (Game)",
+    "User Acquisition (Game)", "Marketing (Game)", "PR (Game)", "Community Management (Game)",
+    "Customer Support (Game)", "Localization (Game)", "Quality Assurance (Game)", "Game Testing",
+    "Compliance (Game)", "Legal (Game)", "Finance (Game)", "HR (Game)", "Business Development (Game)",
+    "Partnerships (Game)", "Licensing (Game)", "Brand Management (Game)", "IP Management (Game)",
+    "Esports Event Management", "Esports Team Management", "Esports Coaching", "Esports Broadcasting",
+    "Esports Sponsorship", "Esports Marketing", "Esports Analytics", "Esports Operations",
+    "Esports Content Creation", "Esports Journalism", "Esports Law", "Esports Finance", "Esports HR",
+    "Esports Business Development", "Esports Partnerships", "Esports Licensing", "Esports Brand Management",
+    "Esports IP Management", "Esports Event Planning", "Esports Production", "Esports Broadcasting",
+    "Esports Commentating", "Esports Analysis", "Esports Coaching", "Esports Training", "Esports Recruitment",
+    "Esports Scouting", "Esports Player Management", "Esports Team Management", "Esports Organization Management",
+    "Esports League Management", "Esports Tournament Management", "Esports Venue Management Software",
+    "Esports Sponsorship Management Software", "Esports Marketing Automation Software",
+    "Esports Content Management Systems", "Esports Social Media Management Tools",
+    "Esports PR Tools", "Esports Brand Monitoring Tools", "Esports Community Management Software",
+    "Esports Fan Engagement Platforms", "Esports Merchandise Management Software",
+    "Esports Ticketing Platforms", "Esports Hospitality Management Software",
+    "Esports Logistics Management Software", "Esports Security Management Software",
+    "Esports Legal Management Software", "Esports Finance Management Software",
+    "Esports HR Management Software", "Esports Business Operations Software",
+    "Esports Data Analytics Software", "Esports Performance Analysis Software",
+    "Esports Coaching Software", "Esports Training Platforms", "Esports Scouting Tools",
+    "Esports Player Databases", "Esports Team Databases", "Esports Organization Databases",
+    "Esports League Databases"
+])
+STOP_WORDS = NLTK_STOP_WORDS.union(CUSTOM_STOP_WORDS)
+
+# --- Skill Matching Automata ---
+# Compiled once at import so extract_relevant_keywords never rebuilds per-skill regexes
+MASTER_SKILLS_AUTOMATON = build_skill_automaton(MASTER_SKILLS)
+_skill_automaton_cache = {}
+
+def _get_skill_automaton(filter_set):
+    """Returns the prebuilt automaton for MASTER_SKILLS, or a cached one for any other filter set."""
+    if filter_set is MASTER_SKILLS:
+        return MASTER_SKILLS_AUTOMATON
+    key = frozenset(filter_set)
+    if key not in _skill_automaton_cache:
+        _skill_automaton_cache[key] = build_skill_automaton(key)
+    return _skill_automaton_cache[key]
+
+# --- Text Helpers ---
+def extract_years_of_experience(text):
+    """
+    Extracts years of experience from text.
+    Looks for patterns like 'X years experience', 'X+ years', 'experience of X years'.
+    Returns the maximum number of years found.
+    """
+    text = text.lower()
+    total_months = 0
+    job_date_ranges = re.findall(
+        r'(\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4})\s*(?:to|–|-)\s*(present|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4})',
+        text
+    )
+
+    for start, end in job_date_ranges:
+        try:
+            start_date = datetime.strptime(start.strip(), '%b %Y')
+        except ValueError:
+            try:
+                start_date = datetime.strptime(start.strip(), '%B %Y')
+                # If month is full name, try with full name
+            except ValueError:
+                continue
+
+        if end.strip() == 'present':
+            end_date = datetime.now()
+        else:
+            try:
+                end_date = datetime.strptime(end.strip(), '%b %Y')
+            except ValueError:
+                try:
+                    end_date = datetime.strptime(end.strip(), '%B %Y')
+                except ValueError:
+                    continue
+
+        delta_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+        total_months += max(delta_months, 0)
+
+    if total_months == 0:
+        # Fallback to simple regex if date range extraction fails
+        match = re.search(r'(\d+(?:\.\d+)?)\s*(\+)?\s*(year|yrs|years)\b', text)
+        if not match:
+            match = re.search(r'experience[^\d]{0,10}(\d+(?:\.\d+)?)', text)
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                log_system_event("WARNING", "EXPERIENCE_PARSE_ERROR", {"text_snippet": text[:50], "error": "Could not convert to float"})
+                return 0.0
+    return round(total_months / 12, 1)
+
+def extract_contact_info(text):
+    """Extracts email and phone number using regex."""
+    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    phone_match = re.search(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+    return email_match.group(0) if email_match else "N/A", phone_match.group(0) if phone_match else "N/A"
+
+def clean_text_for_wordcloud(text):
+    """Basic cleaning for word cloud to remove non-alphanumeric and extra spaces."""
+    # Remove special characters, numbers, and convert to lowercase
+    text = re.sub(r'[^a-zA-Z\s]', '', text)
+    # Remove common resume sections or generic words that won't add value
+    stop_words = ["experience", "years", "skills", "education", "project", "work", "roles", "description", "responsibilities", "knowledge", "ability", "developed", "used", "proficient", "strong"]
+    words = text.lower().split()
+    cleaned_words = [word for word in words if word not in stop_words and len(word) > 2]
+    return " ".join(cleaned_words)
+
+def clean_text(text):
+    """Cleans text by removing newlines, extra spaces, and non-ASCII characters."""
+    text = re.sub(r'\n', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\x00-\x7F]+', ' ', text)
+    return text.strip().lower()
+
+def extract_relevant_keywords(text, filter_set):
+    """
+    Extracts relevant keywords from text, prioritizing multi-word skills from filter_set.
+    If filter_set is empty, it falls back to filtering out general STOP_WORDS.
+    """
+    cleaned_text = clean_text(text)
+    extracted_keywords = set()
+
+    if filter_set: # If a specific filter_set (like MASTER_SKILLS) is provided
+        # Single linear pass over the text with a prebuilt Aho-Corasick automaton.
+        # Longer phrases win over shorter skills they overlap, and matches respect
+        # word boundaries, like the old longest-first \b...\b regex loop.
+        extracted_keywords = extract_skills(_get_skill_automaton(filter_set), cleaned_text)
+
+    else: # Fallback: if no specific filter_set (MASTER_SKILLS is empty), use the default STOP_WORDS logic
+        all_words = set(re.findall(r'\b\w+\b', cleaned_text))
+        extracted_keywords = {word for word in all_words if word not in STOP_WORDS}
+
+    return extracted_keywords
+
+def extract_email(text):
+    """Extracts an email address from the given text."""
+    match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    return match.group(0) if match else None
+
+def extract_name(text):
+    """
+    Attempts to extract a name from the first few lines of the resume text.
+    This is a heuristic and might not be perfect for all resume formats.
+    """
+    lines = text.strip().split('\n')
+    if not lines:
+        return None
+
+    potential_name_lines = []
+    for line in lines[:3]:
+        line = line.strip()
+        # Refined regex to be more robust for names, avoiding lines with too many non-alpha chars
+        if not re.search(r'[@\d\.\-]', line) and len(line.split()) <= 4 and (line.isupper() or (line and line[0].isupper() and all(word[0].isupper() or not word.isalpha() for word in line.split()))):
+            potential_name_lines.append(line)
+
+    if potential_name_lines:
+        name = max(potential_name_lines, key=len)
+        name = re.sub(r'summary|education|experience|skills|projects|certifications', '', name, flags=re.IGNORECASE).strip()
+        if name:
+            return name.title()
+    return None
+
+# --- Scoring ---
+def semantic_score(resume_text, jd_text, years_exp, model, ml_model):
+    """
+    Calculates a semantic score using an ML model and provides additional details.
+    Falls back to smart_score if the ML model is not loaded or prediction fails.
+    Applies STOP_WORDS filtering for keyword analysis (internally, not for display).
+    """
+    jd_clean = clean_text(jd_text)
+    resume_clean = clean_text(resume_text)
+
+    score = 0.0
+    feedback = "Initial assessment." # This will be overwritten by the generate_concise_ai_suggestion function
+    semantic_similarity = 0.0
+
+    if ml_model is None or model is None:
+        log_system_event("WARNING", "ML_MODELS_NOT_LOADED_FOR_SEMANTIC_SCORE", {"reason": "Falling back to basic score"})
+        # Removed st.warning here as it's handled by load_ml_model
+        # Simplified fallback for score and feedback
+        resume_words = extract_relevant_keywords(resume_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
+        jd_words = extract_relevant_keywords(jd_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
+        
+        overlap_count = len(resume_words.intersection(jd_words))
+        total_jd_words = len(jd_words)
+        
+        basic_score = (overlap_count / total_jd_words) * 70 if total_jd_words > 0 else 0
+        basic_score += min(years_exp * 5, 30) # Add up to 30 for experience
+        score = round(min(basic_score, 100), 2)
+        
+        feedback = "Due to missing ML models, a detailed AI suggestion cannot be provided. Basic score derived from keyword overlap. Manual review is highly recommended."
+        
+        return score, feedback, 0.0 # Return 0 for semantic similarity if ML not available
+
+
+    try:
+        # Same feature builder as train_model.py (see utils/features.py)
+        from utils.features import featurize_pairs
+        pair_features = featurize_pairs([jd_text], [resume_text], model, years_exps=[years_exp])
+        features = pair_features["features"]
+
+        semantic_similarity = cosine_similarity(pair_features["jd_embeddings"], pair_features["resume_embeddings"])[0][0]
+        semantic_similarity = float(np.clip(semantic_similarity, 0, 1))
+        keyword_overlap_count = float(pair_features["keyword_overlaps"][0])
+        jd_keyword_count = float(pair_features["jd_keyword_counts"][0])
+
+        predicted_score = ml_model.predict(features)[0]
+
+        if jd_keyword_count > 0:
+            jd_coverage_percentage = (keyword_overlap_count / jd_keyword_count) * 100
+        else:
+            jd_coverage_percentage = 0.0
+
+        blended_score = (predicted_score * 0.6) + \
+                        (jd_coverage_percentage * 0.1) + \
+                        (semantic_similarity * 100 * 0.3)
+
+        if semantic_similarity > 0.7 and years_exp >= 3:
+            blended_score += 5
+
+        score = float(np.clip(blended_score, 0, 100))
+        
+        # The AI suggestion text will be generated separately for display by generate_concise_ai_suggestion.
+        return round(score, 2), "AI suggestion will be generated...", round(semantic_similarity, 2) # Placeholder feedback
+
+
+    except Exception as e:
+        log_system_event("ERROR", "SEMANTIC_SCORE_CALC_FAILED", {"error": str(e), "traceback": traceback.format_exc()})
+        # Simplified fallback for score and feedback if ML prediction fails
+        # Use the new extraction logic for fallback
+        resume_words = extract_relevant_keywords(resume_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
+        jd_words = extract_relevant_keywords(jd_clean, MASTER_SKILLS if MASTER_SKILLS else STOP_WORDS)
+        
+        overlap_count = len(resume_words.intersection(jd_words))
+        total_jd_words = len(jd_words)
+        
+        basic_score = (overlap_count / total_jd_words) * 70 if total_jd_words > 0 else 0
+        basic_score += min(years_exp * 5, 30) # Add up to 30 for experience
+        score = round(min(basic_score, 100), 2)
+
+        feedback = "Due to an error in core AI model, a detailed AI suggestion cannot be provided. Basic score derived. Manual review is highly recommended."
+
+        return score, feedback, 0.0 # Return 0 for semantic similarity on fallback
+
+
+def semantic_score_batch(resume_texts, jd_text, years_exps, model, ml_model, batch_size=EMBEDDING_BATCH_SIZE, resume_embeddings=None, resume_skill_sets=None, jd_embedding=None, jd_skills=None, computed=None):
+    """
+    Batched counterpart of semantic_score for a whole screening run.
+    Encodes the JD once and all resumes in a single model.encode call, then runs
+    ml_model.predict on the stacked feature matrix. Returns a list of
+    (score, feedback, semantic_similarity) tuples in the same order as resume_texts.
+    Falls back to per-resume semantic_score if the models are missing or batch scoring fails.
+
+    resume_embeddings / resume_skill_sets are optional lists parallel to resume_texts holding
+    precomputed values (e.g. from the resume cache), with None for resumes that still need them.
+    If computed is a dict, computed["resume_embeddings"] / computed["resume_skill_sets"] are set to
+    the completed lists once the batch has been featurized, so the caller can cache them.
+    jd_embedding / jd_skills optionally supply the JD side precomputed (see utils/jd_artifacts.py).
+    """
+    if not resume_texts:
+        return []
+
+    if ml_model is None or model is None:
+        # semantic_score handles the keyword-overlap fallback (and its logging) per resume
+        return [semantic_score(resume_text, jd_text, years_exp, model, ml_model) for resume_text, years_exp in zip(resume_texts, years_exps)]
+
+    try:
+        # Same feature builder as train_model.py (see utils/features.py); the JD is encoded once
+        from utils.features import featurize_pairs
+        pair_features = featurize_pairs(
+            [jd_text] * len(resume_texts), resume_texts, model,
+            years_exps=years_exps,
+            batch_size=batch_size,
+            resume_embeddings=resume_embeddings,
+            resume_skill_sets=resume_skill_sets,
+            jd_embeddings={jd_text: jd_embedding} if jd_embedding is not None else None,
+            jd_skill_sets={jd_text: jd_skills} if jd_skills is not None else None
+        )
+        if computed is not None:
+            computed["resume_embeddings"] = list(pair_features["resume_embeddings"])
+            computed["resume_skill_sets"] = pair_features["resume_skill_sets"]
+
+        # Cosine similarity of each resume with the (shared) JD embedding
+        jd_embed = pair_features["jd_embeddings"][:1]
+        semantic_similarities = cosine_similarity(pair_features["resume_embeddings"], jd_embed)[:, 0]
+        semantic_similarities = np.clip(semantic_similarities, 0, 1)
+        keyword_overlap_counts = pair_features["keyword_overlaps"]
+        years_exp_for_model = pair_features["years"]
+        jd_keyword_count = pair_features["jd_keyword_counts"][0]
+
+        predicted_scores = ml_model.predict(pair_features["features"])
+
+        if jd_keyword_count > 0:
+            jd_coverage_percentages = (keyword_overlap_counts / jd_keyword_count) * 100
+        else:
+            jd_coverage_percentages = np.zeros(len(resume_texts))
+
+        blended_scores = (predicted_scores * 0.6) + \
+                         (jd_coverage_percentages * 0.1) + \
+                         (semantic_similarities * 100 * 0.3)
+        blended_scores = np.where((semantic_similarities > 0.7) & (years_exp_for_model >= 3), blended_scores + 5, blended_scores)
+        scores = np.clip(blended_scores, 0, 100)
+
+        return [
+            (round(float(score), 2), "AI suggestion will be generated...", round(float(similarity), 2))
+            for score, similarity in zip(scores, semantic_similarities)
+        ]
+
+    except Exception as e:
+        log_system_event("ERROR", "SEMANTIC_SCORE_BATCH_FAILED", {"num_resumes": len(resume_texts), "error": str(e), "traceback": traceback.format_exc()})
+        return [semantic_score(resume_text, jd_text, years_exp, model, ml_model) for resume_text, years_exp in zip(resume_texts, years_exps)]
+
+
+TFIDF_MODE_BATCH = "batch"
+TFIDF_MODE_PAIRWISE = "pairwise"
+
+def tfidf_similarity_scores(jd_text, resume_texts, mode=TFIDF_MODE_BATCH, jd_terms=None):
+    """
+    Returns TF-IDF cosine similarities (as percentages, rounded to 2 decimals) between
+    the JD and each resume, in the same order as resume_texts.
+    - "batch": fits one vectorizer over the JD plus every resume, transforms once and
+      scores all resumes with a single sparse matrix-vector product.
+    - "pairwise": legacy behaviour, fits a fresh vectorizer on [jd, resume] per resume.
+    jd_terms optionally supplies the JD's already-analyzed {term: count} (batch mode only),
+    so the JD isn't tokenized again.
+    """
+    if not resume_texts:
+        return []
+
+    if mode == TFIDF_MODE_PAIRWISE:
+        scores = []
+        for resume_text in resume_texts:
+            try:
+                # Add 'stop_words' to TfidfVectorizer for better relevance
+                vectorizer = TfidfVectorizer(stop_words='english')
+                tfidf_matrix = vectorizer.fit_transform([jd_text, resume_text])
+                cosine_sim = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+                scores.append(round(float(cosine_sim) * 100, 2))
+            except Exception as e:
+                scores.append(0.0) # Default to 0 if vectorization fails
+                log_system_event("ERROR", "TFIDF_COSINE_SIM_FAILED", {"mode": mode, "error": str(e), "traceback": traceback.format_exc()})
+        return scores
+
+    try:
+        if jd_terms is not None:
+            # Feed pre-tokenized documents so the stored JD terms can be used as-is
+            analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+            jd_tokens = [term for term, count in jd_terms.items() for _ in range(count)]
+            vectorizer = TfidfVectorizer(analyzer=lambda tokens: tokens)
+            tfidf_matrix = vectorizer.fit_transform([jd_tokens] + [analyzer(resume_text) for resume_text in resume_texts])
+        else:
+            vectorizer = TfidfVectorizer(stop_words='english')
+            tfidf_matrix = vectorizer.fit_transform([jd_text] + list(resume_texts))
+        # Rows are L2-normalised by the vectorizer, so the dot product is the cosine similarity
+        cosine_sims = (tfidf_matrix[1:] @ tfidf_matrix[0].T).toarray().ravel()
+        return [round(float(cosine_sim) * 100, 2) for cosine_sim in cosine_sims]
+    except Exception as e:
+        log_system_event("ERROR", "TFIDF_COSINE_SIM_FAILED", {"mode": mode, "num_resumes": len(resume_texts), "error": str(e), "traceback": traceback.format_exc()})
+        return [0.0] * len(resume_texts)
@@ -0,0 +1,195 @@
+import re
+from datetime import datetime
+
+from utils.features import FEATURE_FINGERPRINT
+from utils.logger import log_system_event
+from utils.pdf_extraction import extract_texts_parallel, DEFAULT_MAX_WORKERS
+from utils.resume_cache import pdf_hash, get_cached_resume, cache_resume, enforce_cache_limit
+from utils.scoring import (
+    EMBEDDING_CACHE_KEY, EMBEDDING_BATCH_SIZE, TFIDF_MODE_BATCH,
+    extract_email, extract_contact_info, extract_years_of_experience,
+    semantic_score_batch, tfidf_similarity_scores
+)
+
+# End-to-end screening of a batch of resume PDFs against one JD, shared by the
+# Streamlit screener page and the headless batch CLI so both produce identical scores.
+
+
+def guess_candidate_name(resume_text, file_name):
+    """Takes the leading name-like text of the resume, falling back to a name derived from the file name."""
+    # Improved candidate name extraction: look for common patterns at the beginning
+    candidate_name_match = re.match(r'^(?:Mr\.|Ms\.|Dr\.)?\s*([A-Za-z\s.-]{2,})', resume_text.strip())
+    if candidate_name_match:
+        return candidate_name_match.group(1).strip()
+    return file_name.replace(".pdf", "").replace("_", " ").title()
+
+
+def predict_status(similarity_score_percent, years_experience, min_experience, cutoff_score, required_skills, missing_skills):
+    """Determines the predicted shortlisting status based on the screening criteria."""
+    predicted_status = "Rejected"
+    if similarity_score_percent >= cutoff_score and years_experience >= min_experience:
+        predicted_status = "Shortlisted"
+    elif years_experience < min_experience:
+        predicted_status = "Rejected (Experience)"
+    elif similarity_score_percent < cutoff_score:
+        predicted_status = "Rejected (Score)"
+
+    # Refine prediction based on major skill gaps
+    if predicted_status == "Shortlisted" and len(required_skills) > 0 and len(missing_skills) > len(required_skills) / 2: # If too many skills are missing
+        predicted_status = "Rejected (Major Skill Gap)"
+    return predicted_status
+
+
+def match_level(similarity_score_percent):
+    """Buckets a similarity score into High / Medium / Low."""
+    if similarity_score_percent >= 80:
+        return "High"
+    elif similarity_score_percent >= 60:
+        return "Medium"
+    return "Low"
+
+
+def screen_resumes(pdf_files, jd_text, required_skills, min_experience, cutoff_score, model, ml_model,
+                   tfidf_mode=TFIDF_MODE_BATCH, use_cache=True, max_workers=DEFAULT_MAX_WORKERS,
+                   batch_size=EMBEDDING_BATCH_SIZE, progress_callback=None, jd_artifact=None):
+    """
+    Screens a batch of resume PDFs against a job description.
+
+    pdf_files is a list of (file_name, pdf_bytes) tuples; required_skills are lowercase strings.
+    progress_callback, if given, is called as progress_callback(stage, done, total) with stage one of
+    "extracting", "parsing" or "scoring".
+    jd_artifact, if given, is a stored JD artifact (utils/jd_artifacts.py) whose precomputed
+    embedding, skills and TF-IDF terms are used instead of recomputing them from jd_text.
+
+    Returns (screened, failures):
+    - screened: one dict per successfully parsed resume, in upload order, with keys
+      resume_name, resume_text, candidate_name, email, phone, years_experience, matched_skills,
+      missing_skills, similarity_score_percent, predicted_status, match_level, semantic_score,
+      semantic_similarity
+    - failures: {"file_name", "error"} dicts for PDFs that could not be parsed
+    """
+    def report(stage, done, total):
+        if progress_callback is not None:
+            progress_callback(stage, done, total)
+
+    # Look every PDF up in the content-addressed cache first; only misses get parsed
+    pdf_digests = [pdf_hash(pdf_bytes) for _, pdf_bytes in pdf_files]
+    cached_entries = [(get_cached_resume(digest) or {}) if use_cache else {} for digest in pdf_digests]
+    uncached_indices = [i for i, entry in enumerate(cached_entries) if entry.get("text") is None]
+    log_system_event("INFO", "RESUME_CACHE_LOOKUP", {"num_resumes": len(pdf_files), "num_hits": len(pdf_files) - len(uncached_indices)})
+
+    # Extract text from all uncached PDFs concurrently; results come back in upload order
+    extraction_results = [{"file_name": name, "text": entry.get("text"), "error": None} for (name, _), entry in zip(pdf_files, cached_entries)]
+    if uncached_indices:
+        report("extracting", 0, len(uncached_indices))
+        for i, extraction in zip(uncached_indices, extract_texts_parallel([pdf_files[i] for i in uncached_indices], max_workers=max_workers)):
+            extraction_results[i] = extraction
+        report("extracting", len(uncached_indices), len(uncached_indices))
+
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    screened = []
+    failures = []
+    for i, extraction in enumerate(extraction_results):
+        report("parsing", i + 1, len(extraction_results))
+        if extraction["error"] is not None:
+            failures.append({"file_name": extraction["file_name"], "error": extraction["error"]})
+            continue
+        resume_text = extraction["text"]
+        cached_entry = cached_entries[i]
+
+        if "email" in cached_entry and "phone" in cached_entry:
+            email, phone = cached_entry["email"], cached_entry["phone"]
+        else:
+            email = extract_email(resume_text)
+            phone = extract_contact_info(resume_text)[1] # Get phone from tuple
+        # "Present" date ranges grow over time, so cached experience is only reused on the day it was computed
+        if cached_entry.get("years_experience_date") == today_str:
+            years_experience = cached_entry["years_experience"]
+        else:
+            years_experience = extract_years_of_experience(resume_text)
+
+        # Cached skills were extracted under some skill filter; reuse them only if that's still the active one
+        cached_skills = cached_entry.get("skills") if cached_entry.get("skills_fingerprint") == FEATURE_FINGERPRINT else None
+
+        # Skill Matching
+        resume_text_lower = resume_text.lower()
+        matched_skills = [skill for skill in required_skills if skill in resume_text_lower]
+        missing_skills = [skill for skill in required_skills if skill not in resume_text_lower]
+
+        screened.append({
+            "digest": pdf_digests[i],
+            "cache_complete": all(key in cached_entry for key in ("text", "email", "phone")) and cached_skills is not None and cached_entry.get("years_experience_date") == today_str and EMBEDDING_CACHE_KEY in cached_entry.get("embeddings", {}),
+            "cached_embedding": cached_entry.get("embeddings", {}).get(EMBEDDING_CACHE_KEY),
+            "cached_skills": cached_skills,
+            "resume_name": extraction["file_name"],
+            "resume_text": resume_text,
+            "candidate_name": guess_candidate_name(resume_text, extraction["file_name"]),
+            "email": email,
+            "phone": phone,
+            "years_experience": years_experience,
+            "matched_skills": matched_skills,
+            "missing_skills": missing_skills
+        })
+
+    report("scoring", 0, len(screened))
+
+    # Similarity Score (Cosine Similarity with TF-IDF), computed for the whole batch at once
+    similarity_scores = tfidf_similarity_scores(
+        jd_text.lower(),
+        [parsed["resume_text"].lower() for parsed in screened],
+        mode=tfidf_mode,
+        jd_terms=jd_artifact.get("tfidf_terms") if jd_artifact else None
+    )
+
+    # Semantic scoring for the whole batch: the JD is embedded once and all resumes in one encode call
+    resume_embeddings = [parsed.pop("cached_embedding") for parsed in screened]
+    resume_skill_sets = [set(skills) if skills is not None else None for skills in (parsed.pop("cached_skills") for parsed in screened)]
+    computed = {}
+    semantic_results = semantic_score_batch(
+        [parsed["resume_text"] for parsed in screened],
+        jd_text,
+        [parsed["years_experience"] for parsed in screened],
+        model,
+        ml_model,
+        batch_size=batch_size,
+        resume_embeddings=resume_embeddings,
+        resume_skill_sets=resume_skill_sets,
+        jd_embedding=jd_artifact.get("embeddings", {}).get(EMBEDDING_CACHE_KEY) if jd_artifact else None,
+        jd_skills=jd_artifact.get("skills") if jd_artifact else None,
+        computed=computed
+    )
+    resume_embeddings = computed.get("resume_embeddings", resume_embeddings)
+    resume_skill_sets = computed.get("resume_skill_sets", resume_skill_sets)
+
+    for parsed, similarity_score_percent, (semantic_score_value, _, semantic_similarity) in zip(screened, similarity_scores, semantic_results):
+        parsed["similarity_score_percent"] = similarity_score_percent
+        parsed["predicted_status"] = predict_status(similarity_score_percent, parsed["years_experience"], min_experience, cutoff_score, required_skills, parsed["missing_skills"])
+        parsed["match_level"] = match_level(similarity_score_percent)
+        parsed["semantic_score"] = semantic_score_value
+        parsed["semantic_similarity"] = semantic_similarity
+
+    report("scoring", len(screened), len(screened))
+
+    # Write everything computed for this batch back to the resume cache
+    if use_cache:
+        for parsed, embedding, skill_set in zip(screened, resume_embeddings, resume_skill_sets):
+            if parsed["cache_complete"]:
+                continue
+            cache_fields = {
+                "text": parsed["resume_text"],
+                "years_experience": parsed["years_experience"],
+                "years_experience_date": today_str,
+                "email": parsed["email"],
+                "phone": parsed["phone"]
+            }
+            if skill_set is not None:
+                cache_fields["skills"] = sorted(skill_set)
+                cache_fields["skills_fingerprint"] = FEATURE_FINGERPRINT
+            if embedding is not None:
+                cache_fields["embeddings"] = {EMBEDDING_CACHE_KEY: [float(x) for x in embedding]}
+            cache_resume(parsed["digest"], cache_fields)
+        enforce_cache_limit()
+
+    for parsed in screened:
+        del parsed["digest"], parsed["cache_complete"]
+    return screened, failures
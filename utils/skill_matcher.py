@@ -0,0 +1,99 @@
+from collections import deque
+
+# Aho-Corasick automaton for extracting every known skill phrase from a text in one pass.
+# The automaton is a plain dict so it can be built once at import time and shared:
+#   {"goto": [dict char -> state], "fail": [state], "output": [list of pattern lengths], "patterns": {...}}
+
+
+def _is_word_char(char):
+    """Mirrors the regex \\w class used by the previous per-skill \\b...\\b patterns."""
+    return char is not None and (char.isalnum() or char == '_')
+
+
+def build_skill_automaton(skills):
+    """
+    Compiles an Aho-Corasick automaton from an iterable of skill phrases.
+    Skills are matched case-insensitively (the automaton stores them lowercased).
+    """
+    goto = [{}]
+    output = [[]]
+    patterns = set()
+
+    for skill in skills:
+        phrase = skill.lower().strip()
+        if not phrase or phrase in patterns:
+            continue
+        patterns.add(phrase)
+        state = 0
+        for char in phrase:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                output.append([])
+            state = next_state
+        output[state].append(len(phrase))
+
+    # Breadth-first pass to compute failure links; each state inherits the
+    # outputs of its failure state so matching never has to walk the chain.
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(char, 0)
+            output[next_state] = output[next_state] + output[fail[next_state]]
+
+    return {"goto": goto, "fail": fail, "output": output, "patterns": patterns}
+
+
+def find_skill_spans(automaton, text):
+    """
+    Returns (start, end) spans of every skill occurrence in `text` that sits on word
+    boundaries, exactly as r'\\b' + re.escape(skill) + r'\\b' would require.
+    `text` is expected to be lowercase already (see clean_text).
+    """
+    goto, fail, output = automaton["goto"], automaton["fail"], automaton["output"]
+    spans = []
+    state = 0
+    text_length = len(text)
+    for end_index, char in enumerate(text):
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        if not output[state]:
+            continue
+        next_char = text[end_index + 1] if end_index + 1 < text_length else None
+        if _is_word_char(char) == _is_word_char(next_char):
+            continue # No word boundary after the match
+        for length in output[state]:
+            start = end_index - length + 1
+            prev_char = text[start - 1] if start > 0 else None
+            if _is_word_char(prev_char) != _is_word_char(text[start]):
+                spans.append((start, end_index + 1))
+    return spans
+
+
+def extract_skills(automaton, text):
+    """
+    Returns the set of skills found in `text`, preferring longer phrases: once a
+    phrase is matched, shorter skills overlapping it are not reported for that
+    occurrence (e.g. "machine learning" does not also yield "learning").
+    """
+    spans = find_skill_spans(automaton, text)
+    # Longest matches claim their characters first, mirroring the old
+    # longest-first match-and-blank-out loop
+    spans.sort(key=lambda span: (span[0] - span[1], span[0]))
+    claimed = bytearray(len(text))
+    skills = set()
+    for start, end in spans:
+        if any(claimed[start:end]):
+            continue
+        claimed[start:end] = b'\x01' * (end - start)
+        skills.add(text[start:end])
+    return skills
@@ -0,0 +1,91 @@
+import csv
+import json
+import math
+import os
+
+# Labeled (JD, resume, relevance score) pairs for train_model.py, read from a file and streamed in
+# chunks, so a large export (e.g. from the ATS) never has all of its raw text in memory at once.
+# The format follows the file extension:
+#   .jsonl   - one {"jd_text": ..., "resume_text": ..., "relevance_score": ...} object per line
+#   .csv     - a header row naming those three columns (extra columns are ignored)
+#   .parquet - those three columns; read in record batches with pyarrow
+# Rows with a missing/empty text or a non-numeric score are skipped and counted.
+TRAINING_DATA_FILE = os.path.join("data", "training", "synthetic_relevance.jsonl")
+TRAINING_DATA_COLUMNS = ("jd_text", "resume_text", "relevance_score")
+DEFAULT_CHUNK_SIZE = 2048
+
+# Resume texts easily exceed the csv module's default 128 KB field limit
+CSV_FIELD_SIZE_LIMIT = 16 * 1024 * 1024
+
+
+def _normalize_record(record):
+    """Returns {"jd_text", "resume_text", "relevance_score" (float)} or None if the row is unusable."""
+    try:
+        jd_text, resume_text, score = (record[column] for column in TRAINING_DATA_COLUMNS)
+        score = float(score)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not isinstance(jd_text, str) or not isinstance(resume_text, str) or not jd_text.strip() or not resume_text.strip():
+        return None
+    if math.isnan(score) or math.isinf(score):
+        return None
+    return {"jd_text": jd_text, "resume_text": resume_text, "relevance_score": score}
+
+
+def _iter_jsonl(path, chunk_size):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+
+
+def _iter_csv(path, chunk_size):
+    csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def _iter_parquet(path, chunk_size):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Reading Parquet training data needs pyarrow (pip install pyarrow)") from e
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=list(TRAINING_DATA_COLUMNS)):
+        yield from batch.to_pylist()
+
+
+_READERS = {".jsonl": _iter_jsonl, ".csv": _iter_csv, ".parquet": _iter_parquet}
+
+
+def iter_training_records(path, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """
+    Yields the valid records of a training file one at a time. If given, stats["rows"] and
+    stats["skipped"] are incremented as rows are read.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _READERS:
+        raise ValueError(f"Unsupported training data format '{extension}' (expected one of {', '.join(sorted(_READERS))})")
+    for raw_record in _READERS[extension](path, chunk_size):
+        record = _normalize_record(raw_record) if isinstance(raw_record, dict) else None
+        if stats is not None:
+            stats["rows"] = stats.get("rows", 0) + 1
+            if record is None:
+                stats["skipped"] = stats.get("skipped", 0) + 1
+        if record is not None:
+            yield record
+
+
+def iter_training_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """Yields lists of up to chunk_size valid records from a training file (see iter_training_records)."""
+    chunk = []
+    for record in iter_training_records(path, chunk_size, stats):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
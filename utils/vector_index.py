@@ -0,0 +1,207 @@
+import os
+import threading
+import traceback
+
+import numpy as np
+
+from utils.file_lock import file_lock
+from utils.logger import log_system_event
+
+# Persisted approximate-nearest-neighbour index over resume embeddings, for semantic search.
+#
+# IVF (inverted file) layout: vectors are L2-normalised float32, grouped into sqrt(n) clusters by
+# spherical k-means. A query is compared against the cluster centroids first and only the vectors in
+# the IVF_NPROBE closest clusters are scored exactly, so search cost grows with ~sqrt(n) instead of n.
+# Below IVF_MIN_VECTORS the index stays flat (exact brute force), which is already fast at that size.
+#
+# Stored in data/resume_vectors.npz: doc_ids, vectors, centroids, assignments and the encoder key the
+# vectors were produced with (vectors from a different encoder backend are never mixed; the index is
+# rebuilt instead). New vectors are assigned to the nearest existing centroid; the clustering is
+# retrained once the index has grown by IVF_RETRAIN_GROWTH since it was last trained.
+# Updates hold file_lock(VECTOR_INDEX_FILE) and start from the file on disk, so concurrent processes
+# adding vectors never overwrite each other's additions.
+VECTOR_INDEX_FILE = os.path.join("data", "resume_vectors.npz")
+IVF_MIN_VECTORS = 2000
+IVF_NPROBE = 8
+IVF_KMEANS_ITERATIONS = 10
+IVF_RETRAIN_GROWTH = 2.0
+
+_vector_index = None
+_vector_index_stat = None
+_vector_index_lock = threading.Lock()
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.clip(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12, None)
+
+
+def _empty_vector_index(encoder_key, dim=384):
+    return {
+        "encoder_key": encoder_key,
+        "doc_ids": np.array([], dtype=object),
+        "vectors": np.zeros((0, dim), dtype=np.float32),
+        "centroids": np.zeros((0, dim), dtype=np.float32),
+        "assignments": np.zeros(0, dtype=np.int32),
+        "list_rows": np.zeros(0, dtype=np.int64),
+        "list_offsets": np.zeros(1, dtype=np.int64),
+        "trained_size": 0,
+        "row_by_doc_id": {}
+    }
+
+
+def _build_inverted_lists(index):
+    """Groups the rows by assigned cluster: rows of cluster c are list_rows[list_offsets[c]:list_offsets[c + 1]]."""
+    assignments = index["assignments"]
+    index["list_rows"] = np.argsort(assignments, kind="stable").astype(np.int64)
+    index["list_offsets"] = np.searchsorted(assignments[index["list_rows"]], np.arange(len(index["centroids"]) + 1)).astype(np.int64)
+
+
+def _train_centroids(vectors, seed=0):
+    """Spherical k-means with sqrt(n) clusters; returns (centroids, assignments)."""
+    num_clusters = max(1, int(np.sqrt(len(vectors))))
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), num_clusters, replace=False)].copy()
+    for _ in range(IVF_KMEANS_ITERATIONS):
+        assignments = np.argmax(vectors @ centroids.T, axis=1).astype(np.int32)
+        for cluster in range(num_clusters):
+            members = vectors[assignments == cluster]
+            if len(members):
+                centroids[cluster] = members.sum(axis=0)
+            else: # Re-seed empty clusters with a random vector
+                centroids[cluster] = vectors[rng.integers(len(vectors))]
+        centroids = _normalize(centroids)
+    assignments = np.argmax(vectors @ centroids.T, axis=1).astype(np.int32)
+    return centroids, assignments
+
+
+def _index_file_stat():
+    """(inode, mtime_ns, size) of the index file, or None; every save replaces the file, so any change shows up here."""
+    try:
+        stat = os.stat(VECTOR_INDEX_FILE)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _save_vector_index(index):
+    os.makedirs(os.path.dirname(VECTOR_INDEX_FILE), exist_ok=True)
+    tmp_path = f"{VECTOR_INDEX_FILE}.{os.getpid()}.tmp.npz"
+    np.savez(
+        tmp_path,
+        encoder_key=np.array(index["encoder_key"]),
+        doc_ids=index["doc_ids"].astype(str),
+        vectors=index["vectors"],
+        centroids=index["centroids"],
+        assignments=index["assignments"],
+        list_rows=index["list_rows"],
+        list_offsets=index["list_offsets"],
+        trained_size=np.array(index["trained_size"])
+    )
+    os.replace(tmp_path, VECTOR_INDEX_FILE)
+    return _index_file_stat()
+
+
+def get_vector_index(encoder_key):
+    """Returns the in-memory vector index for encoder_key, loading it from disk when it changed."""
+    global _vector_index, _vector_index_stat
+    stat = _index_file_stat()
+    with _vector_index_lock:
+        if _vector_index is None or stat != _vector_index_stat:
+            index = None
+            if stat is not None:
+                try:
+                    with np.load(VECTOR_INDEX_FILE, allow_pickle=False) as data:
+                        index = {
+                            "encoder_key": str(data["encoder_key"]),
+                            "doc_ids": data["doc_ids"].astype(object),
+                            "vectors": data["vectors"],
+                            "centroids": data["centroids"],
+                            "assignments": data["assignments"],
+                            "trained_size": int(data["trained_size"])
+                        }
+                        if "list_rows" in data.files:
+                            index["list_rows"], index["list_offsets"] = data["list_rows"], data["list_offsets"]
+                        else: # Saved before inverted lists were stored
+                            _build_inverted_lists(index)
+                    index["row_by_doc_id"] = {doc_id: row for row, doc_id in enumerate(index["doc_ids"].tolist())}
+                except Exception as e:
+                    index = None
+                    log_system_event("ERROR", "VECTOR_INDEX_LOAD_FAILED", {"error": str(e), "traceback": traceback.format_exc()})
+            _vector_index, _vector_index_stat = index, stat
+        if _vector_index is None or _vector_index["encoder_key"] != encoder_key:
+            _vector_index = _empty_vector_index(encoder_key)
+        return _vector_index
+
+
+def add_vectors(doc_ids, vectors, encoder_key):
+    """Adds embeddings for doc_ids not yet in the index, (re)training the IVF clustering when due, and saves it."""
+    with file_lock(VECTOR_INDEX_FILE):
+        # Re-read under the lock: another process may have saved since this one last loaded the index
+        index = get_vector_index(encoder_key)
+        num_added = _add_to_index(index, doc_ids, vectors)
+    if num_added:
+        log_system_event("INFO", "VECTOR_INDEX_UPDATED", {"num_added": num_added, "num_vectors": len(index["vectors"]), "num_clusters": len(index["centroids"])})
+    return num_added
+
+
+def _add_to_index(index, doc_ids, vectors):
+    """Appends the new doc_ids' vectors to index and saves it; returns the number added. Called with the file lock held."""
+    global _vector_index_stat
+    with _vector_index_lock:
+        row_by_doc_id = index["row_by_doc_id"]
+        new_rows = []
+        for i, doc_id in enumerate(doc_ids):
+            if doc_id not in row_by_doc_id:
+                row_by_doc_id[doc_id] = len(row_by_doc_id)
+                new_rows.append(i)
+        if not new_rows:
+            return 0
+        new_vectors = _normalize([vectors[i] for i in new_rows])
+        index["doc_ids"] = np.concatenate([index["doc_ids"], np.array([doc_ids[i] for i in new_rows], dtype=object)])
+        index["vectors"] = np.vstack([index["vectors"], new_vectors])
+
+        num_vectors = len(index["vectors"])
+        if num_vectors >= IVF_MIN_VECTORS and (not index["trained_size"] or num_vectors >= IVF_RETRAIN_GROWTH * index["trained_size"]):
+            index["centroids"], index["assignments"] = _train_centroids(index["vectors"])
+            index["trained_size"] = num_vectors
+            _build_inverted_lists(index)
+        elif index["trained_size"]:
+            new_assignments = np.argmax(new_vectors @ index["centroids"].T, axis=1).astype(np.int32)
+            index["assignments"] = np.concatenate([index["assignments"], new_assignments])
+            _build_inverted_lists(index)
+
+        try:
+            _vector_index_stat = _save_vector_index(index)
+        except OSError as e:
+            log_system_event("ERROR", "VECTOR_INDEX_SAVE_FAILED", {"error": str(e)})
+    return len(new_rows)
+
+
+def search_vectors(index, query_vector, top_k=50, doc_ids=None, nprobe=IVF_NPROBE):
+    """
+    Returns [(doc_id, cosine_similarity), ...] for the top_k nearest resumes, best first,
+    optionally restricted to the doc_ids set. Searches nprobe IVF clusters once trained, else all vectors.
+    """
+    if not len(index["vectors"]):
+        return []
+    query = _normalize(query_vector)
+    if doc_ids is not None:
+        # Scoped searches are small, so their rows are looked up directly and scored exactly
+        row_by_doc_id = index["row_by_doc_id"]
+        candidates = np.array(sorted(row_by_doc_id[doc_id] for doc_id in doc_ids if doc_id in row_by_doc_id), dtype=np.int64)
+    elif index["trained_size"]:
+        # Only the inverted lists of the nprobe nearest clusters are read
+        probe = np.argsort(-(index["centroids"] @ query))[:nprobe]
+        offsets = index["list_offsets"]
+        candidates = np.concatenate([index["list_rows"][offsets[cluster]:offsets[cluster + 1]] for cluster in probe])
+    else:
+        candidates = np.arange(len(index["vectors"]))
+    if not len(candidates):
+        return []
+
+    similarities = index["vectors"][candidates] @ query
+    top_k = min(top_k, len(candidates))
+    top = np.argpartition(-similarities, top_k - 1)[:top_k]
+    top = top[np.argsort(-similarities[top])]
+    return [(index["doc_ids"][candidates[i]], float(similarities[i])) for i in top]